@@ -11,8 +11,8 @@ import streamlit as st
 sys.path.insert(0, os.path.dirname(__file__))
 
 from src.core.config import settings
-from src.services.career_services import run_career_analysis
-from src.utils.parser import safe_json_parse
+from src.graph.checkpoint import RunInputMismatch
+from src.services.career_services import stream_career_analysis
 
 
 # ═══════════════════════════════════════════════════════════
@@ -67,6 +67,12 @@ with st.sidebar:
         value=settings.rapidapi_ok,
         disabled=True,
     )
+    use_llm_cache = st.checkbox(
+        "♻️ Reuse cached LLM responses",
+        value=bool(settings.LLM_CACHE_PATH),
+        disabled=not settings.LLM_CACHE_PATH,
+        help="Aynı CV + aynı hedef rol tekrar analiz edilirse LLM çağrıları cache'ten gelir.",
+    )
 
 
 # ═══════════════════════════════════════════════════════════
@@ -132,68 +138,85 @@ if analyze_btn:
         st.error("⚠️ Please upload a CV first!")
         st.stop()
     
-    if not settings.openai_ok:
+    if not settings.llm_ok:
         st.error("❌ OpenAI API key not configured. Check .env file.")
         st.stop()
     
-    # Save uploaded file temporarily
-    import tempfile
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp:
-        tmp.write(uploaded_file.read())
-        tmp_path = tmp.name
+    # Aynı girdilerle başarısız olmuş run varsa checkpoint'ten devam et
+    # (tamamlanan agent'lar tekrar çalışmaz; CHECKPOINT_PATH boşsa resume yok)
+    resumable = bool(settings.CHECKPOINT_PATH)
+    run_key = (uploaded_file.name, uploaded_file.size, target_role, target_location)
+    failed_run = st.session_state.get("failed_run") if resumable else None
+    run_id = failed_run["run_id"] if failed_run and failed_run["key"] == run_key else None
+    if run_id:
+        st.info(f"♻️ Resuming previous run `{run_id}` from its last completed step")
     
     # Run analysis with progress
     progress_bar = st.progress(0, text="Starting analysis...")
     
     try:
-        progress_bar.progress(10, text="📄 Parsing CV...")
+        progress_bar.progress(5, text="📄 Parsing CV...")
         
-        cv_data, final_state = run_career_analysis(
-            cv_file_path=tmp_path,
+        # Her node bitince event gelir → progress bar + ara sonuçlar canlı güncellenir
+        live_status = st.empty()
+        progress = 5
+        for event in stream_career_analysis(
+            cv_file_path=None,
             cv_file_type=uploaded_file.name.split('.')[-1],
             target_role=target_role,
             target_location=target_location,
-        )
+            cv_bytes=uploaded_file.getvalue(),
+            use_llm_cache=use_llm_cache,
+            run_id=run_id,
+        ):
+            if event["event"] == "parsed":
+                run_id = event["data"]["run_id"]
+                progress = 10
+                progress_bar.progress(progress, text="🤖 Running agents...")
+            elif event["event"] == "node":
+                step = event["data"]
+                progress = max(progress, step["progress"])    # retry geri sarmasın
+                progress_bar.progress(progress, text=step["message"])
+                if step["node"] == "cv_analyzer" and step["partial"]["ats_score"] is not None:
+                    live_status.info(f"📊 Initial ATS score: {step['partial']['ats_score']}/100 — optimizing...")
+            elif event["event"] == "complete":
+                cv_data, final_state = event["cv_data"], event["final_state"]
         
+        live_status.empty()
         progress_bar.progress(100, text="✅ Analysis complete!")
         
         # Clean up
         import time
         time.sleep(0.5)
         progress_bar.empty()
-        os.unlink(tmp_path)
+        st.session_state.pop("failed_run", None)
         
     except Exception as e:
         progress_bar.empty()
-        st.error(f"❌ Analysis failed: {e}")
+        if resumable and run_id and not isinstance(e, RunInputMismatch):
+            st.session_state["failed_run"] = {"key": run_key, "run_id": run_id}
+        else:
+            # Aynı ad / boyutta farklı CV → eski run'a takılı kalma, sonraki deneme yeni run
+            st.session_state.pop("failed_run", None)
+            run_id = None
+        st.error(f"❌ Analysis failed: {e}" + ("\n\nClick **Analyze CV** again to resume." if run_id else ""))
         import traceback
         st.code(traceback.format_exc())
         st.stop()
     
     st.success("✅ Analysis complete!")
     
-    # Parse outputs
-    analyzer_data = safe_json_parse(final_state["analyzer_output"])
-    critic_data   = safe_json_parse(final_state["critic_output"])
-    optimizer_data = safe_json_parse(final_state["optimizer_output"])
+    # Outputs (node'larda parse edildi, state'te dict)
+    analyzer_data  = final_state["analyzer_output"]
+    critic_data    = final_state["critic_output"]
+    optimizer_data = final_state["optimizer_output"]
     
-    # Job data - SAFE PARSE
-    try:
-        if final_state.get("job_hunter_output"):
-            job_data = safe_json_parse(final_state["job_hunter_output"])
-        else:
-            job_data = {
-                "job_recommendations": [],
-                "search_summary": "Job search not completed",
-                "total_jobs_found": 0
-            }
-    except Exception as e:
-        st.warning(f"⚠️ Job search failed: {e}")
-        job_data = {
-            "job_recommendations": [],
-            "search_summary": "Job search failed",
-            "total_jobs_found": 0
-        }
+    # Job data
+    job_data = final_state.get("job_hunter_output") or {
+        "job_recommendations": [],
+        "search_summary": "Job search not completed",
+        "total_jobs_found": 0
+    }
     
     # ═══════════════════════════════════════════════════════════
     #  RESULTS
@@ -363,17 +386,23 @@ if analyze_btn:
         st.divider()
         
         # Agent trace log
+        from src.graph.messages import total_tokens
+
+        tokens = total_tokens(final_state['trace_log'])
         st.markdown("### 📋 Quick Summary")
         st.markdown(f"""
         - **Retry Count:** {final_state['retry_count']}
         - **Critic Approved:** {'✅ Yes' if final_state['approved'] else '❌ No (max retry)'}
         - **Total Steps:** {len(final_state['trace_log'])}
+        - **LLM Tokens:** {tokens['input']} in ({tokens['cached']} cached) / {tokens['output']} out — {tokens['calls']} calls
         """)
         
         for entry in final_state['trace_log']:
             agent = entry.get('agent', '?')
             step = entry.get('step', '?')
-            st.markdown(f"- **[{agent}]** `{step}`")
+            usage = entry.get('tokens')
+            suffix = f" — {usage['input']} in / {usage['cached']} cached / {usage['output']} out" if usage else ""
+            st.markdown(f"- **[{agent}]** `{step}`{suffix}")
     
     # ─── TAB 5: SUMMARY ─────────────────────────────────
     with tab5:
@@ -4,73 +4,551 @@ cv_parser.py
 PDF, DOCX, TXT dosyalarından CV parse eder.
 """
 
-import PyPDF2
-import docx
+import io
 import re
-from typing import Dict
+import zipfile
+import atexit
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from itertools import accumulate
+from xml.etree import ElementTree
+from typing import TYPE_CHECKING, BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import logging
 
-from src.core.constants import MAX_CV_CHARS
+from src.core.config import settings
+from src.core.metrics import CV_PARSE_ERRORS, CV_PARSE_SECONDS, timed
+from src.core.constants import (
+    MAX_CV_CHARS,
+    PDF_MIN_ALPHA_RATIO,
+    PDF_PAGES_PER_CHUNK,
+    PDF_PARALLEL_MIN_PAGES,
+)
+from src.services.parse_cache import ParseCache, parse_cache
+
+if TYPE_CHECKING:
+    import PyPDF2
 
 logger = logging.getLogger(__name__)
 
+# Parser çıktısını değiştiren her değişiklikte artır → eski cache kayıtları geçersiz olur
+PARSER_VERSION = "3"
+
 
-def parse_cv(file_path: str, file_type: str) -> Dict[str, str]:
+def parse_cv(
+    file_path: str,
+    file_type: str,
+    parallel: bool = False,
+    use_cache: bool = True,
+) -> Dict[str, str]:
     """
     CV dosyasını parse eder ve text çıkarır.
     
+    Dosya bir kez okunur; asıl iş `parse_cv_bytes`'ta yapılır.
+
     Args:
         file_path: Dosya yolu
         file_type: 'pdf' | 'docx' | 'txt'
+        parallel:  PDF sayfalarını process pool'da extract et
+                   (PDF_PARALLEL_MIN_PAGES altındaki dosyalarda serial kalır)
+        use_cache: Aynı içerik daha önce parse edildiyse cache'ten dön
     
     Returns:
         {
             "raw_text": "Tüm CV text",
-            "char_count": 1234
+            "char_count": 1234,
+            "pages_skipped": 0,    # Budget dolunca okunmayan PDF sayfaları
+            "backend": "pypdf2"    # Text'i üreten parser (PDF backend veya file type)
         }
     """
-    if file_type == "pdf":
-        raw_text = _parse_pdf(file_path)
-    elif file_type in ["docx", "doc"]:
-        raw_text = _parse_docx(file_path)
-    elif file_type == "txt":
-        raw_text = _parse_txt(file_path)
-    else:
-        raise ValueError(f"Unsupported file type: {file_type}")
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    return parse_cv_bytes(data, file_type, parallel=parallel, use_cache=use_cache)
+
+
+def parse_cv_bytes(
+    data: Union[bytes, bytearray, memoryview, BinaryIO],
+    file_type: str,
+    parallel: bool = False,
+    use_cache: bool = True,
+) -> Dict[str, str]:
+    """
+    Bellekteki CV içeriğini parse eder — upload'lar temp dosyaya yazılmaz.
+
+    Args:
+        data:      Dosya içeriği (bytes / bytearray / memoryview — kopyalanmaz)
+                   veya okunabilir binary stream (BytesIO, UploadFile.file, ...)
+        file_type: 'pdf' | 'docx' | 'txt'
+
+    Returns:
+        parse_cv ile aynı dict.
+    """
+    if hasattr(data, "read"):
+        data = data.read()
+    # Buffer olduğu gibi kullanılır: hashlib / io.BytesIO / str() hepsi buffer kabul eder
+
+    cache_key = None
+    if use_cache:
+        cache_key = ParseCache.make_key(data, f"{PARSER_VERSION}:{file_type}:{MAX_CV_CHARS}")
+        cached = parse_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"✅ CV parse cache hit: {cache_key[:12]}")
+            return cached
+
+    pages_skipped = 0
+    backend = file_type
+
+    with timed(CV_PARSE_SECONDS, CV_PARSE_ERRORS, file_type=file_type):
+        if file_type == "pdf":
+            raw_text, pages_skipped, backend = _parse_pdf(data, MAX_CV_CHARS, parallel=parallel)
+        elif file_type in ["docx", "doc"]:
+            raw_text = _parse_docx(data, MAX_CV_CHARS)
+        elif file_type == "txt":
+            raw_text = _parse_txt(data)
+        else:
+            raise ValueError(f"Unsupported file type: {file_type}")
     
     # Truncate if too long
     if len(raw_text) > MAX_CV_CHARS:
         logger.warning(f"CV truncated: {len(raw_text)} → {MAX_CV_CHARS} chars")
         raw_text = raw_text[:MAX_CV_CHARS] + "\n\n[... TRUNCATED]"
     
-    return {
+    result = {
         "raw_text": raw_text.strip(),
-        "char_count": len(raw_text)
+        "char_count": len(raw_text),
+        "pages_skipped": pages_skipped,
+        "backend": backend,
     }
 
+    if cache_key is not None:
+        parse_cache.put(cache_key, result)
+
+    return result
+
+
+# ─── Lazy Imports ────────────────────────────────────
+@lru_cache(maxsize=None)
+def _pypdf2():
+    """PyPDF2'yi ilk PDF parse'ında yükle (health / txt / docx path'leri ödemesin)."""
+    import PyPDF2
+    return PyPDF2
+
+
+# ─── PDF Backends ────────────────────────────────────
+# Her backend: (data, max_chars, parallel) -> (text, pages_skipped)
+# data: bytes-like (bytes / bytearray / memoryview) — io.BytesIO ile okunur
+BytesLike = Union[bytes, bytearray, memoryview]
+PdfBackend = Callable[[BytesLike, int, bool], Tuple[str, int]]
+
+_PDF_BACKENDS: Dict[str, PdfBackend] = {}
+_PDF_BACKEND_STATS: Dict[str, Dict[str, float]] = {}
+_PDF_BACKEND_STATS_LOCK = threading.Lock()
+
+
+def register_pdf_backend(name: str, backend: PdfBackend) -> None:
+    """Backend ekle/değiştir. Denenme sırası settings.PDF_BACKEND_ORDER'dan gelir."""
+    _PDF_BACKENDS[name] = backend
+
+
+def pdf_backend_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Backend başına sayaçlar ve süreler (policy'yi veriyle ayarlamak için).
+
+    {"pypdf2": {"calls": 10, "accepted": 9, "rejected": 1, "errors": 0,
+                "total_seconds": 1.2, "avg_ms": 120.0}, ...}
+    """
+    with _PDF_BACKEND_STATS_LOCK:
+        return {
+            name: {
+                **stats,
+                "avg_ms": round(stats["total_seconds"] / stats["calls"] * 1000, 2) if stats["calls"] else 0.0,
+            }
+            for name, stats in _PDF_BACKEND_STATS.items()
+        }
+
+
+def _record_backend_call(name: str, seconds: float, outcome: str) -> None:
+    with _PDF_BACKEND_STATS_LOCK:
+        stats = _PDF_BACKEND_STATS.setdefault(
+            name, {"calls": 0, "accepted": 0, "rejected": 0, "errors": 0, "total_seconds": 0.0}
+        )
+        stats["calls"] += 1
+        stats[outcome] += 1
+        stats["total_seconds"] += seconds
+
+
+def _text_quality(text: str) -> float:
+    """
+    Harf oranı: harfler / boşluk olmayan karakterler (0.0 – 1.0).
+
+    Font encoding'i çözülemeyen PDF'ler (CID glyph id'leri, kontrol
+    karakterleri) düşük oran verir; boş çıktı 0.0'dır.
+    """
+    non_space = 0
+    letters = 0
+    for ch in text:
+        if not ch.isspace():
+            non_space += 1
+            if ch.isalpha():
+                letters += 1
+    return letters / non_space if non_space else 0.0
+
+
+def _parse_pdf(
+    data: BytesLike,
+    max_chars: int = MAX_CV_CHARS,
+    parallel: bool = False,
+) -> Tuple[str, int, str]:
+    """
+    PDF'den text çıkar — backend'leri hızlıdan ağıra dener.
+
+    Bir backend'in çıktısı boş değilse ve harf oranı PDF_MIN_ALPHA_RATIO
+    üstündeyse kabul edilir; aksi halde sıradaki (daha ağır) backend'e
+    geçilir. Hiçbiri kabul edilmezse en yüksek kaliteli çıktı döner.
+
+    Returns:
+        (text, pages_skipped, backend_name)
+    """
+    best: Optional[Tuple[float, str, int, str]] = None
+    errors: List[str] = []
+
+    for name in settings.pdf_backend_order:
+        backend = _PDF_BACKENDS.get(name)
+        if backend is None:
+            logger.warning(f"Unknown PDF backend in PDF_BACKEND_ORDER: {name}")
+            continue
+
+        started = time.perf_counter()
+        try:
+            text, pages_skipped = backend(data, max_chars, parallel)
+        except Exception as e:
+            _record_backend_call(name, time.perf_counter() - started, "errors")
+            logger.warning(f"PDF backend '{name}' failed: {e}")
+            errors.append(f"{name}: {e}")
+            continue
+
+        quality = _text_quality(text)
+        if quality >= PDF_MIN_ALPHA_RATIO:
+            _record_backend_call(name, time.perf_counter() - started, "accepted")
+            logger.info(f"✅ PDF parsed with {name}: {len(text)} characters")
+            return text, pages_skipped, name
+
+        _record_backend_call(name, time.perf_counter() - started, "rejected")
+        logger.info(f"PDF backend '{name}' output looks garbled (alpha ratio {quality:.2f}), falling back")
+        if best is None or quality > best[0]:
+            best = (quality, text, pages_skipped, name)
+
+    if best is not None:
+        _, text, pages_skipped, name = best
+        logger.warning(f"No PDF backend produced clean text, using {name}")
+        return text, pages_skipped, name
+
+    logger.error(f"PDF parse error: {errors}")
+    raise ValueError(f"PDF okunamadı: {'; '.join(errors) or 'no backend available'}")
+
+
+def _log_pages_skipped(backend: str, text: str, pages_skipped: int, total_pages: int, max_chars: int) -> None:
+    if pages_skipped:
+        logger.info(
+            f"{backend}: {len(text)} characters "
+            f"({pages_skipped}/{total_pages} pages skipped, budget {max_chars})"
+        )
+
+
+def _pdf_backend_raw(data: BytesLike, max_chars: int, parallel: bool = False) -> Tuple[str, int]:
+    """
+    Fast path (opt-in: PDF_BACKEND_ORDER'a "raw" eklenirse): sayfa content
+    stream'lerindeki text operatörlerini (Tj, TJ, ', ") doğrudan oku.
+    Font/CMap çözümlemesi ve layout analizi yok.
+
+    Harf oranı kayıp text'i yakalayamaz; bu yüzden backend kendini denetler
+    ve güvenemediği sayfada ValueError verir (policy sıradaki backend'e geçer):
+      - font: ToUnicode / Differences / Type0 / Type3 → glyph'ler latin-1 değil (ör. "fi" ligatürü)
+      - Form XObject: içindeki text content stream'de yok
+      - glyph coverage: stream'deki text operatörlerinin hepsi parse edilmeli
+        (kaçan operatör = sessizce düşen cümle)
+    """
+    reader = _pypdf2().PdfReader(io.BytesIO(data))
+    total_pages = len(reader.pages)
+
+    def _pages() -> Iterator[str]:
+        for number, page in enumerate(reader.pages, 1):
+            _check_raw_resources(page, number)
+            content = _raw_content_bytes(page.get_contents())
+            text, parsed = _raw_page_parse(content)
+            shown = len(_RAW_SHOW_OPERATOR.findall(content))
+            if parsed < shown:
+                raise ValueError(f"page {number}: {shown - parsed}/{shown} text operators not parsed")
+            if _RAW_CONTROL_CHARS.search(text):
+                raise ValueError(f"page {number}: undecodable glyphs (custom font encoding)")
+            yield text + "\n"
+
+    pieces = list(_take_until_budget(_pages(), max_chars))
+    text = "".join(pieces)
+    _log_pages_skipped("raw", text, total_pages - len(pieces), total_pages, max_chars)
+    return text, total_pages - len(pieces)
+
+
+def _raw_content_bytes(contents) -> bytes:
+    """Sayfa /Contents'i: tek stream, stream array'i ya da yok."""
+    if contents is None:
+        return b""
+    if hasattr(contents, "get_data"):
+        return contents.get_data()
+    return b"\n".join(part.get_object().get_data() for part in contents)
+
+
+def _check_raw_resources(page, number: int) -> None:
+    """Raw okumanın doğru text veremeyeceği font / XObject varsa ValueError."""
+    resources = page.get("/Resources")
+    resources = resources.get_object() if resources is not None else {}
+
+    fonts = resources.get("/Font")
+    for name, font in (fonts.get_object() if fonts is not None else {}).items():
+        font = font.get_object()
+        encoding = font.get("/Encoding")
+        encoding = encoding.get_object() if encoding is not None else None
+        if (
+            "/ToUnicode" in font
+            or font.get("/Subtype") in ("/Type0", "/Type3")
+            or (hasattr(encoding, "get") and "/Differences" in encoding)
+        ):
+            raise ValueError(f"page {number}: font {name} needs glyph mapping")
+
+    xobjects = resources.get("/XObject")
+    for name, xobject in (xobjects.get_object() if xobjects is not None else {}).items():
+        if xobject.get_object().get("/Subtype") == "/Form":
+            raise ValueError(f"page {number}: form XObject {name} may contain text")
+
+
+_RAW_NUMBER = rb"-?(?:\d+(?:\.\d*)?|\.\d+)"
+_RAW_LITERAL = rb"\((?P<literal>(?:\\.|[^\\)])*)\)"
+_RAW_HEX = rb"<(?P<hex>[0-9A-Fa-f\s]*)>"
+
+_RAW_TEXT_TOKEN = re.compile(
+    _RAW_LITERAL + rb"\s*(?P<show>Tj|'|\")"                  # (text) Tj / ' / "
+    rb"|" + _RAW_HEX + rb"\s*Tj"                              # <hex> Tj
+    rb"|\[(?P<array>(?:\\.|[^\]\\])*)\]\s*TJ"               # [(te) -20 (xt)] TJ
+    rb"|(?P<newline>T\*|\bET\b)"                              # sonraki satır / text bloğu sonu
+    rb"|" + _RAW_NUMBER + rb"\s+(?P<ty>" + _RAW_NUMBER + rb")\s+T[dD]\b",
+    re.DOTALL,
+)
+# Glyph coverage probe: her text operatörü (string / array kapanışı + Tj, TJ, ', ")
+_RAW_SHOW_OPERATOR = re.compile(rb"[)>\]]\s*(?:Tj|TJ|'|\")")
+_RAW_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")   # Latin-1 olarak çözülemeyen glyph
+_RAW_ARRAY_ITEM = re.compile(_RAW_LITERAL + rb"|" + _RAW_HEX + rb"|(?P<kern>" + _RAW_NUMBER + rb")", re.DOTALL)
+_RAW_ESCAPE = re.compile(rb"\\([0-7]{1,3}|.)", re.DOTALL)
+_RAW_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+
+def _raw_literal(raw: bytes) -> str:
+    """PDF literal string escape'lerini çöz, WinAnsi'ye yakın latin-1 decode et."""
+    def _unescape(match: "re.Match[bytes]") -> bytes:
+        token = match.group(1)
+        if token[:1].isdigit():
+            return bytes([int(token, 8) & 0xFF])
+        if token in (b"\n", b"\r"):
+            return b""   # Satır devamı
+        return _RAW_ESCAPES.get(token, token)   # \( \) \\ → kendisi
+
+    return _RAW_ESCAPE.sub(_unescape, raw).decode("latin-1")
+
+
+def _raw_hex(raw: bytes) -> str:
+    digits = b"".join(raw.split())
+    if len(digits) % 2:
+        digits += b"0"
+    return bytes.fromhex(digits.decode("ascii")).decode("latin-1")
+
+
+def _raw_page_text(content: bytes) -> str:
+    """Tek sayfanın content stream'inden text'i sırayla topla."""
+    return _raw_page_parse(content)[0]
+
+
+def _raw_page_parse(content: bytes) -> Tuple[str, int]:
+    """(text, parse edilen text operatörü sayısı)"""
+    parts: List[str] = []
+    parsed = 0
+    for token in _RAW_TEXT_TOKEN.finditer(content):
+        if token.group("literal") is not None or token.group("hex") is not None or token.group("array") is not None:
+            parsed += 1
+        if token.group("literal") is not None:
+            if token.group("show") != b"Tj":
+                parts.append("\n")   # ' ve " önce satır atlar
+            parts.append(_raw_literal(token.group("literal")))
+        elif token.group("hex") is not None:
+            parts.append(_raw_hex(token.group("hex")))
+        elif token.group("array") is not None:
+            for item in _RAW_ARRAY_ITEM.finditer(token.group("array")):
+                if item.group("literal") is not None:
+                    parts.append(_raw_literal(item.group("literal")))
+                elif item.group("hex") is not None:
+                    parts.append(_raw_hex(item.group("hex")))
+                elif float(item.group("kern")) < -200:
+                    parts.append(" ")   # Büyük negatif kerning = kelime boşluğu
+        elif token.group("newline") is not None:
+            parts.append("\n")
+        elif float(token.group("ty")) != 0:
+            parts.append("\n")
+    # Boş satırları ve satır sonu boşluklarını sadeleştir
+    lines = (line.rstrip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line), parsed
+
+
+def _pdf_backend_pypdf2(data: BytesLike, max_chars: int, parallel: bool = False) -> Tuple[str, int]:
+    """
+    PyPDF2 extract_text — sayfa sayfa, budget dolunca durur.
+
+    `parallel=True` ve yeterince sayfa varsa sayfa aralıkları process
+    pool'a dağıtılır, sonuç yine sayfa sırasıyla birleştirilir.
+    """
+    reader = _pypdf2().PdfReader(io.BytesIO(data))
+    total_pages = len(reader.pages)
+
+    if parallel and total_pages >= PDF_PARALLEL_MIN_PAGES:
+        page_iter = _iter_pdf_pages_parallel(data, total_pages)
+    else:
+        page_iter = _iter_pdf_pages(reader)
+
+    with closing(page_iter):
+        pieces = list(_take_until_budget(page_iter, max_chars))
+
+    text = "".join(pieces)
+    _log_pages_skipped("pypdf2", text, total_pages - len(pieces), total_pages, max_chars)
+    return text, total_pages - len(pieces)
+
+
+def _pdf_backend_pdfplumber(data: BytesLike, max_chars: int, parallel: bool = False) -> Tuple[str, int]:
+    """pdfplumber (pdfminer layout analizi) — en yavaş ama en sağlam backend."""
+    import pdfplumber  # Ağır import: sadece fallback gerektiğinde
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        total_pages = len(pdf.pages)
+        pieces = list(_take_until_budget(
+            ((page.extract_text() or "") + "\n" for page in pdf.pages), max_chars
+        ))
+
+    text = "".join(pieces)
+    _log_pages_skipped("pdfplumber", text, total_pages - len(pieces), total_pages, max_chars)
+    return text, total_pages - len(pieces)
+
+
+register_pdf_backend("raw", _pdf_backend_raw)
+register_pdf_backend("pypdf2", _pdf_backend_pypdf2)
+register_pdf_backend("pdfplumber", _pdf_backend_pdfplumber)
+
+
+def _iter_pdf_pages(reader: "PyPDF2.PdfReader") -> Iterator[str]:
+    """Sayfa text'lerini lazy üret — sadece tüketilen sayfalar extract edilir."""
+    for page in reader.pages:
+        yield (page.extract_text() or "") + "\n"
+
+
+# ─── Parallel PDF Extraction ────────────────────────
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+_PDF_POOL_LOCK = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Process boyunca yaşayan tek pool — her çağrıda yeni pool açılmaz."""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is None:
+            _PDF_POOL = ProcessPoolExecutor(max_workers=settings.PDF_POOL_WORKERS)
+            atexit.register(shutdown_pdf_pool)
+        return _PDF_POOL
+
+
+def shutdown_pdf_pool() -> None:
+    """Pool'u kapat (process çıkışında otomatik çağrılır)."""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is not None:
+            _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+            _PDF_POOL = None
+
+
+def _extract_page_range(data: bytes, start: int, end: int) -> List[str]:
+    """Worker: [start, end) sayfalarının text'ini döndür."""
+    reader = _pypdf2().PdfReader(io.BytesIO(data))
+    return [(reader.pages[i].extract_text() or "") + "\n" for i in range(start, end)]
+
+
+def _iter_pdf_pages_parallel(data: BytesLike, total_pages: int) -> Iterator[str]:
+    """
+    Sayfa aralıklarını pool'a dağıt, text'leri sayfa sırasıyla üret.
+
+    Aynı anda en fazla worker sayısı kadar chunk uçuştadır; tüketici
+    budget dolduğu için durursa bekleyen chunk'lar iptal edilir.
+    """
+    # Worker'lara pickle edilir: memoryview pickle edilemez → sadece burada bytes'a çevir
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    pool = _get_pdf_pool()
+    ranges = iter(
+        (start, min(start + PDF_PAGES_PER_CHUNK, total_pages))
+        for start in range(0, total_pages, PDF_PAGES_PER_CHUNK)
+    )
+    in_flight: Deque[Future] = deque()
+
+    def _submit_next() -> None:
+        page_range = next(ranges, None)
+        if page_range is not None:
+            in_flight.append(pool.submit(_extract_page_range, data, *page_range))
 
-def _parse_pdf(file_path: str) -> str:
-    """PDF'den text çıkar."""
     try:
-        with open(file_path, 'rb') as f:
-            reader = PyPDF2.PdfReader(f)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-        
-        logger.info(f"✅ PDF parsed: {len(text)} characters")
-        return text
-    
-    except Exception as e:
-        logger.error(f"PDF parse error: {e}")
-        raise ValueError(f"PDF okunamadı: {e}")
+        for _ in range(settings.PDF_POOL_WORKERS):
+            _submit_next()
 
+        while in_flight:
+            chunk = in_flight.popleft().result()
+            _submit_next()
+            yield from chunk
+    finally:
+        for future in in_flight:
+            future.cancel()
 
-def _parse_docx(file_path: str) -> str:
-    """DOCX'den text çıkar."""
+
+def _take_until_budget(pieces: Iterable[str], max_chars: int) -> Iterator[str]:
+    """
+    Parçaları toplam uzunluk `max_chars`'ı aşana kadar geçir.
+
+    Budget'ı aşan parça dahil edilir (truncation parse_cv'de yapılır),
+    sonrasında generator'dan bir parça bile çekilmez.
+    """
+    total = 0
+    for piece in pieces:
+        yield piece
+        total += len(piece)
+        if total > max_chars:
+            return
+
+
+# ─── DOCX (streaming) ────────────────────────────────
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+
+def _parse_docx(data: BytesLike, max_chars: int = MAX_CV_CHARS) -> str:
+    """
+    DOCX'den text çıkar — python-docx DOM'u kurmadan.
+
+    `word/document.xml` zip'ten stream edilir ve iterparse ile okunur;
+    paragraflar ve tablo satırları belge sırasıyla üretilir, budget
+    dolunca XML'in geri kalanı hiç parse edilmez.
+    """
     try:
-        doc = docx.Document(file_path)
-        text = "\n".join([p.text for p in doc.paragraphs])
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            with archive.open("word/document.xml") as document_xml:
+                lines = list(_take_until_budget(_iter_docx_lines(document_xml), max_chars))
+
+        text = "\n".join(lines)
         
         logger.info(f"✅ DOCX parsed: {len(text)} characters")
         return text
@@ -80,11 +558,80 @@ def _parse_docx(file_path: str) -> str:
         raise ValueError(f"DOCX okunamadı: {e}")
 
 
-def _parse_txt(file_path: str) -> str:
-    """TXT dosyasını oku."""
+def _iter_docx_lines(document_xml: BinaryIO) -> Iterator[str]:
+    """
+    document.xml'den satırları sırayla üret.
+
+    - Paragraf → bir satır (run'lar birleşik; tab → \\t, satır sonu → \\n)
+    - Tablo satırı → hücreler " | " ile tek satır (skills tabloları kaybolmaz)
+    - Text box içindeki paragraflar ayrı satır; mc:Fallback kopyaları atlanır
+    """
+    paragraphs: List[List[str]] = []       # İç içe paragraflar (text box) için stack
+    tables: List[Dict[str, list]] = []     # İç içe tablolar için stack: {"row": [...], "cell": [...]}
+    skip_depth = 0
+
+    for event, elem in ElementTree.iterparse(document_xml, events=("start", "end")):
+        tag = elem.tag
+
+        if event == "start":
+            if tag == _MC_FALLBACK or skip_depth:
+                skip_depth += 1
+            elif tag == f"{_W}p":
+                paragraphs.append([])
+            elif tag == f"{_W}tbl":
+                tables.append({"row": [], "cell": []})
+            elif tag == f"{_W}tr" and tables:
+                tables[-1]["row"] = []
+            elif tag == f"{_W}tc" and tables:
+                tables[-1]["cell"] = []
+            continue
+
+        # ── end ──
+        if skip_depth:
+            skip_depth -= 1
+            elem.clear()
+            continue
+
+        if paragraphs and tag == f"{_W}t":
+            paragraphs[-1].append(elem.text or "")
+        elif paragraphs and tag in (f"{_W}tab", f"{_W}ptab"):
+            paragraphs[-1].append("\t")
+        elif paragraphs and tag == f"{_W}cr":
+            paragraphs[-1].append("\n")
+        elif paragraphs and tag == f"{_W}br" and elem.get(f"{_W}type") in (None, "textWrapping"):
+            paragraphs[-1].append("\n")
+        elif paragraphs and tag == f"{_W}noBreakHyphen":
+            paragraphs[-1].append("-")
+        elif tag == f"{_W}p" and paragraphs:
+            line = "".join(paragraphs.pop())
+            if tables and len(paragraphs) == 0:
+                if line.strip():
+                    tables[-1]["cell"].append(line.strip())
+            else:
+                yield line
+        elif tag == f"{_W}tc" and tables:
+            cell = " ".join(tables[-1]["cell"])
+            if cell:
+                tables[-1]["row"].append(cell)
+        elif tag == f"{_W}tr" and tables:
+            line = " | ".join(tables[-1]["row"])
+            if line:
+                if len(tables) > 1:
+                    tables[-2]["cell"].append(line)   # İç tablo → dış hücrenin içeriği
+                else:
+                    yield line
+        elif tag == f"{_W}tbl" and tables:
+            tables.pop()
+        else:
+            continue
+
+        elem.clear()
+
+
+def _parse_txt(data: BytesLike) -> str:
+    """TXT içeriğini decode et (universal newline, open(..., 'r') ile aynı)."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            text = f.read()
+        text = str(data, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
         
         logger.info(f"✅ TXT parsed: {len(text)} characters")
         return text
@@ -95,82 +642,190 @@ def _parse_txt(file_path: str) -> str:
 
 
 # ─── Contact Info Extraction ─────────────────────────
+# Pattern'ler import'ta bir kez derlenir.
+_EMAIL_PATTERN    = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+', re.IGNORECASE)
+_PHONE_PATTERN    = re.compile(r'\+?1?\s*\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+_PROFILE_USER     = re.compile(r'[\w-]+')
+
+# Tek alternation, text başına bir tarama: her tür için en soldaki "tutamak"
+# → email: '@', phone: core'un ilk rakamı, profil: domain literal'i.
+# Tutamak sonrası gerçek pattern o noktadan doğrulanır. Named group'lar
+# sonda boş marker (grup sarmalamak her pozisyonda MARK maliyeti ekliyor).
+_CONTACT_PATTERN = re.compile(
+    r'@(?P<email>)'
+    r'|\d(?=\d\d\)?[\s.-]?\d{3}[\s.-]?\d{4})(?P<phone>)'
+    r'|[lL](?i:inkedin\.com/in/)(?=[\w-])(?P<linkedin>)'
+    r'|[gG](?i:ithub\.com/)(?=[\w-])(?P<github>)'
+)
+
+
+def _email_at(text: str, at: int) -> str:
+    """
+    '@' içeren email match'i (`_EMAIL_PATTERN.search` ile aynı sonuç).
+
+    Her match tam bir '@' içerir; '@' önündeki email karakteri koşusunun başından
+    yapılan match, search'ün o '@' için bulacağı match'in aynısıdır.
+    """
+    start = at
+    while start > 0 and (text[start - 1].isalnum() or text[start - 1] in '_.-'):
+        start -= 1
+    match = _EMAIL_PATTERN.match(text, start) if start < at else None
+    return match.group(0) if match else ""
+
+
+def _phone_at(text: str, position: int) -> str:
+    """
+    Core'u `position`'da başlayan phone (`_PHONE_PATTERN.search` ile aynı sonuç).
+
+    Opsiyonel `+1 (` prefix'i kadar sola genişlet, gerçek pattern'i oradan başlat.
+    """
+    start = position
+    if start > 0 and text[start - 1] == '(':
+        start -= 1
+    while start > 0 and text[start - 1].isspace():
+        start -= 1
+    if start > 0 and text[start - 1] == '1':
+        start -= 1
+    if start > 0 and text[start - 1] == '+':
+        start -= 1
+
+    match = _PHONE_PATTERN.search(text, start)
+    return match.group(0) if match else ""
+
+
 def extract_contact_info(raw_text: str) -> Dict[str, str]:
-    """Email, phone, LinkedIn çıkar (basit regex)."""
-    contact = {
-        "email": "",
-        "phone": "",
-        "linkedin": "",
-        "github": ""
+    """
+    Email, phone, LinkedIn, GitHub çıkar — combined regex ile tek tarama.
+
+    Her tür için sonuç eski ayrı `re.search`'lerle aynı (en soldaki match);
+    dört tür de bulununca tarama durur.
+    """
+    found: Dict[str, str] = {}
+    for match in _CONTACT_PATTERN.finditer(raw_text):
+        kind = match.lastgroup
+        if kind in found:
+            continue
+        if kind == "email":
+            value = _email_at(raw_text, match.start())
+        elif kind == "phone":
+            value = _phone_at(raw_text, match.start())
+        else:
+            value = _PROFILE_USER.match(raw_text, match.end()).group(0)
+        if value:
+            found[kind] = value
+            if len(found) == 4:
+                break
+
+    # Not: eski "international" phone pattern'i US pattern'inin core'unu
+    # içerdiği için US eşleşmediğinde o da eşleşemez — ayrıca denenmez.
+    return {
+        "email": found.get("email", ""),
+        "phone": found.get("phone", ""),
+        "linkedin": f"https://linkedin.com/in/{found['linkedin']}" if "linkedin" in found else "",
+        "github": f"https://github.com/{found['github']}" if "github" in found else "",
     }
-    
-    # Email
-    email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', raw_text, re.IGNORECASE)
-    if email_match:
-        contact["email"] = email_match.group(0)
-    
-    # Phone (multiple formats)
-    phone_patterns = [
-        r'\+?1?\s*\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # US
-        r'\+?\d{1,3}[\s.-]?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # International
-    ]
-    for pattern in phone_patterns:
-        phone_match = re.search(pattern, raw_text)
-        if phone_match:
-            contact["phone"] = phone_match.group(0)
-            break
-    
-    # LinkedIn
-    linkedin_match = re.search(r'linkedin\.com/in/([\w-]+)', raw_text, re.IGNORECASE)
-    if linkedin_match:
-        contact["linkedin"] = f"https://linkedin.com/in/{linkedin_match.group(1)}"
-    
-    # GitHub
-    github_match = re.search(r'github\.com/([\w-]+)', raw_text, re.IGNORECASE)
-    if github_match:
-        contact["github"] = f"https://github.com/{github_match.group(1)}"
-    
-    return contact
+
+
+def extract_contact_info_batch(raw_texts: Iterable[str]) -> List[Dict[str, str]]:
+    """
+    Toplu CV import'ları için: her text için extract_contact_info sonucu.
+
+    Combined pattern import'ta bir kez derlenir; text başına tek tarama,
+    çağrı başına regex derleme / cache lookup yok.
+    """
+    return [extract_contact_info(raw_text) for raw_text in raw_texts]
 
 
 # ─── Basic Section Detection (MVP) ───────────────────
+_SECTION_KEYWORDS: Dict[str, List[str]] = {
+    'summary': ['summary', 'objective', 'profile', 'about', 'özet', 'hakkımda'],
+    'experience': ['experience', 'work history', 'employment', 'professional experience',
+                   'deneyim', 'iş geçmişi'],
+    'education': ['education', 'academic', 'qualifications', 'eğitim', 'öğrenim'],
+    'skills': ['skills', 'technical skills', 'competencies', 'technologies',
+               'yetenekler', 'beceriler', 'yetkinlikler'],
+    'certifications': ['certification', 'licenses', 'awards', 'sertifika', 'ödüller'],
+    'projects': ['projects', 'portfolio', 'personal projects', 'projeler'],
+}
+
+
+def _fold(text: str) -> str:
+    """
+    Keyword eşleştirme için lowercase + Türkçe İ/ı normalizasyonu.
+
+    "EĞİTİM" → "eğitim"; "HAKKIMDA" ve "hakkımda" → "hakkimda".
+    Uzunluk ve satır sayısı değişmez.
+    """
+    return text.replace("İ", "i").lower().replace("ı", "i")
+
+
+def _build_section_matcher() -> List[Tuple[str, int]]:
+    """
+    (folded keyword, section index) tablosu — import'ta bir kez kurulur.
+
+    Section index dict sırasıdır; bir satırda birden fazla section'ın
+    keyword'ü varsa en küçük index kazanır. Aynı veya önceki section'ın
+    daha kısa bir keyword'ünü içeren keyword'ler ("technical skills" ⊃
+    "skills") sonucu değiştiremeyeceği için taranmaz.
+    """
+    keyword_to_section: Dict[str, int] = {}
+    for index, keywords in enumerate(_SECTION_KEYWORDS.values()):
+        for keyword in keywords:
+            keyword_to_section.setdefault(_fold(keyword), index)
+
+    return [
+        (keyword, index)
+        for keyword, index in keyword_to_section.items()
+        if not any(
+            other != keyword and other in keyword and other_index <= index
+            for other, other_index in keyword_to_section.items()
+        )
+    ]
+
+
+_SECTION_MATCHER: List[Tuple[str, int]] = _build_section_matcher()
+_SECTION_NAMES: List[str] = list(_SECTION_KEYWORDS)
+
+
+def _find_header_lines(folded_text: str, line_starts: List[int]) -> Dict[int, int]:
+    """
+    Header satırlarını bul: {satır index'i: section index}.
+
+    Her keyword tüm text üzerinde `str.find` ile taranır (C hızında);
+    satır satır Python döngüsü yok. Eşleşme offset'i bisect ile satıra çevrilir.
+    """
+    headers: Dict[int, int] = {}
+    for keyword, section_index in _SECTION_MATCHER:
+        position = folded_text.find(keyword)
+        while position != -1:
+            line_index = bisect_right(line_starts, position) - 1
+            if section_index < headers.get(line_index, len(_SECTION_NAMES)):
+                headers[line_index] = section_index
+            position = folded_text.find(keyword, position + 1)
+    return headers
+
+
 def extract_sections(raw_text: str) -> Dict[str, str]:
     """
-    CV'den temel section'ları çıkar (basit regex).
+    CV'den temel section'ları çıkar (keyword tabanlı, İngilizce + Türkçe header'lar).
     Gelişmiş NLP Phase 2'de eklenecek.
+
+    Keyword içeren satır header sayılır (içeriğe eklenmez) ve aktif
+    section'ı değiştirir; ilk header'dan önceki satırlar atılır.
     """
-    sections = {
-        "summary": "",
-        "experience": "",
-        "education": "",
-        "skills": "",
-        "certifications": "",
-        "projects": ""
-    }
-    
     lines = raw_text.split('\n')
-    current_section = None
-    
-    section_keywords = {
-        'summary': ['summary', 'objective', 'profile', 'about'],
-        'experience': ['experience', 'work history', 'employment', 'professional experience'],
-        'education': ['education', 'academic', 'qualifications'],
-        'skills': ['skills', 'technical skills', 'competencies', 'technologies'],
-        'certifications': ['certification', 'licenses', 'awards'],
-        'projects': ['projects', 'portfolio', 'personal projects']
+    line_starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
+    headers = _find_header_lines(_fold(raw_text), line_starts)
+
+    collected: Dict[str, List[str]] = {name: [] for name in _SECTION_NAMES}
+    header_indices = sorted(headers)
+
+    for header_index, next_header in zip(header_indices, header_indices[1:] + [len(lines)]):
+        collected[_SECTION_NAMES[headers[header_index]]].extend(
+            line for line in lines[header_index + 1:next_header] if line.strip()
+        )
+
+    return {
+        name: "".join(f"{line}\n" for line in section_lines)
+        for name, section_lines in collected.items()
     }
-    
-    for line in lines:
-        line_lower = line.lower().strip()
-        
-        # Detect section headers
-        for section_name, keywords in section_keywords.items():
-            if any(keyword in line_lower for keyword in keywords):
-                current_section = section_name
-                break
-        
-        # Add content to current section
-        if current_section and line.strip() and not any(kw in line_lower for keywords in section_keywords.values() for kw in keywords):
-            sections[current_section] += line + "\n"
-    
-    return sections
\ No newline at end of file
@@ -6,13 +6,15 @@ Hybrid job search system:
 - Global: JSearch API (RapidAPI)
 """
 
+import asyncio
 import requests
 import logging
-from typing import List, Dict
+from typing import Callable, List, Dict, Tuple
 from datetime import datetime
 from bs4 import BeautifulSoup
 
 from src.core.config import settings
+from src.core.metrics import JOB_SOURCE_FAILURES, JOB_SOURCE_SECONDS, timed
 from src.services.matching import calculate_match_score
 
 logger = logging.getLogger(__name__)
@@ -34,21 +36,43 @@ def search_jobs(
     Other locations → JSearch API
     """
     
-    # Turkey cities detection
+    if _is_turkey_location(location):
+        logger.info(f"🇹🇷 Turkey detected: Using Turkish job scrapers")
+        return _search_jobs_turkey(query, location, num_results)
+    else:
+        logger.info(f"🌍 Global search: Using JSearch API")
+        return _search_jobs_jsearch(query, location, num_results)
+
+
+async def asearch_jobs(
+    query: str,
+    location: str = "",
+    num_results: int = 10
+) -> List[Dict]:
+    """
+    search_jobs'un async versiyonu.
+
+    Global → JSearch'e httpx.AsyncClient ile gider.
+    Turkey → scraper'lar (requests + bekleme/rotation) worker thread'de çalışır;
+    her iki durumda da event loop bloklanmaz.
+    """
+    if _is_turkey_location(location):
+        logger.info(f"🇹🇷 Turkey detected: Using Turkish job scrapers")
+        return await asyncio.to_thread(_search_jobs_turkey, query, location, num_results)
+    else:
+        logger.info(f"🌍 Global search: Using JSearch API (async)")
+        return await _asearch_jobs_jsearch(query, location, num_results)
+
+
+def _is_turkey_location(location: str) -> bool:
+    """Turkey cities detection."""
     turkey_keywords = [
         "istanbul", "ankara", "izmir", "bursa", "antalya",
         "adana", "gaziantep", "konya", "eskişehir", "kayseri",
         "turkey", "türkiye", "turkiye"
     ]
     
-    is_turkey = any(keyword in location.lower() for keyword in turkey_keywords)
-    
-    if is_turkey:
-        logger.info(f"🇹🇷 Turkey detected: Using Turkish job scrapers")
-        return _search_jobs_turkey(query, location, num_results)
-    else:
-        logger.info(f"🌍 Global search: Using JSearch API")
-        return _search_jobs_jsearch(query, location, num_results)
+    return any(keyword in location.lower() for keyword in turkey_keywords)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -266,6 +290,40 @@ def _parse_indeed_job(card) -> Dict:
 def _search_jobs_jsearch(query: str, location: str, num_results: int) -> List[Dict]:
     """Search using JSearch API (global)."""
     
+    url, headers, params = _jsearch_request(query, location)
+    
+    try:
+        with timed(JOB_SOURCE_SECONDS, JOB_SOURCE_FAILURES, source="jsearch"):
+            response = requests.get(url, headers=headers, params=params, timeout=20)
+            return _parse_jsearch_response(response.status_code, response.json, query, location, num_results)
+    
+    except requests.exceptions.Timeout:
+        raise Exception("JSearch API timeout")
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"JSearch API network error: {str(e)}")
+
+
+async def _asearch_jobs_jsearch(query: str, location: str, num_results: int) -> List[Dict]:
+    """_search_jobs_jsearch'ün async (httpx) versiyonu."""
+    import httpx
+    
+    url, headers, params = _jsearch_request(query, location)
+    
+    with timed(JOB_SOURCE_SECONDS, JOB_SOURCE_FAILURES, source="jsearch"):
+        try:
+            async with httpx.AsyncClient(timeout=20) as client:
+                response = await client.get(url, headers=headers, params=params)
+        except httpx.TimeoutException:
+            raise Exception("JSearch API timeout")
+        except httpx.HTTPError as e:
+            raise Exception(f"JSearch API network error: {str(e)}")
+        
+        return _parse_jsearch_response(response.status_code, response.json, query, location, num_results)
+
+
+def _jsearch_request(query: str, location: str) -> Tuple[str, Dict, Dict]:
+    """JSearch isteğinin (url, headers, params)'ı — sync/async ortak."""
+    
     if not settings.RAPIDAPI_KEY:
         raise ValueError("RAPIDAPI_KEY required for global job search")
     
@@ -298,43 +356,47 @@ def _search_jobs_jsearch(query: str, location: str, num_results: int) -> List[Di
     
     logger.info(f"🔍 JSearch: '{search_query}' | Remote filter: {params.get('remote_jobs_only', 'false')}")
     
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=20)
-        
-        if response.status_code == 429:
-            raise Exception("JSearch API rate limit exceeded")
-        
-        if response.status_code != 200:
-            raise Exception(f"JSearch API error: HTTP {response.status_code}")
-        
-        data = response.json()
-        jobs = data.get("data", [])
-        
-        if not jobs:
-            raise Exception(f"No remote jobs found for '{query}'")
-        
-        logger.info(f"✅ JSearch: {len(jobs)} jobs found")
-        
-        # Parse jobs
-        parsed_jobs = []
-        for job in jobs[:num_results]:
-            parsed = _parse_jsearch_job(job)
-            if parsed:
-                # Extra filter for remote (double-check)
-                if location and location.lower() in ["remote", "remote work", "uzaktan"]:
-                    if _is_truly_remote(parsed):
-                        parsed_jobs.append(parsed)
-                else:
+    return url, headers, params
+
+
+def _parse_jsearch_response(
+    status_code: int,
+    read_json: Callable[[], Dict],
+    query: str,
+    location: str,
+    num_results: int,
+) -> List[Dict]:
+    """JSearch cevabını doğrula ve parse et — sync/async ortak."""
+    
+    if status_code == 429:
+        raise Exception("JSearch API rate limit exceeded")
+    
+    if status_code != 200:
+        raise Exception(f"JSearch API error: HTTP {status_code}")
+    
+    data = read_json()
+    jobs = data.get("data", [])
+    
+    if not jobs:
+        raise Exception(f"No remote jobs found for '{query}'")
+    
+    logger.info(f"✅ JSearch: {len(jobs)} jobs found")
+    
+    # Parse jobs
+    parsed_jobs = []
+    for job in jobs[:num_results]:
+        parsed = _parse_jsearch_job(job)
+        if parsed:
+            # Extra filter for remote (double-check)
+            if location and location.lower() in ["remote", "remote work", "uzaktan"]:
+                if _is_truly_remote(parsed):
                     parsed_jobs.append(parsed)
-        
-        logger.info(f"✅ Filtered to {len(parsed_jobs)} jobs")
-        
-        return parsed_jobs
+            else:
+                parsed_jobs.append(parsed)
     
-    except requests.exceptions.Timeout:
-        raise Exception("JSearch API timeout")
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"JSearch API network error: {str(e)}")
+    logger.info(f"✅ Filtered to {len(parsed_jobs)} jobs")
+    
+    return parsed_jobs
 
 
 def _is_truly_remote(job: Dict) -> bool:
@@ -13,6 +13,7 @@ from typing import List, Dict
 from bs4 import BeautifulSoup
 import logging
 
+from src.core.metrics import JOB_SOURCE_FAILURES, JOB_SOURCE_SECONDS, timed
 from src.services.matching import calculate_match_score
 
 logger = logging.getLogger(__name__)
@@ -31,10 +32,14 @@ def search_jobs_turkey(query: str, city: str, num_results: int) -> List[Dict]:
     
     for source_name, scrape_func in sources:
         try:
-            source_jobs = scrape_func(query, city, num_results // 2)
+            with timed(JOB_SOURCE_SECONDS, JOB_SOURCE_FAILURES, source=source_name):
+                source_jobs = scrape_func(query, city, num_results // 2)
             if source_jobs:
                 jobs.extend(source_jobs)
                 logger.info(f"✅ {source_name}: {len(source_jobs)} jobs")
+            else:
+                # Scraper'lar hata / 403'te exception yerine [] döner → boş sonuç = başarısız kaynak
+                JOB_SOURCE_FAILURES.inc(source=source_name)
         except Exception as e:
             logger.warning(f"⚠️ {source_name} failed: {e}")
     
@@ -9,24 +9,55 @@ Ana endpoint:
     - file: CV dosyası (pdf / docx / txt)
     - target_role: str (optional)
     - target_location: str (optional)
-  - Dönen JSON: CareerAnalysisResult (Pydantic model)
+    - use_llm_cache: bool (optional, default true)
+    - run_id: str (optional) — hata almış bir run'ı kaldığı yerden sürdürmek için
+  - Dönen JSON: CareerAnalysisResult (Pydantic model), header X-Run-ID
+  - Hata: 500, detail = {"error", "run_id"} → aynı run_id ile tekrar dene
+
+- POST /analyze-cv/stream
+  - Aynı form alanları
+  - text/event-stream (SSE): her node bitince "node" event'i
+    (ilk ATS score, critic kararı, ...), en sonda "result" event'i
+    (CareerAnalysisResult). Hata olursa "error" event'i.
+
+- GET /metrics
+  - Prometheus text formatı: node / parser / job source latency
+    histogram'ları, token / retry / cache / hata sayaçları,
+    LLM rate limit kuyruk derinliği + bekleme süresi
 """
 
-import os
-import tempfile
-from typing import Annotated
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
-from src.services.career_services import run_career_analysis_structured
+from src.graph.checkpoint import RunInputMismatch, new_run_id
+from src.services.career_services import (
+    arun_career_analysis_structured,
+    astream_career_analysis_structured,
+    awarm_up_pipeline,
+)
 from src.models.schemas import CareerAnalysisResult
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Graph + prompt'lar + LLM client / bu loop'un connection pool'u ilk request'ten önce hazır
+    await awarm_up_pipeline()
+    yield
+
+
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="AI Career Advisor API",
     description="Multi-agent CV analysis and job matching as an HTTP API.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -41,44 +72,81 @@ app.add_middleware(
 @app.post("/analyze-cv", response_model=CareerAnalysisResult)
 async def analyze_cv(
     file: Annotated[UploadFile, File(..., description="CV file (pdf/docx/txt)")],
+    response: Response,
     target_role: Annotated[str | None, Form()] = "",
     target_location: Annotated[str | None, Form()] = "",
+    use_llm_cache: Annotated[bool, Form()] = True,
+    run_id: Annotated[str | None, Form()] = None,
 ) -> CareerAnalysisResult:
     """
     CV dosyasını analiz eden endpoint.
 
     Streamlit arayüzüyle aynı pipeline'ı kullanır, ancak
-    sonucu JSON olarak döner.
-    """
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="CV file is required")
+    sonucu JSON olarak döner. Pipeline async çalışır; LLM çağrıları
+    beklenirken worker diğer request'lere (/health dahil) cevap verir.
 
-    ext = (file.filename.rsplit(".", 1)[-1] or "").lower()
-    if ext not in {"pdf", "docx", "txt"}:
-        raise HTTPException(status_code=400, detail="Unsupported file type")
+    Pipeline checkpoint'lenir: hata cevabındaki run_id ile tekrar
+    gönderilirse tamamlanmış node'lar (analyzer, critic, ...) tekrar çalışmaz.
+    run_id başka bir CV / rol ile gönderilirse 409.
+    """
+    ext = _validate_upload(file)
+    run_id = run_id or new_run_id()
 
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{ext}") as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        content = await file.read()
 
-        result = run_career_analysis_structured(
-            cv_file_path=tmp_path,
+        result = await arun_career_analysis_structured(
+            cv_file_path=None,
             cv_file_type=ext,
             target_role=target_role or "",
             target_location=target_location or "",
+            cv_bytes=content,
+            use_llm_cache=use_llm_cache,
+            run_id=run_id,
         )
 
+        response.headers["X-Run-ID"] = run_id
         return result
+    except RunInputMismatch as e:
+        raise HTTPException(status_code=409, detail={"error": str(e), "run_id": run_id})
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if "tmp_path" in locals() and os.path.exists(tmp_path):
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
+        raise HTTPException(status_code=500, detail={"error": str(e), "run_id": run_id})
+
+
+@app.post("/analyze-cv/stream")
+async def analyze_cv_stream(
+    file: Annotated[UploadFile, File(..., description="CV file (pdf/docx/txt)")],
+    target_role: Annotated[str | None, Form()] = "",
+    target_location: Annotated[str | None, Form()] = "",
+    use_llm_cache: Annotated[bool, Form()] = True,
+    run_id: Annotated[str | None, Form()] = None,
+) -> StreamingResponse:
+    """
+    /analyze-cv'nin Server-Sent Events versiyonu.
+
+    Pipeline bitmeden her node'un ara sonucu gönderilir; client ilk ATS
+    score'u toplam sürenin küçük bir kısmında görür. run_id "parsed"
+    event'inde döner; hata sonrası aynı run_id ile kaldığı yerden devam edilir.
+    """
+    ext = _validate_upload(file)
+    run_id = run_id or new_run_id()
+    # Dosya response başlamadan okunmalı (stream sırasında upload kapanmış olabilir)
+    content = await file.read()
+
+    events = astream_career_analysis_structured(
+        cv_file_path=None,
+        cv_file_type=ext,
+        target_role=target_role or "",
+        target_location=target_location or "",
+        cv_bytes=content,
+        use_llm_cache=use_llm_cache,
+        run_id=run_id,
+    )
+    return StreamingResponse(
+        _sse_stream(events, run_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Run-ID": run_id},
+    )
 
 
 @app.get("/health")
@@ -86,6 +154,64 @@ async def health_check() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/cache-stats")
+async def cache_stats() -> dict:
+    from src.models.llm import llm_cache_stats, llm_pool_stats
+    from src.models.rate_limiter import get_rate_limiter
+    from src.services.parse_cache import parse_cache
+
+    limiter = get_rate_limiter()
+    return {
+        "llm": llm_cache_stats(),
+        "llm_pool": llm_pool_stats(),
+        "llm_rate_limit": limiter.stats() if limiter is not None else {},
+        "parse": parse_cache.stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus scrape endpoint (node / parser / job source latency,
+    token, retry, cache ve hata sayaçları — process içi).
+    """
+    from src.core.metrics import render_metrics
+
+    # Collector'lar kaydını modül import'unda yapıyor
+    import src.models.llm  # noqa: F401
+    import src.models.rate_limiter  # noqa: F401
+    import src.services.parse_cache  # noqa: F401
+
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+# ─── Helpers ─────────────────────────────────────────────
+def _validate_upload(file: UploadFile) -> str:
+    """Dosya adı + uzantı kontrolü; uzantıyı döner."""
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="CV file is required")
+
+    ext = (file.filename.rsplit(".", 1)[-1] or "").lower()
+    if ext not in {"pdf", "docx", "txt"}:
+        raise HTTPException(status_code=400, detail="Unsupported file type")
+    return ext
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _sse_stream(events: AsyncIterator[dict], run_id: str) -> AsyncIterator[str]:
+    """Service event'lerini SSE frame'lerine çevir; hata → "error" event'i."""
+    try:
+        async for event in events:
+            yield _sse(event["event"], event["data"])
+    except Exception as e:
+        # Status code gönderildi; hata stream içinde bildirilir
+        logger.exception("❌ Streaming analysis failed")
+        yield _sse("error", {"detail": str(e), "run_id": run_id})
+
+
 if __name__ == "__main__":
     import uvicorn
 
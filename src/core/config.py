@@ -30,12 +30,64 @@ class Settings:
     # ── Application Settings ──────────────────────────
     MAX_CV_SIZE_MB:    int = int(os.getenv("MAX_CV_SIZE_MB", "5"))
     SUPPORTED_FORMATS: str = os.getenv("SUPPORTED_FORMATS", "pdf,docx,txt")
+    PDF_POOL_WORKERS:  int = int(os.getenv("PDF_POOL_WORKERS", "4"))
+    PDF_BACKEND_ORDER: str = os.getenv("PDF_BACKEND_ORDER", "pypdf2,pdfplumber")  # Hızlıdan ağıra; "raw," başa eklenirse fast path
+
+    # ── Parse Cache ───────────────────────────────────
+    PARSE_CACHE_DIR:    str = os.getenv("PARSE_CACHE_DIR", "")      # Boş = disk tier kapalı
+    PARSE_CACHE_MAX_MB: int = int(os.getenv("PARSE_CACHE_MAX_MB", "64"))
+
+    # ── Agent Pipeline ────────────────────────────────
+    RETRY_MODE: str = os.getenv("RETRY_MODE", "full")    # full: tüm analiz | delta: sadece eksikler (opt-in)
+    CHECKPOINT_PATH: str = os.getenv("CHECKPOINT_PATH", "")  # Boş = resume kapalı (state CV metnini içerir)
+    PRE_CRITIC_THRESHOLD: float = float(os.getenv("PRE_CRITIC_THRESHOLD", "0"))  # 0 = kapalı; ör. 0.85
+    SPECULATIVE_OPTIMIZER: bool = os.getenv("SPECULATIVE_OPTIMIZER", "false").lower() == "true"  # Optimizer critic ile paralel (sadece async path)
+
+    # ── LLM Client (paylaşılan httpx pool) ────────────
+    LLM_MAX_CONNECTIONS:  int = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))    # Eşzamanlı istek üst sınırı
+    LLM_MAX_KEEPALIVE:    int = int(os.getenv("LLM_MAX_KEEPALIVE", "10"))
+    LLM_KEEPALIVE_EXPIRY: float = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "120"))
+    LLM_TIMEOUT_SECONDS:  float = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))
+    LLM_WARMUP:           bool = os.getenv("LLM_WARMUP", "true").lower() == "true"
+
+    # ── LLM Rate Limit (provider RPM / TPM) ──────────
+    LLM_RATE_LIMIT_RPM:  int = int(os.getenv("LLM_RATE_LIMIT_RPM", "0"))     # 0 = limitsiz
+    LLM_RATE_LIMIT_TPM:  int = int(os.getenv("LLM_RATE_LIMIT_TPM", "0"))     # 0 = limitsiz
+    LLM_RATE_LIMIT_PATH: str = os.getenv("LLM_RATE_LIMIT_PATH", "")          # SQLite → worker'lar arası ortak limit
+
+    # ── LLM Backend (offline load test / benchmark) ───
+    LLM_BACKEND:      str = os.getenv("LLM_BACKEND", "openai")                  # openai | fake | record | replay
+    LLM_FAKE_LATENCY: str = os.getenv("LLM_FAKE_LATENCY", "lognormal:1500:0.4")  # fixed:MS | uniform:MIN:MAX | normal:MEAN:STD | lognormal:MEDIAN:SIGMA | recorded
+    LLM_FAKE_SEED:    int = int(os.getenv("LLM_FAKE_SEED", "0"))                 # Aynı seed → aynı gecikme dizisi
+    LLM_FIXTURES_DIR: str = os.getenv("LLM_FIXTURES_DIR", ".cache/llm_fixtures") # record yazar, replay okur
+
+    # ── LLM Response Cache ────────────────────────────
+    LLM_CACHE_PATH:        str = os.getenv("LLM_CACHE_PATH", "")    # Boş = kapalı; ör. .cache/llm_cache.sqlite (CV text'i diske yazılır)
+    LLM_CACHE_TTL_HOURS:   float = float(os.getenv("LLM_CACHE_TTL_HOURS", "168"))        # 0 = süresiz
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))         # 0 = limitsiz
 
     # ── Validation ────────────────────────────────────
     @property
     def openai_ok(self) -> bool:
         return bool(self.OPENAI_API_KEY)
 
+    @property
+    def llm_backend(self) -> str:
+        return self.LLM_BACKEND.strip().lower()
+
+    @property
+    def llm_offline(self) -> bool:
+        """fake / replay: API key ve ağ gerekmez."""
+        return self.llm_backend in ("fake", "replay")
+
+    @property
+    def llm_ok(self) -> bool:
+        return self.llm_offline or self.openai_ok
+
+    @property
+    def rate_limit_enabled(self) -> bool:
+        return self.LLM_RATE_LIMIT_RPM > 0 or self.LLM_RATE_LIMIT_TPM > 0
+
     @property
     def langsmith_ok(self) -> bool:
         return bool(self.LANGSMITH_API_KEY)
@@ -48,6 +100,18 @@ class Settings:
     def supported_formats_list(self) -> list[str]:
         return [fmt.strip() for fmt in self.SUPPORTED_FORMATS.split(",")]
 
+    @property
+    def delta_retry(self) -> bool:
+        return self.RETRY_MODE.strip().lower() == "delta"
+
+    @property
+    def pre_critic_enabled(self) -> bool:
+        return 0 < self.PRE_CRITIC_THRESHOLD <= 1
+
+    @property
+    def pdf_backend_order(self) -> list[str]:
+        return [name.strip() for name in self.PDF_BACKEND_ORDER.split(",") if name.strip()]
+
 
 # ─── Singleton ───────────────────────────────────────────
 settings = Settings()
\ No newline at end of file
@@ -16,12 +16,37 @@ if QUICK_TEST_MODE:
 else:
     MAX_CV_CHARS: int = 50_000      # Normal: 50k char
 
+# ─── PDF Extraction ──────────────────────────────────────
+PDF_PARALLEL_MIN_PAGES: int = 12   # Altında serial extract (IPC maliyeti değmez)
+PDF_PAGES_PER_CHUNK: int = 4       # Process pool'a giden her işteki sayfa sayısı
+PDF_MIN_ALPHA_RATIO: float = 0.5   # Altındaki backend çıktısı "bozuk" sayılır → fallback
+
+# ─── Parse Cache ─────────────────────────────────────────
+PARSE_CACHE_MEMORY_ITEMS: int = 128  # Memory LRU tier'ında tutulan parse sonucu
+
+# ─── Corpus Ingestion ────────────────────────────────────
+INGEST_INFLIGHT_PER_WORKER: int = 4  # Worker başına kuyrukta bekleyen dosya (memory sınırı)
+
 # ─── Agent Pipeline ─────────────────────────────────────
 MAX_CRITIC_RETRIES: int = 1 if QUICK_TEST_MODE else 2
 
+# ─── Pre-Critic Gate (kural tabanlı, LLM'siz) ───────────
+PRE_CRITIC_MIN_ISSUES: int = 3              # Analyzer prompt'u: en az 3, en fazla 10 issue
+PRE_CRITIC_MAX_ISSUES: int = 10
+PRE_CRITIC_CHARS_PER_ISSUE: int = 2_500     # Uzun CV → daha fazla issue beklenir
+PRE_CRITIC_REQUIRED_CATEGORIES: tuple[str, ...] = ("ATS", "Content", "Structure")
+PRE_CRITIC_SEVERITY_PENALTY: dict[str, int] = {"critical": 15, "warning": 6, "info": 2}
+PRE_CRITIC_ATS_TOLERANCE: int = 25          # ATS score ile severity'den beklenen skor farkı
+
 # ─── LLM ─────────────────────────────────────────────────
 DEFAULT_MODEL: str = "gpt-4o-mini"
 DEFAULT_TEMPERATURE: float = 0.2  # Düşük = tutarlı analiz
+RATE_LIMIT_CHARS_PER_TOKEN: int = 4    # TPM tahmini (provider da karakterden tahmin eder)
+RATE_LIMIT_OUTPUT_TOKENS: int = 1_000  # max_tokens yoksa beklenen output; cevapta gerçek usage ile düzeltilir
+
+# ─── Metrics ─────────────────────────────────────────────
+# Histogram bucket'ları (saniye): parse ~ms, LLM çağrısı ~sn, scraper ~10 sn
+METRICS_LATENCY_BUCKETS: tuple[float, ...] = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
 
 # ─── ATS Scoring ─────────────────────────────────────────
 MIN_ATS_SCORE: int = 60        # Minimum kabul edilebilir
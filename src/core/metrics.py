@@ -0,0 +1,281 @@
+"""
+metrics.py
+──────────
+Process içi metrikler (harici servis / prometheus_client gerekmez).
+
+- Counter:   monoton artan sayaç (token, retry, hata, ...)
+- Histogram: sabit bucket'lı latency dağılımı (p95 Prometheus'ta
+             histogram_quantile ile hesaplanır)
+- Collector: scrape anında okunan sayaçlar (cache / pool stats'ları
+             zaten kendi sayaçlarını tutuyor, burada kopyalanmaz)
+
+render_metrics() → Prometheus text exposition formatı (/metrics endpoint'i).
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.constants import METRICS_LATENCY_BUCKETS
+
+# (metric adı, tip, açıklama, label'lar, değer)
+Sample = Tuple[str, str, str, Dict[str, str], float]
+
+_LabelKey = Tuple[str, ...]
+
+
+class Counter:
+    """Label'lı monoton sayaç."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[_LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = _label_key(self.labels, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(_label_key(self.labels, labels), 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram:
+    """Label'lı, kümülatif bucket'lı histogram (Prometheus semantiği)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = METRICS_LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # key → [bucket sayıları..., count, sum]
+        self._values: Dict[_LabelKey, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(self.labels, labels)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0] * len(self.buckets) + [0, 0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += 1
+            row[-1] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            row = self._values.get(_label_key(self.labels, labels))
+            return int(row[-2]) if row else 0
+
+    def quantile(self, q: float, **labels: str) -> Optional[float]:
+        """Bucket üst sınırından kaba quantile (debug / test için)."""
+        with self._lock:
+            row = self._values.get(_label_key(self.labels, labels))
+            if not row or not row[-2]:
+                return None
+            target = q * row[-2]
+            for bound, cumulative in zip(self.buckets, row):
+                if cumulative >= target:
+                    return bound
+            return float("inf")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(row)) for key, row in self._values.items())
+
+        out = []
+        for key, row in items:
+            for bound, cumulative in zip(self.buckets, row):
+                le = _format_labels(self.labels + ("le",), key + (_format_value(bound),))
+                out.append(f"{self.name}_bucket{le} {int(cumulative)}")
+            inf = _format_labels(self.labels + ("le",), key + ("+Inf",))
+            out.append(f"{self.name}_bucket{inf} {int(row[-2])}")
+            out.append(f"{self.name}_count{_format_labels(self.labels, key)} {int(row[-2])}")
+            out.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(row[-1])}")
+        return out
+
+
+class MetricsRegistry:
+    """Metrik + collector kaydı; aynı isim tekrar istenirse aynı nesne döner."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labels: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labels)
+
+    def histogram(self, name: str, help: str, labels: Iterable[str] = (), **kwargs) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labels, **kwargs)
+
+    def register_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Scrape anında çağrılır; (name, type, help, labels, value) üretir."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def reset(self) -> None:
+        """Tüm sayaçları sıfırla (testler için; collector'lar kalır)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def render(self) -> str:
+        """Prometheus text exposition formatı (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+            collectors = list(self._collectors)
+
+        out: List[str] = []
+        for metric in metrics:
+            out.append(f"# HELP {metric.name} {metric.help}")
+            out.append(f"# TYPE {metric.name} {metric.kind}")
+            out.extend(metric.lines())
+
+        described = set()
+        for collector in collectors:
+            try:
+                samples = list(collector())
+            except Exception:
+                # Kapalı / bozuk bir cache scrape'i düşürmemeli
+                continue
+            for name, kind, help, labels, value in samples:
+                if name not in described:
+                    out.append(f"# HELP {name} {help}")
+                    out.append(f"# TYPE {name} {kind}")
+                    described.add(name)
+                names = tuple(labels)
+                out.append(f"{name}{_format_labels(names, tuple(labels[n] for n in names))} {_format_value(value)}")
+
+        return "\n".join(out) + "\n"
+
+    def _get_or_create(self, cls, name, help, labels, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labels, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric '{name}' already registered as {metric.kind}")
+            return metric
+
+
+REGISTRY = MetricsRegistry()
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
+
+
+@contextmanager
+def timed(histogram: Histogram, errors: Optional[Counter] = None, **labels: str) -> Iterator[None]:
+    """Bloğun süresini histogram'a yaz; exception olursa errors sayacını artır (re-raise)."""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        if errors is not None:
+            errors.inc(**labels)
+        raise
+    finally:
+        histogram.observe(time.perf_counter() - started, **labels)
+
+
+# ─── Pipeline Metrikleri ─────────────────────────────────
+NODE_SECONDS = REGISTRY.histogram(
+    "career_node_duration_seconds", "Graph node latency", ["node"],
+)
+NODE_ERRORS = REGISTRY.counter(
+    "career_node_errors_total", "Graph node exceptions", ["node"],
+)
+LLM_TOKENS = REGISTRY.counter(
+    "career_llm_tokens_total", "LLM tokens per node (kind: input/output/cached)", ["node", "kind"],
+)
+LLM_RATE_LIMIT_WAIT_SECONDS = REGISTRY.histogram(
+    "career_llm_rate_limit_wait_seconds", "Time LLM calls waited for rate limit (RPM/TPM) capacity",
+)
+PIPELINE_RETRIES = REGISTRY.counter(
+    "career_critic_retries_total", "Critic -> Analyzer retry loops",
+)
+PRE_CRITIC_DECISIONS = REGISTRY.counter(
+    "career_pre_critic_decisions_total",
+    "Rule-based gate decisions (approve/reject avoid an LLM critic call, defer does not)", ["decision"],
+)
+SPECULATIONS = REGISTRY.counter(
+    "career_speculative_optimizer_total", "Speculative optimizer runs (result: hit/miss/error)", ["result"],
+)
+SPECULATION_SAVED_SECONDS = REGISTRY.counter(
+    "career_speculative_saved_seconds_total", "Latency saved by speculative optimizer hits",
+)
+SPECULATION_WASTED_TOKENS = REGISTRY.counter(
+    "career_speculative_wasted_tokens_total", "Tokens spent on discarded speculative optimizer calls",
+)
+CV_PARSE_SECONDS = REGISTRY.histogram(
+    "career_cv_parse_duration_seconds", "CV parse latency (cache miss)", ["file_type"],
+)
+CV_PARSE_ERRORS = REGISTRY.counter(
+    "career_cv_parse_errors_total", "CV parse failures", ["file_type"],
+)
+JOB_SOURCE_SECONDS = REGISTRY.histogram(
+    "career_job_source_duration_seconds", "Job source (API / scraper) latency", ["source"],
+)
+JOB_SOURCE_FAILURES = REGISTRY.counter(
+    "career_job_source_failures_total", "Job source (API / scraper) failures", ["source"],
+)
+
+
+# ─── Helpers ─────────────────────────────────────────────
+def _label_key(names: Tuple[str, ...], labels: Dict[str, str]) -> _LabelKey:
+    if set(labels) != set(names):
+        raise ValueError(f"Expected labels {names}, got {tuple(labels)}")
+    return tuple(str(labels[name]) for name in names)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
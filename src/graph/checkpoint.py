@@ -0,0 +1,171 @@
+"""
+checkpoint.py
+-------------
+Pipeline checkpoint'leri (SQLite) + run_id ile kaldığı yerden devam.
+
+Her node (superstep) bitince state CHECKPOINT_PATH'teki SQLite'a yazılır,
+thread_id = run_id. Optimizer timeout'u / JSearch 429 gibi bir hatada aynı
+run_id ile tekrar çalıştırınca graph son tamamlanan node'dan devam eder;
+analyzer / critic tekrar ödenmez. Başarıyla biten run'ın checkpoint'leri silinir.
+Resume sadece aynı girdiyle (cv_text, target_role, target_location) yapılır;
+başka bir CV ile gelen run_id reddedilir (RunInputMismatch).
+
+Graph process başına bir kez compile edilip hem sync (Streamlit) hem async
+(FastAPI) çalıştırıldığı için tek bir saver ikisine de hizmet etmeli:
+SqliteSaver sync + lock'lu, async metodları burada worker thread'e devredilir
+(AsyncSqliteSaver tek event loop'a bağlı kalırdı).
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import uuid
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from langgraph.checkpoint.sqlite import SqliteSaver
+    from langgraph.graph.state import CompiledStateGraph
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _threaded_saver_class() -> type:
+    """SqliteSaver + async API (langgraph import'u ilk kullanımda)."""
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    class ThreadedSqliteSaver(SqliteSaver):
+        # Sync metodlar SqliteSaver'ın lock'u altında; async'ler worker thread'de çalışır
+
+        async def aget_tuple(self, config):
+            return await asyncio.to_thread(self.get_tuple, config)
+
+        async def alist(self, config, *, filter=None, before=None, limit=None):
+            items = await asyncio.to_thread(
+                lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+            )
+            for item in items:
+                yield item
+
+        async def aput(self, config, checkpoint, metadata, new_versions):
+            return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+        async def aput_writes(self, config, writes, task_id, task_path=""):
+            return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+        async def adelete_thread(self, thread_id):
+            return await asyncio.to_thread(self.delete_thread, thread_id)
+
+        async def aget_delta_channel_history(self, *, config, channels):
+            return await asyncio.to_thread(self.get_delta_channel_history, config=config, channels=channels)
+
+    return ThreadedSqliteSaver
+
+
+def open_checkpointer(path: str) -> "SqliteSaver":
+    """Verilen SQLite dosyası için (sync + async) saver; tablolar ilk kullanımda oluşur."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Saver kendi lock'unu kullanıyor → connection thread'ler arasında paylaşılabilir
+    return _threaded_saver_class()(sqlite3.connect(path, check_same_thread=False))
+
+
+@lru_cache(maxsize=None)
+def get_checkpointer() -> Optional["SqliteSaver"]:
+    """Process genelinde tek saver (CHECKPOINT_PATH boşsa None → checkpoint yok)."""
+    if not settings.CHECKPOINT_PATH:
+        return None
+    return open_checkpointer(settings.CHECKPOINT_PATH)
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex
+
+
+# ─── Resume ──────────────────────────────────────────────
+_INPUT_KEYS = ("cv_text", "target_role", "target_location")
+
+
+class RunInputMismatch(ValueError):
+    """run_id'nin checkpoint'i farklı bir CV / rol / lokasyon için alınmış."""
+
+
+def input_fingerprint(state: dict) -> str:
+    """Run'ı tanımlayan girdilerin hash'i."""
+    payload = "\x00".join(str(state.get(key, "")) for key in _INPUT_KEYS)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def run_config(run_id: str) -> dict:
+    """Checkpoint'lerin run_id'ye bağlandığı config parçası."""
+    return {"configurable": {"thread_id": run_id}}
+
+
+def pipeline_input(pipeline: "CompiledStateGraph", config: dict, initial_state: dict) -> Optional[dict]:
+    """
+    Graph'e verilecek input.
+
+    Returns:
+        None          → run_id için yarım kalmış checkpoint var, kaldığı yerden devam
+        initial_state → yeni run (checkpointer yoksa her zaman)
+
+    Raises:
+        RunInputMismatch: Yarım kalmış run başka bir girdiyle başlatılmış
+    """
+    if pipeline.checkpointer is None:
+        return initial_state
+
+    snapshot = pipeline.get_state(config)
+    if snapshot.next:
+        _check_resume(config, snapshot, initial_state)
+        return None
+    if snapshot.values:
+        # Tamamlanmış ama silinmemiş eski run → reducer'lar (trace_log) üstüne eklemesin
+        pipeline.checkpointer.delete_thread(_thread_id(config))
+    return initial_state
+
+
+async def apipeline_input(pipeline: "CompiledStateGraph", config: dict, initial_state: dict) -> Optional[dict]:
+    """pipeline_input'un async versiyonu."""
+    if pipeline.checkpointer is None:
+        return initial_state
+
+    snapshot = await pipeline.aget_state(config)
+    if snapshot.next:
+        _check_resume(config, snapshot, initial_state)
+        return None
+    if snapshot.values:
+        await pipeline.checkpointer.adelete_thread(_thread_id(config))
+    return initial_state
+
+
+def finish_run(pipeline: "CompiledStateGraph", config: dict) -> None:
+    """Başarıyla biten run'ın checkpoint'lerini sil (DB sadece yarım run'ları tutar)."""
+    if pipeline.checkpointer is not None:
+        pipeline.checkpointer.delete_thread(_thread_id(config))
+
+
+async def afinish_run(pipeline: "CompiledStateGraph", config: dict) -> None:
+    """finish_run'ın async versiyonu."""
+    if pipeline.checkpointer is not None:
+        await pipeline.checkpointer.adelete_thread(_thread_id(config))
+
+
+def _check_resume(config: dict, snapshot, initial_state: dict) -> None:
+    # Checkpoint'teki state girdileri içerir → ayrıca hash saklamaya gerek yok
+    if input_fingerprint(snapshot.values) != input_fingerprint(initial_state):
+        raise RunInputMismatch(
+            f"Run {_thread_id(config)} was started with a different CV / target role / location; "
+            "omit run_id to start a new analysis"
+        )
+    logger.info(f"♻️ Resuming run {_thread_id(config)} at: {', '.join(snapshot.next)}")
+
+
+def _thread_id(config: dict) -> str:
+    return config["configurable"]["thread_id"]
@@ -4,48 +4,118 @@ graph.py
 LangGraph StateGraph'i build ve compile eder.
 
 Topology:
-    START -> analyzer -> critic --(retry)--> retry_node -> analyzer  (loop)
-                            |
-                            +-----------(optimizer)---> optimizer -> END
+    START -> analyzer -> pre_critic --(belirsiz)--> critic --(retry)--> retry_node -> analyzer  (loop)
+      |                      |                        |
+      |                      +--(approve/reject)------+-----(optimizer)---> optimizer --+
+      |                                                                                  +--> job_hunter -> END
+      +---> job_fetch (ilanlar, analyzer ile paralel) -----------------------------------+
+
+pre_critic: kural tabanlı gate (PRE_CRITIC_THRESHOLD); emin olduğunda LLM
+critic'i atlar, kararı critic_router'dan geçer.
+
+SPECULATIVE_OPTIMIZER açıksa async critic, optimizer'ı kendi LLM çağrısına
+paralel başlatır; temiz onayda optimizer node'u hazır sonucu kullanır (topoloji aynı).
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
-
-from langgraph.graph import StateGraph, END
+import functools
+import threading
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 if TYPE_CHECKING:
+    from langgraph.checkpoint.base import BaseCheckpointSaver
     from langgraph.graph.state import CompiledStateGraph
 
+from src.core.metrics import LLM_TOKENS, NODE_ERRORS, NODE_SECONDS, timed
 from src.graph.state import CareerPipelineState
-from src.graph.nodes.cv_analyzer import cv_analyzer_node
-from src.graph.nodes.cv_critic import cv_critic_node
-from src.graph.nodes.cv_optimizer import cv_optimizer_node
-from src.graph.nodes.job_hunter import job_hunter_node  # EKLE!
+from src.graph.nodes.cv_analyzer import cv_analyzer_node, acv_analyzer_node
+from src.graph.nodes.cv_critic import cv_critic_node, acv_critic_node
+from src.graph.nodes.cv_optimizer import cv_optimizer_node, acv_optimizer_node
+from src.graph.nodes.job_hunter import job_fetch_node, ajob_fetch_node, job_hunter_node
+from src.graph.nodes.pre_critic import pre_critic_node
 from src.graph.nodes.retry import retry_node
-from src.graph.router import critic_router
+from src.graph.router import critic_router, pre_critic_router
+
+
+# ─── Process-level Graph ─────────────────────────────────
+_GRAPH: Optional["CompiledStateGraph"] = None
+_GRAPH_LOCK = threading.Lock()
+
+
+def get_graph() -> "CompiledStateGraph":
+    """
+    Process başına BİR KEZ compile edilen graph (thread-safe).
+
+    Compiled graph stateless'tır (state her invoke'a ait); tüm request'ler
+    aynı instance'ı paylaşır — her request'te StateGraph kurup compile
+    etmeye gerek yok. CHECKPOINT_PATH açıksa SQLite checkpointer bağlıdır;
+    o durumda her çalıştırma config'te thread_id (run_id) vermeli.
+    """
+    global _GRAPH
+    graph = _GRAPH
+    if graph is None:
+        with _GRAPH_LOCK:
+            if _GRAPH is None:
+                from src.graph.checkpoint import get_checkpointer
+
+                _GRAPH = build_graph(checkpointer=get_checkpointer())
+            graph = _GRAPH
+    return graph
 
 
-def build_graph() -> "CompiledStateGraph":
+def reset_graph() -> None:
+    """Cache'lenen graph'i at; sonraki get_graph() yeniden compile eder (testler için)."""
+    global _GRAPH
+    with _GRAPH_LOCK:
+        _GRAPH = None
+
+
+def build_graph(checkpointer: Optional["BaseCheckpointSaver"] = None) -> "CompiledStateGraph":
     """
-    Graph'i oluştur ve compile et.
+    Graph'i oluştur ve compile et (her çağrıda yeni instance — normalde get_graph() kullan).
+
+    Args:
+        checkpointer: Verilirse her superstep sonrası state kaydedilir;
+                      hata sonrası aynı thread_id ile kaldığı yerden devam edilir.
 
     Returns:
-        Compiled LangGraph — .invoke() ile çalıştırılır.
+        Compiled LangGraph — .invoke() (sync node'lar) veya
+        .ainvoke() (async node'lar, event loop bloklanmaz) ile çalıştırılır.
     """
+    # langgraph import'u ~1-2 sn: modül import'unda değil, graph kurulurken
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.graph import StateGraph, END
+
+    def node(name, func, afunc):
+        # invoke → func, ainvoke → afunc (ikisi de metrik ölçümlü)
+        return RunnableLambda(_timed(name, func), afunc=_atimed(name, afunc), name=name)
+
     graph = StateGraph(CareerPipelineState)
 
     # ── Nodes ──────────────────────────────────────────
-    graph.add_node("cv_analyzer",  cv_analyzer_node)
-    graph.add_node("cv_critic",    cv_critic_node)
-    graph.add_node("retry",        retry_node)
-    graph.add_node("cv_optimizer", cv_optimizer_node)
-    graph.add_node("job_hunter",   job_hunter_node)
+    graph.add_node("cv_analyzer",  node("cv_analyzer",  cv_analyzer_node,  acv_analyzer_node))
+    graph.add_node("pre_critic",   _timed("pre_critic", pre_critic_node))   # Kural tabanlı (CPU)
+    graph.add_node("cv_critic",    node("cv_critic",    cv_critic_node,    acv_critic_node))
+    graph.add_node("retry",        _timed("retry", retry_node))
+    graph.add_node("cv_optimizer", node("cv_optimizer", cv_optimizer_node, acv_optimizer_node))
+    graph.add_node("job_fetch",    node("job_fetch",    job_fetch_node,    ajob_fetch_node))
+    graph.add_node("job_hunter",   _timed("job_hunter", job_hunter_node))   # Sadece skorlama (CPU)
 
     # ── Edges ──────────────────────────────────────────
     graph.set_entry_point("cv_analyzer")                # START -> analyzer
+    graph.set_entry_point("job_fetch")                  # START -> job_fetch (paralel fan-out)
 
-    graph.add_edge("cv_analyzer", "cv_critic")          # analyzer -> critic (her zaman)
+    graph.add_edge("cv_analyzer", "pre_critic")         # analyzer -> gate (her zaman)
+
+    graph.add_conditional_edges(                        # gate -> critic veya doğrudan karar
+        "pre_critic",
+        pre_critic_router,
+        {
+            "critic":    "cv_critic",                   # gate emin değil
+            "retry":     "retry",                       # gate reddetti + retry left
+            "optimizer": "cv_optimizer",                # gate onayladı OR max retry
+        },
+    )
 
     graph.add_conditional_edges(                        # critic -> router karar
         "cv_critic",
@@ -57,7 +127,42 @@ def build_graph() -> "CompiledStateGraph":
     )
 
     graph.add_edge("retry", "cv_analyzer")              # retry -> analyzer (loop back)
-    graph.add_edge("cv_optimizer", "job_hunter")  # EKLE!
-    graph.add_edge("job_hunter", END)              # EKLE!                 # optimizer -> END
+    graph.add_edge(["cv_optimizer", "job_fetch"], "job_hunter")  # ikisi de bitince skorla
+    graph.add_edge("job_hunter", END)                             # job_hunter -> END
+
+    return graph.compile(checkpointer=checkpointer)
+
+
+# ─── Metrics ─────────────────────────────────────────────
+NodeFunc = Callable[[CareerPipelineState], dict]
+
+
+def _timed(name: str, func: NodeFunc) -> NodeFunc:
+    """Node süresi / hatası / token kullanımı → src.core.metrics."""
+    @functools.wraps(func)
+    def wrapper(state: CareerPipelineState) -> dict:
+        with timed(NODE_SECONDS, NODE_ERRORS, node=name):
+            update = func(state)
+        _record_tokens(name, update)
+        return update
+    return wrapper
+
+
+def _atimed(name: str, afunc: Callable[[CareerPipelineState], Awaitable[dict]]):
+    @functools.wraps(afunc)
+    async def wrapper(state: CareerPipelineState) -> dict:
+        with timed(NODE_SECONDS, NODE_ERRORS, node=name):
+            update = await afunc(state)
+        _record_tokens(name, update)
+        return update
+    return wrapper
+
 
-    return graph.compile()
+def _record_tokens(name: str, update: dict | None) -> None:
+    # LLM node'ları token kullanımını trace_log'a yazıyor (src/graph/messages.py)
+    for entry in (update or {}).get("trace_log", []):
+        tokens = entry.get("tokens")
+        if not tokens:
+            continue
+        for kind in ("input", "output", "cached"):
+            LLM_TOKENS.inc(tokens.get(kind, 0), node=name, kind=kind)
@@ -6,33 +6,30 @@ CV'yi okur, ATS score verir, skill gap ve issues tespit eder.
 Retry logic:
   - retry_count == 0 → fresh analiz
   - retry_count > 0  → Critic'in missed_issues feedback'ini dahil et
+      RETRY_MODE=full  → tüm analiz baştan yazılır (default)
+      RETRY_MODE=delta → sadece eksikler üretilir, önceki analize local merge edilir (opt-in)
 """
 
-from src.graph.state import CareerPipelineState
-from src.models.llm import get_llm
-from src.services.prompt_loader import load_prompt
+import json
+import logging
 
+from src.core.config import settings
+from src.graph.messages import build_messages, token_usage
+from src.graph.state import CareerPipelineState
+from src.models.llm import get_json_llm
+from src.utils.parser import merge_analysis_delta, parse_agent_output
 
-# ── İlk analiz (retry yok) ──────────────────────────────
-_TEMPLATE_FRESH = """Analiz edilecek CV:
+logger = logging.getLogger(__name__)
 
-{cv_text}
 
-{role_context}
+# CV + hedef rol ortak prefix'te (src/graph/messages.py); burada sadece görev var.
 
-Lütfen yukarıdaki CV'yi detaylı analiz et ve JSON formatında döndür."""
+# ── İlk analiz (retry yok) ──────────────────────────────
+_TEMPLATE_FRESH = """Lütfen yukarıdaki CV'yi detaylı analiz et ve JSON formatında döndür."""
 
 
 # ── Retry analiz (Critic feedback dahil) ─────────────────
-_TEMPLATE_RETRY = """Analiz edilecek CV:
-
-{cv_text}
-
-{role_context}
-
-─────────────────────────
-
-⚠️ ÖNCEKİ ANALİZİN EKSİK KALDI!
+_TEMPLATE_RETRY = """⚠️ ÖNCEKİ ANALİZİN EKSİK KALDI!
 
 Critic'in tespit ettiği EKSIK sorunlar:
 
@@ -56,56 +53,118 @@ Lütfen KAPSAMLI ve TAM bir analiz yap.
 JSON formatında döndür."""
 
 
+# ── Delta retry (sadece eksikler) ────────────────────────
+_TEMPLATE_DELTA = """⚠️ ÖNCEKİ ANALİZİN EKSİK KALDI! (DELTA MODU)
+
+Critic'in tespit ettiği EKSIK sorunlar:
+
+{critic_missed_issues}
+
+─────────────────────────
+
+📋 Önceki analizinde ZATEN OLAN sorunlar (tekrar yazma):
+
+{existing_issues}
+
+─────────────────────────
+
+GÖREV:
+1. Analizi baştan YAZMA — sadece Critic'in belirttiği eksikler için yeni issue üret
+2. Gerekiyorsa yeni skill gap ekle
+3. ATS score değişmeliyse yeni değeri yaz, değişmiyorsa null bırak
+
+Çıktı formatı (JSON, issue / skill gap formatı normal analizle aynı):
+{{
+  "cv_analysis_delta": {{
+    "ats_score": null,
+    "added_issues": [],
+    "added_skill_gaps": []
+  }}
+}}
+
+SADECE JSON çıkar."""
+
+
 def cv_analyzer_node(state: CareerPipelineState) -> dict:
     """
     Agent A: CV Analyzer node.
     - retry_count == 0 → fresh analiz
     - retry_count > 0  → Critic feedback ile retry analiz
     """
-    llm           = get_llm()
-    system_prompt = load_prompt("cv_analyzer")
-    
-    # Role context (optional)
-    role_context = ""
-    if state.get("target_role"):
-        role_context = f"\n**Hedef Pozisyon:** {state['target_role']}\n"
+    messages = _build_messages(state)
+    response = get_json_llm().invoke(messages)
+    return _to_update(state, response, messages)
+
+
+async def acv_analyzer_node(state: CareerPipelineState) -> dict:
+    """cv_analyzer_node'un async versiyonu (event loop'u bloklamaz)."""
+    messages = _build_messages(state)
+    response = await get_json_llm().ainvoke(messages)
+    return _to_update(state, response, messages)
 
+
+def _build_messages(state: CareerPipelineState) -> list[dict]:
     if state["retry_count"] == 0:
         # ── Fresh analiz ──────────────────────────────
-        user_message = _TEMPLATE_FRESH.format(
-            cv_text=state["cv_text"],
-            role_context=role_context
-        )
+        task = _TEMPLATE_FRESH
     else:
         # ── Retry: Critic feedback dahil ──────────────
-        import json
-        from src.utils.parser import safe_json_parse
-        
-        critic_data = safe_json_parse(state["critic_output"])
-        missed_issues = critic_data.get("critic_review", {}).get("missed_issues", [])
+        missed_issues = state["critic_output"].get("critic_review", {}).get("missed_issues", [])
         
         # Sadece eksik sorunları JSON string yap
         missed_str = json.dumps(missed_issues, ensure_ascii=False, indent=2)
         
-        user_message = _TEMPLATE_RETRY.format(
-            cv_text=state["cv_text"],
-            role_context=role_context,
-            critic_missed_issues=missed_str,
-            previous_analyzer_output=state["analyzer_output"][:2000],  # İlk 2k char
-        )
-
-    response = llm.invoke([
-        {"role": "system", "content": system_prompt},
-        {"role": "user",   "content": user_message},
-    ])
+        if settings.delta_retry:
+            task = _TEMPLATE_DELTA.format(
+                critic_missed_issues=missed_str,
+                existing_issues=_issue_digest(state["analyzer_output"]),
+            )
+        else:
+            task = _TEMPLATE_RETRY.format(
+                critic_missed_issues=missed_str,
+                previous_analyzer_output=json.dumps(
+                    state["analyzer_output"], ensure_ascii=False, indent=2
+                )[:2000],  # İlk 2k char
+            )
+
+    return build_messages(state, "cv_analyzer", task)
+
+
+def _issue_digest(analyzer_output: dict) -> str:
+    """Önceki issue'ların kısa listesi — tüm analizi tekrar göndermek yerine."""
+    issues = analyzer_output.get("cv_analysis", {}).get("issues", [])
+    lines = [f"- [{issue.get('category', '?')}] {issue.get('description', '')}" for issue in issues]
+    return "\n".join(lines) or "(yok)"
+
+
+def _to_update(state: CareerPipelineState, response, messages: list[dict]) -> dict:
+    content = response.content
+    is_delta = state["retry_count"] > 0 and settings.delta_retry
+
+    if not is_delta:
+        update = {"analyzer_output": parse_agent_output(content, "cv_analysis"), "analyzer_delta": {}}
+    else:
+        try:
+            delta = parse_agent_output(content, "cv_analysis_delta")
+            update = {
+                "analyzer_output": merge_analysis_delta(state["analyzer_output"], delta),
+                "analyzer_delta":  delta,
+            }
+        except ValueError as e:
+            # Delta okunamadı → önceki analizi koru, critic full review yapsın
+            logger.warning(f"⚠️ Analyzer delta unparseable, keeping previous analysis: {e}")
+            update = {"analyzer_output": state["analyzer_output"], "analyzer_delta": {}}
 
     return {
-        "analyzer_output": response.content,
+        **update,
+        "raw_outputs": {"cv_analyzer": content},
         "trace_log": [{
             "agent":           "CV Analyzer",
             "step":            "analysis_complete",
             "retry_iteration": state["retry_count"],
             "is_retry":        state["retry_count"] > 0,
-            "output_preview":  response.content[:400],
+            "retry_mode":      "delta" if is_delta else "full",
+            "tokens":          token_usage(response, messages),
+            "output_preview":  content[:400],
         }],
-    }
\ No newline at end of file
+    }
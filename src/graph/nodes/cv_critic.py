@@ -2,53 +2,199 @@
 cv_critic.py - Agent B: CV Critic
 ----------------------------------
 Analyzer çıktısını denetler.
+
+Delta retry'da (analyzer_delta dolu) tüm analizi değil, sadece
+Analyzer'ın son turda eklediklerini önceki missed_issues'a karşı denetler.
+
+SPECULATIVE_OPTIMIZER açıksa optimizer, Analyzer'ın sorunlarıyla critic'e
+PARALEL başlatılır. Critic missed_issues'sız onaylarsa (sık görülen durum)
+sonuç state'e yazılır ve optimizer node'u LLM çağırmaz; aksi halde
+speculative task iptal edilir (HTTP isteği kesilir), normal yol çalışır.
+Atılan çağrının token'ları career_speculative_wasted_tokens_total'a ve
+trace_log'a yazılır.
+
+Sadece async path'te (FastAPI, .ainvoke / .astream): sync node'da çalışan
+bir thread'deki çağrı iptal edilemez, her miss tam bir optimizer çağrısı
+kadar token yakardı → sync path (Streamlit) flag'i yok sayar.
 """
 
+import asyncio
+import json
+import logging
+import time
+
+from src.core.config import settings
+from src.core.metrics import SPECULATION_SAVED_SECONDS, SPECULATION_WASTED_TOKENS, SPECULATIONS
+from src.graph.messages import build_messages, count_tokens, token_usage
+from src.graph.nodes import cv_optimizer
 from src.graph.state import CareerPipelineState
-from src.models.llm import get_llm
-from src.services.prompt_loader import load_prompt
-from src.utils.parser import safe_json_parse
+from src.models.llm import get_json_llm
+from src.utils.parser import parse_agent_output
+
+logger = logging.getLogger(__name__)
+
+
+# Orijinal CV ortak prefix'te (src/graph/messages.py)
+_USER_TEMPLATE = """Agent A (CV Analyzer) çıktığı analiz:
+
+{analyzer_output}
+
+Lütfen yukarıdaki CV'ye göre bu analizi denet ve JSON formatında döndür."""
 
 
-_USER_TEMPLATE = """Orijinal CV:
+_DELTA_TEMPLATE = """DELTA REVIEW (retry {retry_count}): Analyzer analizi baştan yazmadı,
+sadece senin önceki turda istediğin eksikleri ekledi.
 
-{cv_text}
+Senin istediğin eksik sorunlar:
+
+{requested_issues}
 
 --------------------------
 
-Agent A (CV Analyzer) çıktığı analiz:
+Analyzer'ın eklediği delta:
 
-{analyzer_output}
+{analyzer_delta}
 
-Lütfen bu analizi denet ve JSON formatında döndür."""
+SADECE bu delta'yı denetle: istenen sorunlar yukarıdaki CV'ye göre doğru şekilde
+karşılandı mı? Hâlâ eksik olanları missed_issues'a koy, önceden onaylanmış
+kısımları tekrar denetleme. JSON formatında döndür."""
 
 
 def cv_critic_node(state: CareerPipelineState) -> dict:
-    """Agent B: CV Critic node."""
-    llm           = get_llm()
-    system_prompt = load_prompt("cv_critic")
-    user_message  = _USER_TEMPLATE.format(
-        cv_text=state["cv_text"],
-        analyzer_output=state["analyzer_output"],
-    )
-
-    response = llm.invoke([
-        {"role": "system", "content": system_prompt},
-        {"role": "user",   "content": user_message},
-    ])
+    """Agent B: CV Critic node (SPECULATIVE_OPTIMIZER sadece async node'da)."""
+    messages = _build_messages(state)
+    response = get_json_llm().invoke(messages)
+    return _to_update(state, response, messages)
+
+
+async def acv_critic_node(state: CareerPipelineState) -> dict:
+    """cv_critic_node'un async versiyonu (speculative optimizer task olarak)."""
+    messages = _build_messages(state)
+    if not settings.SPECULATIVE_OPTIMIZER:
+        response = await get_json_llm().ainvoke(messages)
+        return _to_update(state, response, messages)
+
+    started = time.perf_counter()
+    optimizer_messages = cv_optimizer.speculative_messages(state)
+    speculation = asyncio.create_task(_atimed_invoke(optimizer_messages))
+    speculation.add_done_callback(_consume_result)   # Atılan task'ın hatası loglanmasın
+
+    try:
+        response = await get_json_llm().ainvoke(messages)
+    except BaseException:
+        speculation.cancel()
+        raise
+    update = _to_update(state, response, messages)
+    critic_seconds = time.perf_counter() - started
+
+    if not _clean_approval(update):
+        wasted = _wasted_tokens(speculation, optimizer_messages)
+        speculation.cancel()          # HTTP isteği de iptal olur
+        return _speculation_miss(update, wasted)
+    try:
+        optimizer_response, optimizer_seconds = await speculation
+    except Exception as e:
+        return _speculation_error(update, e)
+    return _speculation_hit(update, optimizer_response, optimizer_messages, started, critic_seconds, optimizer_seconds)
+
+
+def _build_messages(state: CareerPipelineState) -> list[dict]:
+    if state.get("analyzer_delta"):
+        # critic_output henüz bir önceki turun review'u → istenen eksikler orada
+        requested = state["critic_output"].get("critic_review", {}).get("missed_issues", [])
+        task = _DELTA_TEMPLATE.format(
+            retry_count=state["retry_count"],
+            requested_issues=json.dumps(requested, ensure_ascii=False, indent=2),
+            analyzer_delta=json.dumps(state["analyzer_delta"], ensure_ascii=False, indent=2),
+        )
+    else:
+        task = _USER_TEMPLATE.format(
+            analyzer_output=json.dumps(state["analyzer_output"], ensure_ascii=False, indent=2),
+        )
+    return build_messages(state, "cv_critic", task)
+
 
+def _to_update(state: CareerPipelineState, response, messages: list[dict]) -> dict:
     raw_output = response.content
-    parsed   = safe_json_parse(raw_output)
-    approved = parsed.get("critic_review", {}).get("approved", False)
+    parsed   = parse_agent_output(raw_output, "critic_review")
+    approved = parsed["critic_review"].get("approved", False)
 
     return {
-        "critic_output": raw_output,
+        "critic_output": parsed,
         "approved":      approved,
+        "raw_outputs":   {"cv_critic": raw_output},
         "trace_log": [{
             "agent":          "CV Critic",
             "step":           "review_complete",
             "approved":       approved,
             "retry_count":    state["retry_count"],
+            "delta_review":   bool(state.get("analyzer_delta")),
+            "tokens":         token_usage(response, messages),
             "output_preview": raw_output[:400],
         }],
     }
+
+
+# ─── Speculative Optimizer ───────────────────────────────
+async def _atimed_invoke(messages: list[dict]):
+    started = time.perf_counter()
+    response = await get_json_llm().ainvoke(messages)
+    return response, time.perf_counter() - started
+
+
+def _consume_result(task: "asyncio.Task") -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _clean_approval(update: dict) -> bool:
+    """Speculative sonuç sadece onay + hiç missed_issue yoksa geçerli (prompt birebir aynı olur)."""
+    return update["approved"] and not update["critic_output"]["critic_review"].get("missed_issues")
+
+
+def _speculation_hit(update, optimizer_response, optimizer_messages, started, critic_seconds, optimizer_seconds) -> dict:
+    try:
+        optimizer_update = cv_optimizer.speculative_update(optimizer_response, optimizer_messages)
+    except ValueError as e:
+        return _speculation_error(update, e)
+
+    # Seri: critic + optimizer; speculative: ikisinin bitişi
+    saved = max(0.0, critic_seconds + optimizer_seconds - (time.perf_counter() - started))
+    SPECULATIONS.inc(result="hit")
+    SPECULATION_SAVED_SECONDS.inc(saved)
+
+    update["trace_log"][0]["speculation"] = {"result": "hit", "saved_ms": round(saved * 1000)}
+    return {
+        **update,
+        "optimizer_output": optimizer_update["optimizer_output"],
+        "raw_outputs":      {**update["raw_outputs"], **optimizer_update["raw_outputs"]},
+        "trace_log":        update["trace_log"] + optimizer_update["trace_log"],
+    }
+
+
+def _wasted_tokens(speculation: "asyncio.Task", optimizer_messages: list[dict]) -> int:
+    """
+    Atılan speculative çağrının token maliyeti.
+
+    Bittiyse gerçek usage; yarıda kesildiyse prompt'un tamamı (provider
+    isteği almış olabilir, output'u bilinmiyor) tahmini input olarak sayılır.
+    """
+    if speculation.done() and not speculation.cancelled() and speculation.exception() is None:
+        tokens = token_usage(speculation.result()[0], optimizer_messages)
+        return tokens["input"] + tokens["output"]
+    return sum(count_tokens(message["content"]) for message in optimizer_messages)
+
+
+def _speculation_miss(update: dict, wasted_tokens: int) -> dict:
+    SPECULATIONS.inc(result="miss")
+    SPECULATION_WASTED_TOKENS.inc(wasted_tokens)
+    update["trace_log"][0]["speculation"] = {"result": "miss", "wasted_tokens": wasted_tokens}
+    return update
+
+
+def _speculation_error(update: dict, error: Exception) -> dict:
+    # Speculative çağrı patladı → normal optimizer node'u çalışsın
+    logger.warning(f"⚠️ Speculative optimizer failed, falling back: {error}")
+    SPECULATIONS.inc(result="error")
+    update["trace_log"][0]["speculation"] = {"result": "error"}
+    return update
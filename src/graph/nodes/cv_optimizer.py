@@ -3,23 +3,22 @@
 cv_optimizer.py - Agent C: CV Optimizer
 ----------------------------------------
 Onaylanan tüm sorunlar için iyileştirilmiş CV sections yazar.
+
+SPECULATIVE_OPTIMIZER açıksa optimizer critic ile paralel çalışmış olabilir
+(src/graph/nodes/cv_critic.py); critic temiz onay verdiyse sonuç state'te
+hazırdır ve burada tekrar LLM çağrısı yapılmaz.
 """
 
 import json
 
+from src.graph.messages import build_messages, token_usage
 from src.graph.state import CareerPipelineState
-from src.models.llm import get_llm
-from src.services.prompt_loader import load_prompt
-from src.utils.parser import merge_issues
-
-
-_USER_TEMPLATE = """Orijinal CV:
+from src.models.llm import get_json_llm
+from src.utils.parser import merge_issues, parse_agent_output
 
-{cv_text}
 
---------------------------
-
-Tespit edilen tüm sorunlar (Analyzer + Critic):
+# Orijinal CV ortak prefix'te (src/graph/messages.py)
+_USER_TEMPLATE = """Tespit edilen tüm sorunlar (Analyzer + Critic):
 
 {all_issues}
 
@@ -33,28 +32,68 @@ def cv_optimizer_node(state: CareerPipelineState) -> dict:
     Agent C: CV Optimizer node.
     Analyzer + Critic sorunlarını birleştir -> LLM ile optimize -> optimizer_output'a yaz.
     """
-    llm           = get_llm()
-    system_prompt = load_prompt("cv_optimizer")
+    if state["optimizer_output"]:
+        return _reused_update(state)
+    messages = _build_messages(state)
+    response = get_json_llm().invoke(messages)
+    return _to_update(response, messages)
+
 
+async def acv_optimizer_node(state: CareerPipelineState) -> dict:
+    """cv_optimizer_node'un async versiyonu."""
+    if state["optimizer_output"]:
+        return _reused_update(state)
+    messages = _build_messages(state)
+    response = await get_json_llm().ainvoke(messages)
+    return _to_update(response, messages)
+
+
+# ─── Speculative ─────────────────────────────────────────
+def speculative_messages(state: CareerPipelineState) -> list[dict]:
+    """
+    Critic'ten ÖNCE optimizer mesajları: sadece Analyzer'ın sorunları.
+
+    Critic missed_issues'sız onaylarsa merge_issues aynı listeyi verir →
+    normal yoldaki çağrıyla birebir aynı prompt.
+    """
+    return _build_messages({**state, "critic_output": {}})
+
+
+def speculative_update(response, messages: list[dict]) -> dict:
+    """Speculative cevap → normal optimizer update'i (trace'te işaretli)."""
+    update = _to_update(response, messages)
+    update["trace_log"][0]["speculative"] = True
+    return update
+
+
+def _build_messages(state: CareerPipelineState) -> list[dict]:
     # Analyzer + Critic'in tüm sorunlarını merge et
     all_issues   = merge_issues(state["analyzer_output"], state["critic_output"])
     approved_str = json.dumps(all_issues, ensure_ascii=False, indent=2)
 
-    user_message = _USER_TEMPLATE.format(
-        cv_text=state["cv_text"],
-        all_issues=approved_str,
-    )
+    task = _USER_TEMPLATE.format(all_issues=approved_str)
+    return build_messages(state, "cv_optimizer", task)
+
+
+def _reused_update(state: CareerPipelineState) -> dict:
+    return {
+        "optimizer_output": state["optimizer_output"],
+        "trace_log": [{
+            "agent": "CV Optimizer",
+            "step":  "speculative_result_used",
+        }],
+    }
 
-    response = llm.invoke([
-        {"role": "system", "content": system_prompt},
-        {"role": "user",   "content": user_message},
-    ])
 
+def _to_update(response, messages: list[dict]) -> dict:
+    content = response.content
     return {
-        "optimizer_output": response.content,
+        "optimizer_output": parse_agent_output(content),
+        "raw_outputs":      {"cv_optimizer": content},
         "trace_log": [{
             "agent":          "CV Optimizer",
             "step":           "optimization_complete",
-            "output_preview": response.content[:400],
+            "tokens":         token_usage(response, messages),
+            "output_preview": content[:400],
         }],
     }
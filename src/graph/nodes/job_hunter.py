@@ -3,26 +3,71 @@
 job_hunter.py - Agent D: Job Hunter
 ------------------------------------
 Gerçek job search API kullanarak iş ilanları bulur.
+
+İki adım:
+  - job_fetch_node:  ilanları çeker (network) — START'ta analyzer ile paralel
+  - job_hunter_node: ilanları CV skill'lerine göre skorlar (ucuz, sadece CPU)
 """
 
-import json
 from src.graph.state import CareerPipelineState
-from src.api.job_scraper import search_jobs, calculate_match_score
-from src.utils.parser import safe_json_parse
+from src.services.matching import calculate_match_score
+
+
+def job_fetch_node(state: CareerPipelineState) -> dict:
+    """
+    İlan çekme node'u — sadece target_role / target_location'a bağlı,
+    CV analizini beklemez.
+    """
+    # Job search (requests + BeautifulSoup sadece bu node çalışınca yüklenir)
+    from src.api.job_scraper import search_jobs
+
+    jobs = search_jobs(
+        query=_target_role(state),
+        location=state.get("target_location", ""),
+        num_results=10
+    )
+    return _fetch_update(jobs)
+
+
+async def ajob_fetch_node(state: CareerPipelineState) -> dict:
+    """job_fetch_node'un async versiyonu (asearch_jobs)."""
+    from src.api.job_scraper import asearch_jobs
+
+    jobs = await asearch_jobs(
+        query=_target_role(state),
+        location=state.get("target_location", ""),
+        num_results=10
+    )
+    return _fetch_update(jobs)
+
+
+def _target_role(state: CareerPipelineState) -> str:
+    return state.get("target_role") or "Software Engineer"
+
+
+def _fetch_update(jobs: list[dict]) -> dict:
+    return {
+        "job_listings": jobs,
+        "trace_log": [{
+            "agent": "Job Hunter",
+            "step": "job_fetch_complete",
+            "jobs_found": len(jobs),
+        }],
+    }
 
 
 def job_hunter_node(state: CareerPipelineState) -> dict:
     """
     Agent D: Job Hunter node.
-    RapidAPI JSearch kullanarak gerçek iş ilanları bulur.
+    job_fetch'in çektiği ilanları analyzer'ın bulduğu skill'lere göre skorlar.
     """
-    
-    target_role = state.get("target_role") or "Software Engineer"
+    jobs = state.get("job_listings", [])
+    target_role = _target_role(state)
     target_location = state.get("target_location", "")
     
     # CV'den skills çıkar
     try:
-        analyzer_data = safe_json_parse(state["analyzer_output"])
+        analyzer_data = state["analyzer_output"]
         cv_skills = analyzer_data.get("cv_analysis", {}).get("optimized_sections", {}).get("key_skills", [])
         if not cv_skills:
             # Fallback: skill_gaps'den al
@@ -31,13 +76,6 @@ def job_hunter_node(state: CareerPipelineState) -> dict:
     except:
         cv_skills = ["Python", "JavaScript", "AWS"]  # Fallback
     
-    # Job search
-    jobs = search_jobs(
-        query=target_role,
-        location=target_location,
-        num_results=10
-    )
-    
     # Calculate match scores
     job_recommendations = []
     for job in jobs:
@@ -82,7 +120,7 @@ def job_hunter_node(state: CareerPipelineState) -> dict:
     }
     
     return {
-        "job_hunter_output": json.dumps(output, ensure_ascii=False, indent=2),
+        "job_hunter_output": output,
         "trace_log": [{
             "agent": "Job Hunter",
             "step": "job_search_complete",
@@ -0,0 +1,189 @@
+"""
+pre_critic.py - Pre-Critic Gate
+--------------------------------
+Analyzer çıktısını LLM'siz, kural tabanlı denetler.
+
+Kontroller (ağırlıklı, 0-1 confidence):
+  - schema:     cv_analysis alanları + issue alanları eksiksiz mi
+  - issues:     issue sayısı CV uzunluğuna göre makul mü
+  - categories: zorunlu kategoriler (ATS / Content / Structure) var mı,
+                hedef rol varsa skill gap analizi yapılmış mı
+  - ats_score:  skor, issue severity'lerinden beklenen skorla tutarlı mı
+  - requested:  retry'da critic'in istediği eksikler eklenmiş mi
+
+confidence ≥ PRE_CRITIC_THRESHOLD       → approve (LLM critic çağrılmaz)
+confidence ≤ 1 - PRE_CRITIC_THRESHOLD   → reject, bulunan eksikler missed_issues olur
+arası                                   → defer, LLM critic karar verir
+"""
+
+import re
+
+from src.core.config import settings
+from src.core.constants import (
+    PRE_CRITIC_ATS_TOLERANCE,
+    PRE_CRITIC_CHARS_PER_ISSUE,
+    PRE_CRITIC_MAX_ISSUES,
+    PRE_CRITIC_MIN_ISSUES,
+    PRE_CRITIC_REQUIRED_CATEGORIES,
+    PRE_CRITIC_SEVERITY_PENALTY,
+)
+from src.core.metrics import PRE_CRITIC_DECISIONS
+from src.graph.state import CareerPipelineState
+
+
+_ANALYSIS_FIELDS = ("ats_score", "issues", "skill_gaps", "summary")
+_ISSUE_FIELDS = ("category", "severity", "description", "suggestion")
+
+# check adı → ağırlık
+_WEIGHTS = {"schema": 3, "issues": 2, "categories": 2, "ats_score": 2, "requested": 3}
+
+
+def pre_critic_node(state: CareerPipelineState) -> dict:
+    """
+    Pre-critic gate node'u (sadece CPU, ~ms).
+    Kararı gate_decision'a yazar; routing router.pre_critic_router'da.
+    """
+    if not settings.pre_critic_enabled:
+        return {"gate_decision": "defer"}
+
+    result = evaluate_analysis(state)
+    threshold = settings.PRE_CRITIC_THRESHOLD
+
+    if result["confidence"] >= threshold:
+        decision, missed = "approve", []
+    elif result["confidence"] <= 1 - threshold and result["missed_issues"]:
+        decision, missed = "reject", result["missed_issues"]
+    else:
+        decision, missed = "defer", []
+
+    PRE_CRITIC_DECISIONS.inc(decision=decision)
+
+    trace = {
+        "agent":         "Pre-Critic Gate",
+        "step":          f"gate_{decision}",
+        "confidence":    result["confidence"],
+        "failed_checks": result["failed_checks"],
+        "retry_count":   state["retry_count"],
+    }
+    if decision == "defer":
+        return {"gate_decision": decision, "trace_log": [trace]}
+
+    # LLM critic'in çıktısıyla aynı formatta review → analyzer retry / optimizer aynen kullanır
+    review = {
+        "critic_review": {
+            "approved":      decision == "approve",
+            "missed_issues": missed,
+            "corrections":   [],
+            "feedback":      f"Rule-based pre-critic gate (confidence {result['confidence']})",
+        }
+    }
+    return {
+        "gate_decision": decision,
+        "critic_output": review,
+        "approved":      decision == "approve",
+        "trace_log":     [trace],
+    }
+
+
+def evaluate_analysis(state: CareerPipelineState) -> dict:
+    """
+    Kuralları çalıştır.
+
+    Returns:
+        {"confidence": 0-1, "failed_checks": [...], "missed_issues": [...]}
+        missed_issues: reject durumunda analyzer'a gönderilecek (critic formatında)
+    """
+    analysis = state["analyzer_output"].get("cv_analysis", {})
+    issues = [issue for issue in analysis.get("issues") or [] if isinstance(issue, dict)]
+
+    checks = {
+        "schema":     _check_schema(analysis, issues),
+        "issues":     _check_issue_count(issues, state["cv_text"]),
+        "categories": _check_categories(analysis, issues, state.get("target_role", "")),
+        "ats_score":  _check_ats_consistency(analysis, issues),
+    }
+    if state["retry_count"] > 0:
+        requested = state["critic_output"].get("critic_review", {}).get("missed_issues", [])
+        checks["requested"] = _check_requested(issues, requested)
+
+    total = sum(_WEIGHTS[name] for name in checks)
+    passed = sum(_WEIGHTS[name] for name, missed in checks.items() if missed is None)
+
+    return {
+        "confidence":    round(passed / total, 3),
+        "failed_checks": [name for name, missed in checks.items() if missed is not None],
+        "missed_issues": [issue for missed in checks.values() if missed for issue in missed],
+    }
+
+
+# ─── Checks ──────────────────────────────────────────────
+# Her check: None → geçti, list → başarısız (+ analyzer'a iletilecek missed issue'lar, boş olabilir)
+
+def _check_schema(analysis: dict, issues: list[dict]):
+    missing = [field for field in _ANALYSIS_FIELDS if field not in analysis]
+    score = analysis.get("ats_score")
+    incomplete = [issue for issue in issues if any(not issue.get(field) for field in _ISSUE_FIELDS)]
+
+    if not missing and isinstance(score, (int, float)) and 0 <= score <= 100 and not incomplete:
+        return None
+    # Şema sorunu CV'de değil analizde → analyzer'a missed issue olarak gönderilemez
+    return []
+
+
+def _check_issue_count(issues: list[dict], cv_text: str):
+    expected = min(PRE_CRITIC_MAX_ISSUES, max(PRE_CRITIC_MIN_ISSUES, len(cv_text) // PRE_CRITIC_CHARS_PER_ISSUE))
+    if expected <= len(issues) <= PRE_CRITIC_MAX_ISSUES:
+        return None
+    return []
+
+
+def _check_categories(analysis: dict, issues: list[dict], target_role: str):
+    covered = {str(issue.get("category", "")).strip().lower() for issue in issues}
+    missed = [
+        {
+            "category":    category,
+            "severity":    "Warning",
+            "description": f"{category} kategorisinde hiç sorun raporlanmamış — bu alan incelenmeli",
+            "suggestion":  f"CV'yi {category} kriterlerine göre tekrar değerlendir",
+            "location":    "General",
+        }
+        for category in PRE_CRITIC_REQUIRED_CATEGORIES
+        if category.lower() not in covered
+    ]
+    if target_role and not analysis.get("skill_gaps") and "skillgap" not in covered:
+        missed.append({
+            "category":    "SkillGap",
+            "severity":    "Warning",
+            "description": f"'{target_role}' hedefi için skill gap analizi yapılmamış",
+            "suggestion":  "Hedef pozisyonun gerektirdiği eksik skill'leri listele",
+            "location":    "Skills",
+        })
+    return missed or None
+
+
+def _check_ats_consistency(analysis: dict, issues: list[dict]):
+    score = analysis.get("ats_score")
+    if not isinstance(score, (int, float)):
+        return []
+    penalty = sum(PRE_CRITIC_SEVERITY_PENALTY.get(str(issue.get("severity", "")).lower(), 0) for issue in issues)
+    expected = max(0, 100 - penalty)
+    return None if abs(score - expected) <= PRE_CRITIC_ATS_TOLERANCE else []
+
+
+def _check_requested(issues: list[dict], requested: list[dict]):
+    """Critic'in önceki turda istediği her eksik analizde karşılanmış mı."""
+    reported = [_words(issue.get("description", "")) for issue in issues]
+    missing = [
+        request for request in requested
+        if isinstance(request, dict) and not any(_overlaps(_words(request.get("description", "")), words) for words in reported)
+    ]
+    return missing or None
+
+
+def _words(text: str) -> set[str]:
+    return {word for word in re.findall(r"\w+", str(text).lower()) if len(word) > 2}
+
+
+def _overlaps(requested: set[str], reported: set[str]) -> bool:
+    # İstenen açıklamanın kelimelerinin çoğu raporlanan bir issue'da geçiyorsa karşılanmış say
+    return bool(requested) and len(requested & reported) / len(requested) >= 0.6
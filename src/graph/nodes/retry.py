@@ -7,6 +7,7 @@ trace_log'a yazar, sonra Analyzer'e gecer.
 
 from src.graph.state import CareerPipelineState
 from src.core.constants import MAX_CRITIC_RETRIES
+from src.core.metrics import PIPELINE_RETRIES
 
 
 def retry_node(state: CareerPipelineState) -> dict:
@@ -14,6 +15,7 @@ def retry_node(state: CareerPipelineState) -> dict:
     retry_count += 1 yap ve trace log'a yaz.
     """
     new_count = state["retry_count"] + 1
+    PIPELINE_RETRIES.inc()
 
     return {
         "retry_count": new_count,
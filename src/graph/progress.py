@@ -0,0 +1,87 @@
+"""
+progress.py
+-----------
+Streaming için node bazlı ilerleme özetleri.
+
+Her node bitince (graph.stream(stream_mode="updates")) o node'un state
+update'inden küçük, JSON-serializable bir özet çıkarılır — client tüm
+pipeline'ı beklemeden ilk ATS score'u, critic kararını vb. görür.
+"""
+
+from typing import Any
+
+
+# node → (progress %, kullanıcıya gösterilecek mesaj)
+NODE_PROGRESS: dict[str, tuple[int, str]] = {
+    "job_fetch":    (20,  "💼 Job listings fetched"),
+    "cv_analyzer":  (40,  "🔍 CV analyzed"),
+    "pre_critic":   (50,  "⚡ Quick rule-based review"),
+    "cv_critic":    (60,  "🧐 Analysis reviewed"),
+    "retry":        (45,  "🔁 Critic requested a re-analysis"),
+    "cv_optimizer": (85,  "✨ CV optimized"),
+    "job_hunter":   (100, "🎯 Jobs matched"),
+}
+
+
+def node_progress(node: str, update: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    Bir node'un state update'inden streaming event payload'ı.
+
+    Returns:
+        {"node", "progress", "message", "partial"} — partial node'a özel
+        ara sonuçlar (ats_score, approved, jobs_found, ...)
+    """
+    update = update or {}
+    progress, message = NODE_PROGRESS.get(node, (0, node))
+    return {
+        "node":     node,
+        "progress": progress,
+        "message":  message,
+        "partial":  _partial(node, update),
+    }
+
+
+def _partial(node: str, update: dict[str, Any]) -> dict[str, Any]:
+    if node == "cv_analyzer":
+        analysis = update.get("analyzer_output", {}).get("cv_analysis", {})
+        return {
+            "ats_score":   analysis.get("ats_score"),
+            "issues":      len(analysis.get("issues", [])),
+            "skill_gaps":  len(analysis.get("skill_gaps", [])),
+            "delta_retry": bool(update.get("analyzer_delta")),
+        }
+
+    if node == "cv_critic":
+        review = update.get("critic_output", {}).get("critic_review", {})
+        return {
+            "approved":      update.get("approved", False),
+            "missed_issues": len(review.get("missed_issues", [])),
+        }
+
+    if node == "pre_critic":
+        return {"decision": update.get("gate_decision", "defer")}
+
+    if node == "retry":
+        return {"retry_count": update.get("retry_count", 0)}
+
+    if node == "cv_optimizer":
+        optimizer = update.get("optimizer_output", {})
+        return {
+            "new_ats_score": optimizer.get("new_ats_score"),
+            "improvements":  len(optimizer.get("improvements", [])),
+        }
+
+    if node == "job_fetch":
+        return {"jobs_found": len(update.get("job_listings", []))}
+
+    if node == "job_hunter":
+        jobs = update.get("job_hunter_output", {})
+        return {
+            "total_jobs_found": jobs.get("total_jobs_found", 0),
+            "top_matches": [
+                {"title": job["title"], "company": job["company"], "match_score": job["match_score"]}
+                for job in jobs.get("job_recommendations", [])[:3]
+            ],
+        }
+
+    return {}
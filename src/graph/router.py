@@ -26,4 +26,17 @@ def critic_router(state: CareerPipelineState) -> str:
         return "retry"
 
     # Case 3: Max retry asildi
-    return "optimizer"
\ No newline at end of file
+    return "optimizer"
+
+
+def pre_critic_router(state: CareerPipelineState) -> str:
+    """
+    Conditional edge: pre_critic gate -> ?
+
+    Returns:
+        "critic"              -> gate emin değil, LLM critic karar versin
+        critic_router(state)  -> gate onayladı / reddetti, critic'in yerine geçer
+    """
+    if state.get("gate_decision") in ("approve", "reject"):
+        return critic_router(state)
+    return "critic"
@@ -17,15 +17,23 @@ class CareerPipelineState(TypedDict):
     target_role: str                # Hedef pozisyon (optional)
     target_location: str            # İş arama lokasyonu (optional)
 
-    # ── Agent Outputs (raw JSON strings) ────────────────
-    analyzer_output: str            # Agent A: CV Analyzer
-    critic_output:   str            # Agent B: CV Critic
-    optimizer_output: str           # Agent C: CV Optimizer
-    job_hunter_output: str          # Agent D: Job Hunter (Phase 2)
+    # ── Agent Outputs (node'da bir kez parse edilmiş dict'ler) ──
+    analyzer_output: dict           # Agent A: {"cv_analysis": ...} (delta retry'da merge edilmiş tam analiz)
+    analyzer_delta:  dict           # Delta retry: {"cv_analysis_delta": ...} ({} → full review)
+    critic_output:   dict           # Agent B: {"critic_review": ...}
+    optimizer_output: dict          # Agent C: CV Optimizer
+    job_hunter_output: dict         # Agent D: {"job_recommendations": [...], ...}
+
+    # ── Debug ───────────────────────────────────────────
+    raw_outputs: Annotated[dict[str, str], operator.or_]   # agent adı → son ham LLM cevabı
+
+    # ── Job Search ──────────────────────────────────────
+    job_listings: list[dict]        # job_fetch: ham ilanlar (analyzer ile paralel çekilir)
 
     # ── Flow Control ────────────────────────────────────
     retry_count: int                # Critic -> Analyzer loop sayisi
     approved:    bool               # Critic onay flag'i
+    gate_decision: str              # Pre-critic gate: "approve" | "reject" | "defer"
 
     # ── Logging ─────────────────────────────────────────
     trace_log: Annotated[list[dict], operator.add]
\ No newline at end of file
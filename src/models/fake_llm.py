@@ -0,0 +1,287 @@
+"""
+fake_llm.py
+───────────
+Ağsız (offline) LLM backend'leri — load test, benchmark ve profiling için.
+
+LLM_BACKEND ile get_llm() tarafından seçilir:
+- fake:   Her agent prompt'u için şemaya uygun sabit (canned) JSON
+- record: Gerçek ChatOpenAI çağrılır, cevaplar LLM_FIXTURES_DIR'e yazılır
+- replay: Kayıtlı cevaplar döner (kayıt yoksa canned JSON)
+
+Gecikme LLM_FAKE_LATENCY ile ayarlanır:
+    fixed:MS | uniform:MIN_MS:MAX_MS | normal:MEAN_MS:STD_MS |
+    lognormal:MEDIAN_MS:SIGMA | recorded (kayıttaki süre, replay)
+
+Fixture'lar prompt hash'i ile anahtarlanır: aynı CV + aynı prompt'lar
+→ aynı dosya (<dir>/<agent>/<hash>.json).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import ConfigDict, PrivateAttr, model_validator
+
+from src.services.prompt_loader import load_prompt
+
+logger = logging.getLogger(__name__)
+
+_AGENTS = ("cv_analyzer", "cv_critic", "cv_optimizer", "job_hunter")
+
+
+# ─── Canned Responses ────────────────────────────────────
+# Prompt'lardaki çıktı şemalarıyla aynı; pre-critic gate'ten de geçer
+_ANALYZER = {"cv_analysis": {
+    "ats_score": 78,
+    "overall_quality": "Average",
+    "issues": [
+        {"category": "ATS", "severity": "Warning",
+         "description": "Section headings use non-standard names",
+         "suggestion": "Rename sections to Experience / Education / Skills",
+         "location": "Structure"},
+        {"category": "Content", "severity": "Warning",
+         "description": "Experience bullets lack quantifiable achievements",
+         "suggestion": "Add metrics (%, numbers, scale) to each bullet",
+         "location": "Experience section"},
+        {"category": "Structure", "severity": "Info",
+         "description": "No professional summary at the top",
+         "suggestion": "Add a 2-3 sentence summary targeting the role",
+         "location": "Summary"},
+    ],
+    "strengths": ["Relevant technical skills", "Clear education history"],
+    "skill_gaps": [
+        {"skill": "Docker", "importance": "High", "reason": "Common requirement for the target role"},
+    ],
+    "summary": "Solid profile with relevant skills; impact and ATS formatting can be improved.",
+}}
+
+_ANALYZER_DELTA = {"cv_analysis_delta": {"ats_score": None, "added_issues": [], "added_skill_gaps": []}}
+
+_CRITIC = {"critic_review": {
+    "approved": True,
+    "missed_issues": [],
+    "corrections": [],
+    "feedback": "Analysis is complete.",
+}}
+
+_OPTIMIZER = {
+    "improvements": [
+        {"location": "Experience section", "issue_category": "Content",
+         "original": "Worked on data pipelines",
+         "improved": "Built Python data pipelines processing 2M+ records daily, cutting runtime by 40%",
+         "explanation": "Strong action verb + quantified impact"},
+        {"location": "Summary", "issue_category": "Structure",
+         "original": "",
+         "improved": "Data engineer with 3 years of Python and SQL experience building reliable pipelines.",
+         "explanation": "Added a role-targeted summary"},
+    ],
+    "optimized_sections": {
+        "summary": "Data engineer with 3 years of Python and SQL experience building reliable pipelines.",
+        "key_skills": ["Python", "SQL", "Docker"],
+        "missing_keywords": ["CI/CD", "Airflow"],
+    },
+    "new_ats_score": 86,
+    "optimization_summary": "Quantified experience bullets, added a summary and ATS keywords.",
+}
+
+_CANNED = {"cv_analyzer": _ANALYZER, "cv_critic": _CRITIC, "cv_optimizer": _OPTIMIZER, "job_hunter": {}}
+
+
+def canned_response(agent: str, task: str = "") -> dict:
+    """Agent (ve retry görevi) için sabit cevap."""
+    if agent == "cv_analyzer" and "cv_analysis_delta" in task:
+        return _ANALYZER_DELTA
+    return _CANNED.get(agent, {})
+
+
+def detect_agent(messages: List[BaseMessage]) -> str:
+    """Mesajlardaki agent prompt'undan agent adı (bilinmiyorsa "unknown")."""
+    contents = {str(message.content).strip() for message in messages if message.type == "system"}
+    for agent in _AGENTS:
+        try:
+            if load_prompt(agent) in contents:
+                return agent
+        except (KeyError, FileNotFoundError):
+            continue
+    return "unknown"
+
+
+# ─── Latency ─────────────────────────────────────────────
+def parse_latency(spec: str) -> Optional[Callable[[random.Random], float]]:
+    """
+    Latency spec'i → saniye üreten sampler.
+
+    Returns:
+        None → "recorded" (süre fixture'dan okunur)
+
+    Raises:
+        ValueError: Bilinmeyen dağılım / hatalı parametre
+    """
+    kind, _, params = spec.strip().lower().partition(":")
+    try:
+        values = [float(value) for value in params.split(":")] if params else []
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: '{spec}'") from None
+
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "recorded": 0}
+    if kind not in expected or len(values) != expected[kind] or any(value < 0 for value in values):
+        raise ValueError(
+            f"Invalid latency spec: '{spec}'. "
+            "Use fixed:MS | uniform:MIN_MS:MAX_MS | normal:MEAN_MS:STD_MS | lognormal:MEDIAN_MS:SIGMA | recorded"
+        )
+
+    if kind == "recorded":
+        return None
+    if kind == "fixed":
+        return lambda rng: values[0] / 1000
+    if kind == "uniform":
+        low, high = sorted(values)
+        return lambda rng: rng.uniform(low, high) / 1000
+    if kind == "normal":
+        mean, std = values
+        return lambda rng: max(0.0, rng.gauss(mean, std)) / 1000
+    median, sigma = values
+    return lambda rng: rng.lognormvariate(math.log(max(median, 1e-3)), sigma) / 1000
+
+
+# ─── Fixtures ────────────────────────────────────────────
+def fixture_key(model: str, messages: List[BaseMessage]) -> str:
+    """Model + mesajların (rol, içerik) hash'i."""
+    payload = json.dumps(
+        [model, [(message.type, message.content) for message in messages]],
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _fixture_path(fixtures_dir: str, agent: str, key: str) -> str:
+    return os.path.join(fixtures_dir, agent, f"{key[:24]}.json")
+
+
+def load_fixture(fixtures_dir: str, agent: str, key: str) -> Optional[dict]:
+    path = _fixture_path(fixtures_dir, agent, key)
+    if not os.path.isfile(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_fixture(fixtures_dir: str, agent: str, key: str, record: dict) -> str:
+    path = _fixture_path(fixtures_dir, agent, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Yarım yazılmış dosya replay'de okunmasın
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+# ─── Models ──────────────────────────────────────────────
+class FakeChatModel(BaseChatModel):
+    """
+    Ağsız chat model: canned JSON (fake) ya da kayıtlı cevap (replay).
+    response_format gibi bind kwarg'ları kabul edilir ve yok sayılır.
+    """
+
+    model_name: str = "fake"
+    latency: str = "fixed:0"
+    seed: Optional[int] = None
+    fixtures_dir: str = ""       # Boş = sadece canned (fake backend)
+
+    _sampler: Optional[Callable[[random.Random], float]] = PrivateAttr(default=None)
+    _rng: random.Random = PrivateAttr(default_factory=random.Random)
+    _rng_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @model_validator(mode="after")
+    def _init_latency(self) -> "FakeChatModel":
+        self._sampler = parse_latency(self.latency)
+        self._rng = random.Random(self.seed)
+        return self
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _respond(self, messages: List[BaseMessage]) -> tuple[ChatResult, float]:
+        """(cevap, beklenecek saniye)"""
+        agent = detect_agent(messages)
+        record = None
+        if self.fixtures_dir:
+            record = load_fixture(self.fixtures_dir, agent, fixture_key(self.model_name, messages))
+            if record is None:
+                logger.warning(f"⚠️ No recorded response for {agent}, using canned reply")
+
+        if record is not None:
+            content = record["content"]
+            usage = record.get("usage_metadata")
+        else:
+            content = json.dumps(canned_response(agent, str(messages[-1].content)), ensure_ascii=False)
+            usage = None
+
+        if self._sampler is None:
+            delay = (record or {}).get("latency_ms", 0) / 1000
+        else:
+            with self._rng_lock:
+                delay = self._sampler(self._rng)
+
+        message = AIMessage(content=content, usage_metadata=usage) if usage else AIMessage(content=content)
+        return ChatResult(generations=[ChatGeneration(message=message)]), delay
+
+    def _generate(self, messages, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        result, delay = self._respond(messages)
+        time.sleep(delay)
+        return result
+
+    async def _agenerate(self, messages, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        result, delay = self._respond(messages)
+        await asyncio.sleep(delay)
+        return result
+
+
+class RecordingChatModel(BaseChatModel):
+    """Gerçek modeli çağırır, her cevabı (+ süre, usage) fixture olarak yazar."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    inner: BaseChatModel
+    model_name: str
+    fixtures_dir: str
+
+    @property
+    def _llm_type(self) -> str:
+        return f"recording-{self.inner._llm_type}"
+
+    def _generate(self, messages, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        started = time.perf_counter()
+        result = self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._record(messages, result, time.perf_counter() - started)
+        return result
+
+    async def _agenerate(self, messages, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        started = time.perf_counter()
+        result = await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._record(messages, result, time.perf_counter() - started)
+        return result
+
+    def _record(self, messages: List[BaseMessage], result: ChatResult, seconds: float) -> None:
+        message = result.generations[0].message
+        agent = detect_agent(messages)
+        path = save_fixture(self.fixtures_dir, agent, fixture_key(self.model_name, messages), {
+            "agent":          agent,
+            "model":          self.model_name,
+            "content":        message.content,
+            "usage_metadata": getattr(message, "usage_metadata", None),
+            "latency_ms":     round(seconds * 1000, 1),
+        })
+        logger.debug(f"📼 Recorded {agent} response → {path}")
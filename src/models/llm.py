@@ -2,27 +2,318 @@
 llm.py
 ──────
 LLM client factory. Tüm agent node'ları buradan LLM alır.
+
+- (model, temperature) başına tek ChatOpenAI instance (process boyunca)
+- Tüm instance'lar aynı keep-alive httpx connection pool'unu paylaşır
+  → her node çağrısında yeni TLS handshake yok
+- warm_up_llm() / awarm_up_llm(): startup'ta sync / async pool'a bağlantı açar
+- llm_pool_stats(): pool kullanım metrikleri
+- LLM_RATE_LIMIT_RPM / TPM: tüm çağrılar ortak token bucket'tan sıra alır
+  (src/models/rate_limiter.py)
+- LLM_BACKEND=fake | record | replay: ağsız benchmark / load test
+  backend'leri (src/models/fake_llm.py)
 """
 
-from langchain_openai import ChatOpenAI
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from src.core.config import settings
 from src.core.constants import DEFAULT_MODEL, DEFAULT_TEMPERATURE
+from src.core.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    import httpx
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_core.runnables import Runnable
+    from src.models.llm_cache import SQLiteLLMCache
+
+logger = logging.getLogger(__name__)
 
 
 def get_llm(
     model: str | None = None,
     temperature: float | None = None,
-) -> ChatOpenAI:
+) -> "BaseChatModel":
     """
-    ChatOpenAI instance döner.
+    ChatOpenAI instance döner (aynı model/temperature için hep aynı instance).
+    LLM_BACKEND=fake / replay ise ağsız FakeChatModel, record ise kaydeden sarmalayıcı.
+
+    Response cache (LLM_CACHE_PATH) açıksa bağlanır; aynı model/temperature
+    + aynı system/user mesajı tekrar API'ye gitmez.
 
     Args:
         model:       override edilmek istenirse (default: gpt-4o-mini)
         temperature: override edilmek istenirse (default: 0.2)
     """
-    return ChatOpenAI(
-        model=model or DEFAULT_MODEL,
-        temperature=temperature if temperature is not None else DEFAULT_TEMPERATURE,
+    return _build_llm(
+        model or DEFAULT_MODEL,
+        temperature if temperature is not None else DEFAULT_TEMPERATURE,
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_llm(model: str, temperature: float) -> "BaseChatModel":
+    backend = settings.llm_backend
+    if backend not in ("openai", "fake", "record", "replay"):
+        raise ValueError(f"Unknown LLM_BACKEND: '{settings.LLM_BACKEND}' (openai | fake | record | replay)")
+
+    if settings.llm_offline:
+        from src.models.fake_llm import FakeChatModel
+
+        # Response cache bağlanmaz: benchmark her çağrıda gecikmeyi ölçmeli
+        return _chat_model_class(FakeChatModel)(
+            model_name=model,
+            latency=settings.LLM_FAKE_LATENCY,
+            seed=settings.LLM_FAKE_SEED,
+            fixtures_dir=settings.LLM_FIXTURES_DIR if backend == "replay" else "",
+        )
+
+    # langchain_openai (openai + httpx + tiktoken) ağır: ilk LLM çağrısında yükle
+    from langchain_openai import ChatOpenAI
+
+    http_client, http_async_client = _get_http_clients()
+    llm = _chat_model_class(ChatOpenAI)(
+        model=model,
+        temperature=temperature,
         api_key=settings.OPENAI_API_KEY,
-    )
\ No newline at end of file
+        cache=None if backend == "record" else get_llm_cache(),
+        http_client=http_client,
+        http_async_client=http_async_client,
+    )
+    if backend == "record":
+        from src.models.fake_llm import RecordingChatModel
+
+        # Cache kapalı: her cevap gerçekten API'den gelip fixture'a yazılsın
+        return RecordingChatModel(inner=llm, model_name=model, fixtures_dir=settings.LLM_FIXTURES_DIR)
+    return llm
+
+
+def _chat_model_class(cls: type) -> type:
+    """LLM_RATE_LIMIT_RPM / TPM açıksa provider çağrıları ortak limiter'dan geçer."""
+    if not settings.rate_limit_enabled:
+        return cls
+    from src.models.rate_limiter import rate_limited
+
+    return rate_limited(cls)
+
+
+def get_json_llm(
+    model: str | None = None,
+    temperature: float | None = None,
+) -> "Runnable":
+    """
+    JSON mode'da LLM (response_format=json_object) — çıktı her zaman
+    parse edilebilir bir JSON object olur. Prompt'ta "JSON" geçmeli.
+    """
+    return get_llm(model, temperature).bind(response_format={"type": "json_object"})
+
+
+# ─── Response Cache ──────────────────────────────────────
+@lru_cache(maxsize=None)
+def get_llm_cache() -> Optional["SQLiteLLMCache"]:
+    """Process genelinde tek SQLite cache (LLM_CACHE_PATH boşsa None)."""
+    if not settings.LLM_CACHE_PATH:
+        return None
+
+    from src.models.llm_cache import SQLiteLLMCache
+
+    return SQLiteLLMCache(
+        settings.LLM_CACHE_PATH,
+        ttl_seconds=settings.LLM_CACHE_TTL_HOURS * 3600,
+        max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    )
+
+
+def llm_cache_stats() -> dict:
+    """Hit/miss metrikleri (cache kapalıysa boş dict)."""
+    cache = get_llm_cache()
+    return cache.stats() if cache is not None else {}
+
+
+# ─── Shared HTTP Pool ────────────────────────────────────
+class _PoolMetrics:
+    """Sync + async transport'ların ortak sayaçları."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_seconds = 0.0
+        self.async_pools = 0     # Async pool'u olan (açık) event loop sayısı
+
+    def start(self) -> float:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return time.perf_counter()
+
+    def finish(self, started: float, failed: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.errors += failed
+            self.total_seconds += time.perf_counter() - started
+
+
+_POOL_METRICS = _PoolMetrics()
+
+
+@lru_cache(maxsize=None)
+def _get_http_clients() -> Tuple["httpx.Client", "httpx.AsyncClient"]:
+    """
+    Tüm ChatOpenAI instance'larının paylaştığı keep-alive httpx client'ları.
+
+    Async bağlantılar oluşturuldukları event loop'a bağlı; Streamlit her
+    çalıştırmada asyncio.run ile yeni loop açarken FastAPI tek loop kullanır.
+    Bu yüzden async client tek ama pool'u çalışan loop başına ayrı.
+    """
+    import httpx
+
+    class _MeteredTransport(httpx.HTTPTransport):
+        def handle_request(self, request):
+            started = _POOL_METRICS.start()
+            failed = True
+            try:
+                response = super().handle_request(request)
+                failed = False
+                return response
+            finally:
+                _POOL_METRICS.finish(started, failed)
+
+    class _MeteredAsyncTransport(httpx.AsyncHTTPTransport):
+        async def handle_async_request(self, request):
+            started = _POOL_METRICS.start()
+            failed = True
+            try:
+                response = await super().handle_async_request(request)
+                failed = False
+                return response
+            finally:
+                _POOL_METRICS.finish(started, failed)
+
+    class _PerLoopAsyncTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self._lock = threading.Lock()
+            self._pools: Dict[int, Tuple["weakref.ref", _MeteredAsyncTransport]] = {}
+
+        def _pool(self) -> _MeteredAsyncTransport:
+            loop = asyncio.get_running_loop()
+            with self._lock:
+                # Kapanmış loop'ların pool'ları kullanılamaz (bağlantıları o loop'a bağlı) → bırak
+                for key, (loop_ref, _) in list(self._pools.items()):
+                    if loop_ref() is None or loop_ref().is_closed():
+                        del self._pools[key]
+                entry = self._pools.get(id(loop))
+                if entry is None or entry[0]() is not loop:
+                    entry = self._pools[id(loop)] = (weakref.ref(loop), _MeteredAsyncTransport(limits=limits))
+                _POOL_METRICS.async_pools = len(self._pools)
+                return entry[1]
+
+        async def handle_async_request(self, request):
+            return await self._pool().handle_async_request(request)
+
+        async def aclose(self):
+            with self._lock:
+                entry = self._pools.pop(id(asyncio.get_running_loop()), None)
+                _POOL_METRICS.async_pools = len(self._pools)
+            if entry is not None:
+                await entry[1].aclose()
+
+    limits = httpx.Limits(
+        max_connections=settings.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_MAX_KEEPALIVE,
+        keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(settings.LLM_TIMEOUT_SECONDS, connect=10.0)
+    return (
+        httpx.Client(transport=_MeteredTransport(limits=limits), timeout=timeout),
+        httpx.AsyncClient(transport=_PerLoopAsyncTransport(), timeout=timeout),
+    )
+
+
+def warm_up_llm() -> bool:
+    """
+    Default LLM'i oluşturup pool'a bir bağlantı açar (DNS + TLS startup'ta ödenir).
+
+    Returns:
+        Bağlantı kurulduysa True. API key yoksa / ağ hatasında False (startup bloklanmaz).
+        Offline backend'de (fake / replay) sadece model oluşturulur → True.
+    """
+    if settings.llm_offline:
+        get_llm()
+        return True
+    if not settings.openai_ok:
+        return False
+    # record backend'i gerçek ChatOpenAI'ı sarar
+    llm = getattr(get_llm(), "inner", get_llm())
+    try:
+        # En ucuz authenticated çağrı; token harcamaz
+        llm.root_client.with_options(max_retries=0).models.list()
+        logger.info("✅ LLM connection pool warmed up")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ LLM warm-up failed: {e}")
+        return False
+
+
+async def awarm_up_llm() -> bool:
+    """
+    warm_up_llm'in async versiyonu: çalışan event loop'un pool'una bağlantı açar.
+
+    Async pool loop başına ayrı (_PerLoopAsyncTransport) → FastAPI'de
+    request'lere hizmet eden loop'ta (lifespan içinde) await edilmeli.
+    """
+    if settings.llm_offline:
+        get_llm()
+        return True
+    if not settings.openai_ok:
+        return False
+    llm = getattr(get_llm(), "inner", get_llm())
+    try:
+        await llm.root_async_client.with_options(max_retries=0).models.list()
+        logger.info("✅ LLM async connection pool warmed up")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ LLM async warm-up failed: {e}")
+        return False
+
+
+def llm_pool_stats() -> dict:
+    """Connection pool kullanım metrikleri (metered transport sayaçları; httpx internal'larına bakılmaz)."""
+    return {
+        "max_connections": settings.LLM_MAX_CONNECTIONS,
+        "requests": _POOL_METRICS.requests,
+        "errors": _POOL_METRICS.errors,
+        "in_flight": _POOL_METRICS.in_flight,
+        "max_in_flight": _POOL_METRICS.max_in_flight,
+        "avg_ms": round(_POOL_METRICS.total_seconds / _POOL_METRICS.requests * 1000, 2)
+                  if _POOL_METRICS.requests else 0.0,
+        "clients": _build_llm.cache_info().currsize,
+        "async_pools": _POOL_METRICS.async_pools,
+    }
+
+
+# ─── Metrics ─────────────────────────────────────────────
+def _metric_samples():
+    # Cache henüz oluşturulmadıysa scrape onu açmasın
+    if get_llm_cache.cache_info().currsize and get_llm_cache() is not None:
+        stats = get_llm_cache().stats()
+        help = "LLM response cache lookups by result"
+        for result in ("hits", "misses", "bypassed"):
+            yield "career_llm_cache_lookups_total", "counter", help, {"result": result}, stats[result]
+        yield "career_llm_cache_evictions_total", "counter", "LLM response cache evictions", {}, stats["evictions"]
+        yield "career_llm_cache_entries", "gauge", "LLM response cache size", {}, stats["entries"]
+
+    yield "career_llm_http_requests_total", "counter", "HTTP requests to the LLM provider", {}, _POOL_METRICS.requests
+    yield "career_llm_http_errors_total", "counter", "Failed HTTP requests to the LLM provider", {}, _POOL_METRICS.errors
+    yield "career_llm_http_in_flight", "gauge", "LLM HTTP requests in flight", {}, _POOL_METRICS.in_flight
+
+
+REGISTRY.register_collector(_metric_samples)
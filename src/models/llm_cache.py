@@ -0,0 +1,199 @@
+"""
+llm_cache.py
+────────────
+Agent node'ları için kalıcı LLM response cache'i (SQLite).
+
+ChatOpenAI'ye `cache=` ile verilir; LangChain her çağrıdan önce
+lookup(prompt, llm_string), sonra update(...) çağırır:
+- prompt:     serialize edilmiş mesajlar (system + user)
+- llm_string: model, temperature ve diğer çağrı parametreleri
+Key = SHA-256(llm_string) + SHA-256(prompt) → aynı CV + aynı prompt +
+aynı model ayarı tekrar LLM'e gitmez.
+
+- TTL: süresi geçen kayıt miss sayılır ve silinir
+- Boyut: max_entries aşılınca en eski erişilen kayıtlar silinir
+- Bypass: `with llm_cache_bypass():` bloğundaki çağrılar cache'e
+  bakmaz ve yazmaz (contextvar → LangGraph node'larına da geçer)
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+logger = logging.getLogger(__name__)
+
+_BYPASS: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_cache_bypass", default=False)
+
+
+@contextmanager
+def llm_cache_bypass(enabled: bool = True) -> Iterator[None]:
+    """Bu blok içindeki LLM çağrıları cache'i atlar (okuma + yazma)."""
+    token = _BYPASS.set(enabled)
+    try:
+        yield
+    finally:
+        _BYPASS.reset(token)
+
+
+class SQLiteLLMCache(BaseCache):
+    """TTL + boyut limitli, thread-safe SQLite LLM cache'i."""
+
+    def __init__(self, path: str, ttl_seconds: float = 0, max_entries: int = 0):
+        """
+        Args:
+            path:        SQLite dosyası (":memory:" test için)
+            ttl_seconds: 0 → süresiz
+            max_entries: 0 → limitsiz
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")   # Birden fazla process okuyabilsin
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                llm_hash    TEXT NOT NULL,
+                prompt_hash TEXT NOT NULL,
+                value       TEXT NOT NULL,
+                created_at  REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (llm_hash, prompt_hash)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)")
+
+    # ── Key ──────────────────────────────────────────
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    # ── BaseCache API ────────────────────────────────
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        if _BYPASS.get():
+            with self._lock:
+                self.bypassed += 1
+            return None
+
+        key = (self._hash(llm_string), self._hash(prompt))
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE llm_hash = ? AND prompt_hash = ?",
+                key,
+            ).fetchone()
+
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE llm_hash = ? AND prompt_hash = ?", key)
+                self.evictions += 1
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE llm_hash = ? AND prompt_hash = ?",
+                (now, *key),
+            )
+            self.hits += 1
+
+        try:
+            return _loads(row[0])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"LLM cache entry unreadable, ignoring: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        if _BYPASS.get():
+            return
+
+        key = (self._hash(llm_string), self._hash(prompt))
+        now = time.time()
+        value = _dumps(return_val)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?)",
+                (*key, value, now, now),
+            )
+            if self.max_entries:
+                self._evict_over_limit()
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self.hits = self.misses = self.bypassed = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "evictions": self.evictions,
+                "entries": entries,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    # ── Eviction ─────────────────────────────────────
+    def _evict_over_limit(self) -> None:
+        """En eski erişilen kayıtları max_entries'e inene kadar sil (lock altında)."""
+        cursor = self._conn.execute(
+            """
+            DELETE FROM llm_cache WHERE rowid IN (
+                SELECT rowid FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+        self.evictions += max(cursor.rowcount, 0)
+
+
+# ─── Serialization ───────────────────────────────────────
+# langchain_core.load.loads beta + allowed_objects uyarısı veriyor;
+# mesaj dict formatı stabil ve sadece veri içeriyor.
+def _dumps(generations: Sequence[Generation]) -> str:
+    payload = []
+    for generation in generations:
+        item = {"text": generation.text, "generation_info": generation.generation_info}
+        if isinstance(generation, ChatGeneration):
+            item["message"] = message_to_dict(generation.message)
+        payload.append(item)
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _loads(value: str) -> list[Generation]:
+    generations: list[Generation] = []
+    for item in json.loads(value):
+        if "message" in item:
+            message = messages_from_dict([item["message"]])[0]
+            generations.append(ChatGeneration(message=message, generation_info=item["generation_info"]))
+        else:
+            generations.append(Generation(text=item["text"], generation_info=item["generation_info"]))
+    return generations
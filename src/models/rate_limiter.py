@@ -0,0 +1,264 @@
+"""
+rate_limiter.py
+───────────────
+Process genelinde (opsiyonel: process'ler arası) LLM rate limiter'ı.
+
+İki token bucket, provider limitleriyle aynı birimde:
+- requests / dakika (LLM_RATE_LIMIT_RPM)
+- tokens / dakika   (LLM_RATE_LIMIT_TPM) — çağrı öncesi tahmin
+  (prompt ~4 char/token + beklenen output), cevap gelince gerçek usage ile düzeltilir
+
+Her çağrı kapasiteyi lock altında HEMEN rezerve eder (bucket eksiye
+düşebilir) ve borç kapanana kadar bekler → bekleme sırası varış sırasıdır
+(FIFO), sync thread'ler ve async task'lar aynı kuyrukta adil sıralanır.
+
+LLM_RATE_LIMIT_PATH verilirse bucket durumu SQLite'ta tutulur; aynı
+dosyayı kullanan tüm worker process'leri tek limiti paylaşır.
+
+Sadece provider'a giden çağrılar sayılır (response cache hit'leri değil).
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, List, Optional
+
+from src.core.config import settings
+from src.core.constants import RATE_LIMIT_CHARS_PER_TOKEN, RATE_LIMIT_OUTPUT_TOKENS
+from src.core.metrics import LLM_RATE_LIMIT_WAIT_SECONDS, REGISTRY
+
+
+class TokenBucketLimiter:
+    """RPM + TPM token bucket'ı; rezervasyon sırasıyla (FIFO) bekletir."""
+
+    def __init__(self, rpm: int = 0, tpm: int = 0, path: str = ""):
+        """
+        Args:
+            rpm:  requests / dakika (0 → limitsiz)
+            tpm:  tokens / dakika   (0 → limitsiz)
+            path: SQLite dosyası → process'ler arası ortak bucket (boş = process içi)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.path = path
+
+        self._lock = threading.Lock()
+        # [kalan request, kalan token, son güncelleme (time.time)] — dolu başlar
+        self._levels = [float(rpm), float(tpm), time.time()]
+        self.waiting = 0
+        self.max_waiting = 0
+        self.throttled = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit "
+                "(name TEXT PRIMARY KEY, requests REAL, tokens REAL, updated_at REAL)"
+            )
+
+    # ── Reservation ──────────────────────────────────
+    def reserve(self, tokens: int) -> float:
+        """
+        1 request + tokens rezerve et (bekleme olmadan).
+
+        Returns:
+            Çağrının başlayabilmesi için beklenmesi gereken saniye
+        """
+        with self._lock:
+            if self._conn is None:
+                wait, self._levels = self._take(self._levels, tokens)
+                return wait
+            return self._update_shared(lambda levels: self._take(levels, tokens))
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Tahmin ile gerçek token farkını bucket'a yansıt (fazla tahmin → iade)."""
+        if not self.tpm or estimated == actual:
+            return
+        self._credit(0, estimated - actual)
+
+    def release(self, tokens: int) -> None:
+        """Hiç gönderilmeyen çağrının rezervasyonunu (1 request + tokens) iade et."""
+        self._credit(1, min(tokens, self.tpm))
+
+    def _credit(self, requests: int, tokens: int) -> None:
+        def credit(levels):
+            available_requests, available_tokens, updated_at = levels
+            if self.rpm:
+                available_requests = min(float(self.rpm), available_requests + requests)
+            if self.tpm:
+                available_tokens = min(float(self.tpm), available_tokens + tokens)
+            return None, [available_requests, available_tokens, updated_at]
+
+        with self._lock:
+            if self._conn is None:
+                _, self._levels = credit(self._levels)
+            else:
+                self._update_shared(credit)
+
+    def _take(self, levels: List[float], tokens: int):
+        requests, available, updated_at = levels
+        now = time.time()
+        elapsed = max(0.0, now - updated_at)
+        wait = 0.0
+        if self.rpm:
+            requests = min(float(self.rpm), requests + elapsed * self.rpm / 60) - 1
+            wait = max(wait, -requests * 60 / self.rpm)
+        if self.tpm:
+            # Tek çağrı bucket'tan büyükse sonsuza kadar beklemesin
+            available = min(float(self.tpm), available + elapsed * self.tpm / 60) - min(tokens, self.tpm)
+            wait = max(wait, -available * 60 / self.tpm)
+        return wait, [requests, available, now]
+
+    def _update_shared(self, update):
+        # BEGIN IMMEDIATE: aynı dosyayı kullanan process'ler sırayla okuyup yazar
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute(
+                "SELECT requests, tokens, updated_at FROM rate_limit WHERE name = 'llm'"
+            ).fetchone()
+            levels = list(row) if row else [float(self.rpm), float(self.tpm), time.time()]
+            result, levels = update(levels)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rate_limit (name, requests, tokens, updated_at) VALUES ('llm', ?, ?, ?)",
+                levels,
+            )
+            self._conn.execute("COMMIT")
+            return result
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    # ── Acquire ──────────────────────────────────────
+    def acquire(self, tokens: int) -> float:
+        """Rezerve et + sırası gelene kadar bekle (thread'i bloklar). Beklenen süreyi döner."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._enter_queue()
+            try:
+                time.sleep(wait)
+            except BaseException:
+                # KeyboardInterrupt vb. → çağrı yapılmayacak, sıradakiler boşuna beklemesin
+                self.release(tokens)
+                raise
+            finally:
+                self._leave_queue()
+        LLM_RATE_LIMIT_WAIT_SECONDS.observe(wait)
+        return wait
+
+    async def aacquire(self, tokens: int) -> float:
+        """acquire'ın async versiyonu (event loop'u bloklamaz)."""
+        if self._conn is None:
+            wait = self.reserve(tokens)
+        else:
+            # SQLite lock'u başka process'te olabilir
+            wait = await asyncio.to_thread(self.reserve, tokens)
+        if wait > 0:
+            self._enter_queue()
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                # Task iptal edildi (client koptu, speculation atıldı) → rezervasyonu iade et
+                self.release(tokens)
+                raise
+            finally:
+                self._leave_queue()
+        LLM_RATE_LIMIT_WAIT_SECONDS.observe(wait)
+        return wait
+
+    def _enter_queue(self) -> None:
+        with self._lock:
+            self.waiting += 1
+            self.throttled += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+
+    def _leave_queue(self) -> None:
+        with self._lock:
+            self.waiting -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rpm": self.rpm,
+                "tpm": self.tpm,
+                "shared": self._conn is not None,
+                "waiting": self.waiting,
+                "max_waiting": self.max_waiting,
+                "throttled": self.throttled,
+            }
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter() -> Optional[TokenBucketLimiter]:
+    """Process genelinde tek limiter (RPM ve TPM 0 ise None → limitsiz)."""
+    if not settings.rate_limit_enabled:
+        return None
+    return TokenBucketLimiter(
+        rpm=settings.LLM_RATE_LIMIT_RPM,
+        tpm=settings.LLM_RATE_LIMIT_TPM,
+        path=settings.LLM_RATE_LIMIT_PATH,
+    )
+
+
+# ─── Chat Model Mixin ────────────────────────────────────
+def estimate_tokens(messages: list, max_tokens: Optional[int] = None) -> int:
+    """Provider'ın TPM hesabına yakın tahmin: prompt karakterleri / 4 + beklenen output."""
+    chars = sum(len(str(message.content)) for message in messages)
+    return chars // RATE_LIMIT_CHARS_PER_TOKEN + (max_tokens or RATE_LIMIT_OUTPUT_TOKENS)
+
+
+class _RateLimitedMixin:
+    """_generate / _agenerate'ten önce limiter'dan sıra alır (cache hit'leri buraya gelmez)."""
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        limiter = get_rate_limiter()
+        if limiter is None:
+            return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        estimated = estimate_tokens(messages, getattr(self, "max_tokens", None))
+        limiter.acquire(estimated)
+        result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        _settle(limiter, estimated, result)
+        return result
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        limiter = get_rate_limiter()
+        if limiter is None:
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        estimated = estimate_tokens(messages, getattr(self, "max_tokens", None))
+        await limiter.aacquire(estimated)
+        result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        _settle(limiter, estimated, result)
+        return result
+
+
+def _settle(limiter: TokenBucketLimiter, estimated: int, result) -> None:
+    usage = getattr(result.generations[0].message, "usage_metadata", None) if result.generations else None
+    if usage and usage.get("total_tokens"):
+        limiter.settle(estimated, usage["total_tokens"])
+
+
+@lru_cache(maxsize=None)
+def rate_limited(cls: type) -> type:
+    """Chat model class'ının limiter'lı alt sınıfı."""
+    # Aynı class adı: LLM response cache key'i (serialize edilmiş model id'si) limiter açılınca değişmesin
+    return type(cls.__name__, (_RateLimitedMixin, cls), {"__module__": __name__})
+
+
+# ─── Metrics ─────────────────────────────────────────────
+def _metric_samples():
+    if not get_rate_limiter.cache_info().currsize or get_rate_limiter() is None:
+        return
+    stats = get_rate_limiter().stats()
+    yield "career_llm_rate_limit_queue_depth", "gauge", "LLM calls waiting for rate limit capacity", {}, stats["waiting"]
+    yield "career_llm_rate_limit_throttled_total", "counter", "LLM calls delayed by the rate limiter", {}, stats["throttled"]
+
+
+REGISTRY.register_collector(_metric_samples)
@@ -4,11 +4,21 @@ career_services.py
 LLM tabanlı kariyer analiz pipeline'ı için servis katmanı.
 """
 
+import asyncio
 import os
-from typing import Tuple
+from typing import AsyncIterator, Iterator, Optional, Tuple
 
-from src.api.cv_parser import parse_cv
-from src.graph.graph import build_graph
+from src.api.cv_parser import parse_cv, parse_cv_bytes
+from src.graph.checkpoint import (
+    afinish_run,
+    apipeline_input,
+    finish_run,
+    new_run_id,
+    pipeline_input,
+    run_config,
+)
+from src.graph.graph import get_graph
+from src.graph.progress import node_progress
 from src.graph.state import CareerPipelineState
 from src.models.schemas import (
     CareerAnalysisResult,
@@ -19,18 +29,287 @@ from src.models.schemas import (
     JobRecommendation,
     AgentTraceEntry,
 )
-from src.utils.parser import safe_json_parse
 
 
 def run_career_analysis(
-    cv_file_path: str,
+    cv_file_path: Optional[str],
+    cv_file_type: str,
+    target_role: str = "",
+    target_location: str = "",
+    cv_bytes: Optional[bytes] = None,
+    use_llm_cache: bool = True,
+    run_id: Optional[str] = None,
+) -> Tuple[dict, CareerPipelineState]:
+    """
+    Career analysis pipeline with LangSmith tracing (ham dict + state döner).
+
+    `cv_bytes` verilirse CV doğrudan bellekten parse edilir
+    (upload'lar için temp dosya gerekmez), `cv_file_path` yok sayılır.
+    `use_llm_cache=False` → bu çalıştırmada LLM response cache'i atlanır.
+    `run_id` → checkpoint anahtarı: daha önce bu run_id ile başlayıp hata
+    almış run varsa son tamamlanan node'dan devam eder (biten node'lar
+    tekrar çalışmaz). CV / rol / lokasyon farklıysa RunInputMismatch.
+    """
+    _enable_tracing()
+
+    # ── Step 1: CV Parse ──────────────────────────────
+    cv_data = _parse_input(cv_file_path, cv_file_type, cv_bytes)
+
+    # ── Step 2: Pipeline çalıştır ────────────────────
+    pipeline = get_graph()
+    initial_state, config = _pipeline_inputs(cv_data, target_role, target_location, run_id)
+
+    from src.models.llm_cache import llm_cache_bypass
+
+    with llm_cache_bypass(not use_llm_cache):
+        final_state: CareerPipelineState = pipeline.invoke(
+            pipeline_input(pipeline, config, initial_state), config=config
+        )
+    finish_run(pipeline, config)
+
+    return cv_data, final_state
+
+
+async def arun_career_analysis(
+    cv_file_path: Optional[str],
     cv_file_type: str,
     target_role: str = "",
     target_location: str = "",
+    cv_bytes: Optional[bytes] = None,
+    use_llm_cache: bool = True,
+    run_id: Optional[str] = None,
 ) -> Tuple[dict, CareerPipelineState]:
-    """Career analysis pipeline with LangSmith tracing (ham dict + state döner)."""
+    """
+    run_career_analysis'in async versiyonu (FastAPI için).
+
+    Parse worker thread'de, pipeline .ainvoke() ile async node'larda çalışır;
+    LLM / job search beklerken event loop diğer request'lere hizmet eder.
+    """
+    _enable_tracing()
+
+    cv_data = await asyncio.to_thread(_parse_input, cv_file_path, cv_file_type, cv_bytes)
+
+    pipeline = get_graph()
+    initial_state, config = _pipeline_inputs(cv_data, target_role, target_location, run_id)
+
+    from src.models.llm_cache import llm_cache_bypass
+
+    with llm_cache_bypass(not use_llm_cache):
+        final_state: CareerPipelineState = await pipeline.ainvoke(
+            await apipeline_input(pipeline, config, initial_state), config=config
+        )
+    await afinish_run(pipeline, config)
+
+    return cv_data, final_state
+
+
+# ─── Streaming ───────────────────────────────────────────
+# Event'ler:
+#   {"event": "parsed",   "data": {"char_count": ..., "run_id": ...}}  (resume için)
+#   {"event": "node",     "data": node_progress(...)}      (her node bitince)
+#   {"event": "complete", "cv_data": ..., "final_state": ...}
+_STREAM_MODES = ["updates", "values"]
+
+
+def stream_career_analysis(
+    cv_file_path: Optional[str],
+    cv_file_type: str,
+    target_role: str = "",
+    target_location: str = "",
+    cv_bytes: Optional[bytes] = None,
+    use_llm_cache: bool = True,
+    run_id: Optional[str] = None,
+) -> Iterator[dict]:
+    """
+    run_career_analysis'in streaming versiyonu (Streamlit progress için).
+
+    Her node tamamlandığında ara sonuçlarla bir "node" event'i üretir;
+    son event "complete" (ham cv_data + final_state).
+    """
+    _enable_tracing()
+
+    run_id = run_id or new_run_id()
+    cv_data = _parse_input(cv_file_path, cv_file_type, cv_bytes)
+    yield {"event": "parsed", "data": {"char_count": cv_data["char_count"], "run_id": run_id}}
+
+    pipeline = get_graph()
+    initial_state, config = _pipeline_inputs(cv_data, target_role, target_location, run_id)
+    final_state = initial_state
+
+    from src.models.llm_cache import llm_cache_bypass
+
+    with llm_cache_bypass(not use_llm_cache):
+        graph_input = pipeline_input(pipeline, config, initial_state)
+        for mode, chunk in pipeline.stream(graph_input, config=config, stream_mode=_STREAM_MODES):
+            if mode == "values":
+                final_state = chunk
+                continue
+            yield from _node_events(chunk)
+    finish_run(pipeline, config)
+
+    yield {"event": "complete", "cv_data": cv_data, "final_state": final_state}
+
+
+async def astream_career_analysis(
+    cv_file_path: Optional[str],
+    cv_file_type: str,
+    target_role: str = "",
+    target_location: str = "",
+    cv_bytes: Optional[bytes] = None,
+    use_llm_cache: bool = True,
+    run_id: Optional[str] = None,
+) -> AsyncIterator[dict]:
+    """stream_career_analysis'in async versiyonu (SSE endpoint için)."""
+    _enable_tracing()
+
+    run_id = run_id or new_run_id()
+    cv_data = await asyncio.to_thread(_parse_input, cv_file_path, cv_file_type, cv_bytes)
+    yield {"event": "parsed", "data": {"char_count": cv_data["char_count"], "run_id": run_id}}
+
+    pipeline = get_graph()
+    initial_state, config = _pipeline_inputs(cv_data, target_role, target_location, run_id)
+    final_state = initial_state
+
+    from src.models.llm_cache import llm_cache_bypass
+
+    with llm_cache_bypass(not use_llm_cache):
+        graph_input = await apipeline_input(pipeline, config, initial_state)
+        async for mode, chunk in pipeline.astream(graph_input, config=config, stream_mode=_STREAM_MODES):
+            if mode == "values":
+                final_state = chunk
+                continue
+            for event in _node_events(chunk):
+                yield event
+    await afinish_run(pipeline, config)
+
+    yield {"event": "complete", "cv_data": cv_data, "final_state": final_state}
+
+
+async def astream_career_analysis_structured(
+    cv_file_path: Optional[str],
+    cv_file_type: str,
+    target_role: str = "",
+    target_location: str = "",
+    cv_bytes: Optional[bytes] = None,
+    use_llm_cache: bool = True,
+    run_id: Optional[str] = None,
+) -> AsyncIterator[dict]:
+    """
+    astream_career_analysis + son event'te CareerAnalysisResult.
+
+    Tüm event'lerin "data"sı JSON-serializable; son event
+    {"event": "result", "data": CareerAnalysisResult (dict)}.
+    """
+    async for event in astream_career_analysis(
+        cv_file_path=cv_file_path,
+        cv_file_type=cv_file_type,
+        target_role=target_role,
+        target_location=target_location,
+        cv_bytes=cv_bytes,
+        use_llm_cache=use_llm_cache,
+        run_id=run_id,
+    ):
+        if event["event"] == "complete":
+            result = _to_structured(event["cv_data"], event["final_state"])
+            yield {"event": "result", "data": result.model_dump(mode="json")}
+        else:
+            yield event
+
+
+def run_career_analysis_structured(
+    cv_file_path: Optional[str],
+    cv_file_type: str,
+    target_role: str = "",
+    target_location: str = "",
+    cv_bytes: Optional[bytes] = None,
+    use_llm_cache: bool = True,
+    run_id: Optional[str] = None,
+) -> CareerAnalysisResult:
+    """
+    Yüksek seviyeli servis fonksiyonu.
+
+    - CV dosyasını okur,
+    - LangGraph pipeline'ını çalıştırır,
+    - Analyzer / Optimizer / Job Hunter çıktısını Pydantic modellerine map eder.
+    """
 
-    # ── FORCE LangSmith Environment ──────────────────
+    cv_data_raw, final_state = run_career_analysis(
+        cv_file_path=cv_file_path,
+        cv_file_type=cv_file_type,
+        target_role=target_role,
+        target_location=target_location,
+        cv_bytes=cv_bytes,
+        use_llm_cache=use_llm_cache,
+        run_id=run_id,
+    )
+    return _to_structured(cv_data_raw, final_state)
+
+
+async def arun_career_analysis_structured(
+    cv_file_path: Optional[str],
+    cv_file_type: str,
+    target_role: str = "",
+    target_location: str = "",
+    cv_bytes: Optional[bytes] = None,
+    use_llm_cache: bool = True,
+    run_id: Optional[str] = None,
+) -> CareerAnalysisResult:
+    """run_career_analysis_structured'ın async versiyonu."""
+
+    cv_data_raw, final_state = await arun_career_analysis(
+        cv_file_path=cv_file_path,
+        cv_file_type=cv_file_type,
+        target_role=target_role,
+        target_location=target_location,
+        cv_bytes=cv_bytes,
+        use_llm_cache=use_llm_cache,
+        run_id=run_id,
+    )
+    return _to_structured(cv_data_raw, final_state)
+
+
+def warm_up_pipeline() -> None:
+    """
+    İlk request'in ödeyeceği kurulum maliyetlerini startup'ta öde:
+    graph compile, prompt dosyaları ve (LLM_WARMUP açıksa) LLM client + sync pool.
+    """
+    from src.core.config import settings
+
+    _warm_up_graph()
+
+    if settings.LLM_WARMUP:
+        from src.models.llm import warm_up_llm
+
+        warm_up_llm()
+
+
+async def awarm_up_pipeline() -> None:
+    """
+    warm_up_pipeline'ın async versiyonu (FastAPI lifespan).
+
+    Async LLM pool'u event loop başına ayrı: bağlantı, request'lere hizmet
+    edecek loop'ta açılsın diye burada (thread'e devretmeden) await edilir.
+    """
+    from src.core.config import settings
+
+    await asyncio.to_thread(_warm_up_graph)
+
+    if settings.LLM_WARMUP:
+        from src.models.llm import awarm_up_llm
+
+        await awarm_up_llm()
+
+
+def _warm_up_graph() -> None:
+    from src.services.prompt_loader import load_all_prompts
+
+    get_graph()
+    load_all_prompts()
+
+
+# ─── Helpers ─────────────────────────────────────────────
+def _enable_tracing() -> None:
+    """FORCE LangSmith Environment."""
     from src.core.config import settings
 
     if settings.langsmith_ok:
@@ -42,22 +321,42 @@ def run_career_analysis(
     else:
         print("⚠️ LangSmith API key missing, tracing disabled")
 
-    # ── Step 1: CV Parse ──────────────────────────────
-    cv_data = parse_cv(cv_file_path, cv_file_type)
 
-    # ── Step 2: Pipeline çalıştır ────────────────────
-    pipeline = build_graph()
+def _parse_input(cv_file_path: Optional[str], cv_file_type: str, cv_bytes: Optional[bytes]) -> dict:
+    if cv_bytes is not None:
+        return parse_cv_bytes(cv_bytes, cv_file_type)
+    return parse_cv(cv_file_path, cv_file_type)
+
+
+def _node_events(chunk: dict) -> Iterator[dict]:
+    """stream_mode="updates" chunk'ı ({node: update}) → "node" event'leri."""
+    for node, update in chunk.items():
+        if node.startswith("__"):       # __interrupt__ vb.
+            continue
+        yield {"event": "node", "data": node_progress(node, update)}
 
+
+def _pipeline_inputs(
+    cv_data: dict,
+    target_role: str,
+    target_location: str,
+    run_id: Optional[str] = None,
+) -> Tuple[CareerPipelineState, dict]:
+    """Initial state + LangSmith / checkpoint config (run_id yoksa yeni run)."""
     initial_state: CareerPipelineState = {
         "cv_text": cv_data["raw_text"],
         "target_role": target_role,
         "target_location": target_location,
-        "analyzer_output": "",
-        "critic_output": "",
-        "optimizer_output": "",
-        "job_hunter_output": "",
+        "analyzer_output": {},
+        "analyzer_delta": {},
+        "critic_output": {},
+        "optimizer_output": {},
+        "job_hunter_output": {},
+        "raw_outputs": {},
+        "job_listings": [],
         "retry_count": 0,
         "approved": False,
+        "gate_decision": "",
         "trace_log": [],
     }
 
@@ -76,46 +375,26 @@ def run_career_analysis(
             "target_location": target_location,
         },
         "run_name": f"CV Analysis - {target_role or 'General'}",
+        **run_config(run_id or new_run_id()),
     }
-
-    final_state: CareerPipelineState = pipeline.invoke(initial_state, config=config)
-
-    return cv_data, final_state
+    return initial_state, config
 
 
-def run_career_analysis_structured(
-    cv_file_path: str,
-    cv_file_type: str,
-    target_role: str = "",
-    target_location: str = "",
-) -> CareerAnalysisResult:
-    """
-    Yüksek seviyeli servis fonksiyonu.
-
-    - CV dosyasını okur,
-    - LangGraph pipeline'ını çalıştırır,
-    - Analyzer / Optimizer / Job Hunter çıktısını Pydantic modellerine map eder.
-    """
+def _to_structured(cv_data_raw: dict, final_state: CareerPipelineState) -> CareerAnalysisResult:
+    """Analyzer / Optimizer / Job Hunter çıktısını Pydantic modellerine map et."""
 
-    cv_data_raw, final_state = run_career_analysis(
-        cv_file_path=cv_file_path,
-        cv_file_type=cv_file_type,
-        target_role=target_role,
-        target_location=target_location,
-    )
+    # Node'lar çıktıları parse edilmiş dict olarak yazıyor; burada tekrar parse yok.
 
     # ── Analyzer output ───────────────────────────────
-    analyzer_data = safe_json_parse(final_state["analyzer_output"])
-    cv_analysis_raw = analyzer_data.get("cv_analysis", {})
+    cv_analysis_raw = final_state["analyzer_output"].get("cv_analysis", {})
     cv_analysis = CVAnalysis.model_validate(cv_analysis_raw)
 
     # ── Optimizer output ──────────────────────────────
-    optimizer_data_raw = safe_json_parse(final_state["optimizer_output"])
-    optimizer_output = CVOptimizerOutput.model_validate(optimizer_data_raw)
+    optimizer_output = CVOptimizerOutput.model_validate(final_state["optimizer_output"])
 
     # ── Job hunter output (opsiyonel) ────────────────
     if final_state.get("job_hunter_output"):
-        job_data_raw = safe_json_parse(final_state["job_hunter_output"])
+        job_data_raw = final_state["job_hunter_output"]
     else:
         job_data_raw = {
             "job_recommendations": [],
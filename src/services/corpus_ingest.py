@@ -0,0 +1,242 @@
+"""
+corpus_ingest.py
+────────────────
+Dizin dolusu CV'yi toplu işleyen CLI (analytics için ön işleme).
+
+Akış:
+- Dizin recursive taranır (SUPPORTED_EXTENSIONS)
+- Her dosyanın SHA-256'sı ana process'te hesaplanır; output JSONL'de
+  zaten "ok" olarak bulunan hash'ler atlanır (resume), aynı içerik iki
+  kez gelirse ikincisi işlenmez (dedupe)
+- Parse + contact + section extraction process pool'da yapılır
+- Sonuçlar bittikçe JSONL'e satır satır yazılır (yarıda kesilse bile
+  yazılanlar kalır), sonunda throughput özeti basılır
+
+Kullanım:
+    python -m src.services.corpus_ingest ./cvs -o corpus.jsonl --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from src.api.cv_parser import extract_contact_info, extract_sections, parse_cv_bytes
+from src.core.constants import (
+    INGEST_INFLIGHT_PER_WORKER,
+    MAX_CV_SIZE_BYTES,
+    SUPPORTED_EXTENSIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IngestSummary:
+    """Bir ingestion koşusunun sayaçları."""
+    processed: int = 0
+    failed: int = 0
+    resumed: int = 0       # Output'ta zaten olduğu için atlanan
+    duplicates: int = 0    # Bu koşuda aynı içerik ikinci kez görüldü
+    bytes_read: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def files_per_sec(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mb_per_sec(self) -> float:
+        return self.bytes_read / 1024 / 1024 / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        return (
+            f"processed={self.processed} failed={self.failed} "
+            f"resumed={self.resumed} duplicates={self.duplicates} | "
+            f"{self.bytes_read / 1024 / 1024:.1f} MB in {self.elapsed:.1f}s → "
+            f"{self.files_per_sec:.1f} files/s, {self.mb_per_sec:.2f} MB/s"
+        )
+
+
+# ─── Discovery / Resume ──────────────────────────────────
+def iter_cv_files(root: str) -> Iterator[str]:
+    """root altındaki desteklenen CV dosyalarını deterministik sırada döndür."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                yield os.path.join(dirpath, name)
+
+
+def load_processed_hashes(output_path: str) -> Set[str]:
+    """Önceki koşulardan başarıyla işlenmiş hash'ler (resume için)."""
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Yarıda kesilmiş son satır
+            if record.get("status") == "ok" and record.get("sha256"):
+                done.add(record["sha256"])
+    return done
+
+
+def _read_files(root: str, max_bytes: int) -> Iterator[Tuple[str, str, Optional[bytes]]]:
+    """
+    (path, sha256, data) üret. Dosya bir kez okunur; aynı byte'lar hem hash
+    hem worker için kullanılır. Limit aşan dosyalarda data None döner.
+    """
+    for path in iter_cv_files(root):
+        if os.path.getsize(path) > max_bytes:
+            yield path, "", None
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        yield path, hashlib.sha256(data).hexdigest(), data
+
+
+# ─── Worker ──────────────────────────────────────────────
+def _process_one(path: str, sha256: str, data: bytes, include_text: bool) -> Dict:
+    """Process pool worker'ı: tek CV'yi parse edip JSONL kaydı üret."""
+    started = time.perf_counter()
+    file_type = os.path.splitext(path)[1].lower().lstrip(".")
+    record: Dict = {"sha256": sha256, "path": path, "file_type": file_type, "bytes": len(data)}
+
+    try:
+        # Cache'e gerek yok: resume zaten hash bazlı, corpus'u memory'de tutmayalım
+        parsed = parse_cv_bytes(data, file_type, use_cache=False)
+        raw_text = parsed["raw_text"]
+        record.update({
+            "status": "ok",
+            "char_count": parsed["char_count"],
+            "pages_skipped": parsed["pages_skipped"],
+            "backend": parsed["backend"],
+            "contact": extract_contact_info(raw_text),
+            "sections": extract_sections(raw_text),
+        })
+        if include_text:
+            record["raw_text"] = raw_text
+    except Exception as e:
+        record.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+
+    record["seconds"] = round(time.perf_counter() - started, 4)
+    return record
+
+
+# ─── Ingestion ───────────────────────────────────────────
+def ingest_directory(
+    root: str,
+    output_path: str,
+    workers: Optional[int] = None,
+    include_text: bool = False,
+    max_bytes: int = MAX_CV_SIZE_BYTES,
+) -> IngestSummary:
+    """
+    root altındaki tüm CV'leri işleyip output_path'e (JSONL) ekle.
+
+    Args:
+        root:         CV dizini (recursive taranır)
+        output_path:  JSONL çıktı; varsa append edilir ve "ok" hash'ler atlanır
+        workers:      Process sayısı (None → os.cpu_count())
+        include_text: Kayda raw_text'i de ekle
+        max_bytes:    Bundan büyük dosyalar hata kaydıyla atlanır
+
+    Returns:
+        IngestSummary
+    """
+    workers = workers or os.cpu_count() or 1
+    max_inflight = workers * INGEST_INFLIGHT_PER_WORKER
+    done = load_processed_hashes(output_path)
+    seen: Set[str] = set()
+    summary = IngestSummary()
+    started = time.perf_counter()
+
+    logger.info(f"📂 Ingesting {root} → {output_path} ({workers} workers, {len(done)} already done)")
+
+    with open(output_path, "a", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+
+        def write(record: Dict) -> None:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            if record["status"] == "ok":
+                summary.processed += 1
+            else:
+                summary.failed += 1
+                logger.warning(f"❌ {record['path']}: {record['error']}")
+
+        def drain(pending: Set[Future], keep: int) -> Set[Future]:
+            # keep'ten fazla iş varken biten her işi yaz (tamamlanma sırasıyla)
+            while len(pending) > keep:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    write(future.result())
+            return pending
+
+        pending: Set[Future] = set()
+        for path, sha256, data in _read_files(root, max_bytes):
+            if data is None:
+                write({"sha256": sha256, "path": path, "status": "error",
+                       "error": f"File too large (> {max_bytes} bytes)"})
+                continue
+            if sha256 in done:
+                summary.resumed += 1
+                continue
+            if sha256 in seen:
+                summary.duplicates += 1
+                continue
+            seen.add(sha256)
+            summary.bytes_read += len(data)
+            pending.add(pool.submit(_process_one, path, sha256, data, include_text))
+            pending = drain(pending, max_inflight - 1)
+
+        drain(pending, 0)
+
+    summary.elapsed = time.perf_counter() - started
+    logger.info(f"✅ Ingestion done: {summary.format()}")
+    return summary
+
+
+# ─── CLI ─────────────────────────────────────────────────
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.services.corpus_ingest",
+        description="Bir dizindeki CV'leri parse edip JSONL'e yaz (resumable).",
+    )
+    parser.add_argument("root", help="CV dizini (recursive)")
+    parser.add_argument("-o", "--output", default="cv_corpus.jsonl", help="JSONL çıktı dosyası")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Process sayısı (default: CPU sayısı)")
+    parser.add_argument("--include-text", action="store_true", help="raw_text'i kayda ekle")
+    parser.add_argument(
+        "--max-mb", type=float, default=MAX_CV_SIZE_BYTES / 1024 / 1024,
+        help="Bundan büyük dosyaları atla",
+    )
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.root):
+        parser.error(f"Not a directory: {args.root}")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    summary = ingest_directory(
+        args.root,
+        args.output,
+        workers=args.workers,
+        include_text=args.include_text,
+        max_bytes=int(args.max_mb * 1024 * 1024),
+    )
+    print(summary.format())
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+parse_cache.py
+──────────────
+parse_cv sonuçları için content-addressed cache.
+
+Key = SHA-256(namespace + dosya byte'ları). Namespace parser versiyonunu
+ve çıktıyı etkileyen ayarları içerir; parser değişince eski kayıtlar
+kendiliğinden geçersiz olur.
+
+İki katman:
+- Memory: LRU (OrderedDict), process içi
+- Disk (opsiyonel): <dir>/<key>.json, toplam boyut sınırlı,
+  en eski erişilen kayıtlar silinir
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+
+from src.core.config import settings
+from src.core.constants import PARSE_CACHE_MEMORY_ITEMS
+from src.core.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """İki katmanlı (memory LRU + opsiyonel disk) parse sonucu cache'i."""
+
+    def __init__(
+        self,
+        max_items: int = PARSE_CACHE_MEMORY_ITEMS,
+        disk_dir: str = "",
+        disk_max_bytes: int = 0,
+    ):
+        self.max_items = max_items
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+
+        self._memory: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None   # İlk ihtiyaçta hesaplanır
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    # ── Key ──────────────────────────────────────────
+    @staticmethod
+    def make_key(data: Union[bytes, bytearray, memoryview], namespace: str = "") -> str:
+        """Dosya içeriği + namespace'ten SHA-256 key üret."""
+        digest = hashlib.sha256(namespace.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(data)
+        return digest.hexdigest()
+
+    # ── Public API ───────────────────────────────────
+    def get(self, key: str) -> Optional[dict]:
+        """Cache'te varsa sonucun kopyasını döndür, yoksa None."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return dict(value)
+
+        value = self._disk_get(key)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._memory_put(key, value)
+        return dict(value)
+
+    def put(self, key: str, value: dict) -> None:
+        """Sonucu memory'e (ve disk tier açıksa diske) yaz."""
+        value = dict(value)
+        with self._lock:
+            self._memory_put(key, value)
+        self._disk_put(key, value)
+
+    def clear(self) -> None:
+        """Memory tier'ı ve sayaçları sıfırla (disk dokunulmaz)."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_items": len(self._memory),
+                "disk_bytes": self._disk_bytes or 0,
+            }
+
+    # ── Memory tier ──────────────────────────────────
+    def _memory_put(self, key: str, value: dict) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    # ── Disk tier ────────────────────────────────────
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _disk_get(self, key: str) -> Optional[dict]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)  # LRU eviction için erişim zamanını güncelle
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Parse cache entry unreadable, ignoring: {e}")
+            return None
+
+    def _disk_put(self, key: str, value: dict) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            payload = json.dumps(value, ensure_ascii=False).encode("utf-8")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Parse cache write failed: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(payload)
+            if self.disk_max_bytes and self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(self.disk_dir)
+            if entry.name.endswith(".json")
+        )
+
+    def _evict_disk(self) -> None:
+        """En eski erişilen kayıtları limitin altına inene kadar sil."""
+        entries = sorted(
+            (entry for entry in os.scandir(self.disk_dir) if entry.name.endswith(".json")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.unlink(entry.path)
+                total -= size
+            except OSError:
+                continue
+        self._disk_bytes = total
+
+
+# ─── Singleton ───────────────────────────────────────────
+parse_cache = ParseCache(
+    disk_dir=settings.PARSE_CACHE_DIR,
+    disk_max_bytes=settings.PARSE_CACHE_MAX_MB * 1024 * 1024,
+)
+
+
+def _metric_samples():
+    stats = parse_cache.stats()
+    help = "CV parse cache lookups by result"
+    yield "career_parse_cache_lookups_total", "counter", help, {"result": "memory_hit"}, stats["hits"] - stats["disk_hits"]
+    yield "career_parse_cache_lookups_total", "counter", help, {"result": "disk_hit"}, stats["disk_hits"]
+    yield "career_parse_cache_lookups_total", "counter", help, {"result": "miss"}, stats["misses"]
+
+
+REGISTRY.register_collector(_metric_samples)
@@ -52,4 +52,10 @@ def load_prompt(name: str) -> str:
         )
 
     with open(path, "r", encoding="utf-8") as f:
-        return f.read().strip()
\ No newline at end of file
+        return f.read().strip()
+
+
+def load_all_prompts() -> None:
+    """Tüm prompt'ları cache'e al (server startup'ta)."""
+    for name in _PROMPT_PATHS:
+        load_prompt(name)
@@ -4,7 +4,9 @@ parser.py
 LLM çıktılarından JSON parse eden yardımcı functions.
 """
 
+import copy
 import json
+from typing import Optional
 
 
 def safe_json_parse(raw: str) -> dict:
@@ -36,18 +38,73 @@ def safe_json_parse(raw: str) -> dict:
         raise ValueError(f"JSON parse hatası: {e}\n\nRaw input:\n{raw[:500]}") from e
 
 
-def merge_issues(analyzer_output: str, critic_output: str) -> list[dict]:
+def parse_agent_output(raw: str, root_key: Optional[str] = None) -> dict:
+    """
+    Agent çıktısını BİR KEZ parse edip doğrula (node'da çağrılır, state'e dict yazılır).
+
+    - JSON object olmalı
+    - root_key yoksa ve model alanları doğrudan döndüyse → {root_key: data}
+    - root_key'in değeri dict olmalı
+
+    Raises:
+        ValueError: JSON değil / beklenen yapıda değil
+    """
+    data = safe_json_parse(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"JSON object bekleniyordu, gelen: {type(data).__name__}")
+    if root_key is None:
+        return data
+
+    if root_key not in data:
+        data = {root_key: data}
+    if not isinstance(data[root_key], dict):
+        raise ValueError(f"'{root_key}' bir JSON object olmalı")
+    return data
+
+
+def merge_issues(analyzer_output: dict, critic_output: dict) -> list[dict]:
     """
     Analyzer findings + Critic missed_issues'ı tek listede birleştir.
     Optimizer'a verilecek "all issues" listesi.
     """
-    analyzer_data = safe_json_parse(analyzer_output)
-    critic_data  = safe_json_parse(critic_output)
-
-    all_issues = list(analyzer_data.get("cv_analysis", {}).get("issues", []))
+    all_issues = list(analyzer_output.get("cv_analysis", {}).get("issues", []))
     
     # Critic'in missed issues'ını ekle
-    missed = critic_data.get("critic_review", {}).get("missed_issues", [])
+    missed = critic_output.get("critic_review", {}).get("missed_issues", [])
     all_issues.extend(missed)
 
-    return all_issues
\ No newline at end of file
+    return all_issues
+
+
+def merge_analysis_delta(analyzer_output: dict, delta_output: dict) -> dict:
+    """
+    Delta retry: Analyzer'ın sadece eklediği issue / skill gap'leri önceki
+    analize ekle (aynı description / skill tekrar eklenmez).
+
+    Girdiler değiştirilmez (state'teki dict'ler paylaşılıyor olabilir).
+
+    Returns:
+        Birleştirilmiş tam analiz (analyzer_output formatında dict)
+    """
+    analysis = copy.deepcopy(analyzer_output)
+    delta    = delta_output.get("cv_analysis_delta", {})
+
+    cv_analysis = analysis.setdefault("cv_analysis", {})
+    for key, delta_key in (("issues", "added_issues"), ("skill_gaps", "added_skill_gaps")):
+        existing = cv_analysis.setdefault(key, [])
+        seen = {_item_key(item) for item in existing}
+        for item in delta.get(delta_key) or []:
+            if _item_key(item) not in seen:
+                existing.append(copy.deepcopy(item))
+                seen.add(_item_key(item))
+
+    if isinstance(delta.get("ats_score"), (int, float)):
+        cv_analysis["ats_score"] = delta["ats_score"]
+
+    return analysis
+
+
+def _item_key(item) -> str:
+    if isinstance(item, dict):
+        item = item.get("description") or item.get("skill") or json.dumps(item, sort_keys=True)
+    return str(item).strip().lower()
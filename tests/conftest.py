@@ -0,0 +1,62 @@
+import sys
+sys.path.insert(0, ".")
+
+import asyncio
+import time
+
+import pytest
+
+
+JOBS = [{"title": "Data Engineer", "company": "Acme", "location": "Remote",
+         "description": "Python and SQL", "salary_range": "", "url": "",
+         "posted_at": "", "employment_type": "FULLTIME"}]
+
+
+def initial_state(**overrides) -> dict:
+    """Pipeline'ın başlangıç state'i (test CV'si + boş agent çıktıları)."""
+    return {
+        "cv_text": "Jane Doe\nPython, SQL", "target_role": "Data Engineer", "target_location": "Remote",
+        "analyzer_output": {}, "analyzer_delta": {}, "critic_output": {}, "optimizer_output": {}, "job_hunter_output": {},
+        "raw_outputs": {}, "job_listings": [], "retry_count": 0, "approved": False, "gate_decision": "", "trace_log": [],
+        **overrides,
+    }
+
+
+class FakeJobSearch:
+    """search_jobs / asearch_jobs yerine: sabit ilanlar, opsiyonel gecikme + çalışma aralıkları."""
+
+    def __init__(self):
+        self.jobs = JOBS
+        self.latency = 0.0
+        self.intervals: list = []    # ("job_search", başlangıç, bitiş)
+
+    def search(self, query, location="", num_results=10):
+        started = time.perf_counter()
+        time.sleep(self.latency)
+        self.intervals.append(("job_search", started, time.perf_counter()))
+        return self.jobs
+
+    async def asearch(self, query, location="", num_results=10):
+        started = time.perf_counter()
+        await asyncio.sleep(self.latency)
+        self.intervals.append(("job_search", started, time.perf_counter()))
+        return self.jobs
+
+
+@pytest.fixture
+def fake_job_search(monkeypatch):
+    search = FakeJobSearch()
+    monkeypatch.setattr("src.api.job_scraper.search_jobs", search.search)
+    monkeypatch.setattr("src.api.job_scraper.asearch_jobs", search.asearch)
+    return search
+
+
+def pytest_terminal_summary(terminalreporter):
+    """test_import_time'ın kaydettiği `-X importtime` özetlerini rapor sonunda göster."""
+    reports = terminalreporter.stats.get("passed", []) + terminalreporter.stats.get("failed", [])
+    lines = [value for report in reports for name, value in getattr(report, "user_properties", ())
+             if name == "import_time"]
+    if lines:
+        terminalreporter.section("import time (-X importtime, top cumulative)")
+        for line in lines:
+            terminalreporter.write_line(line)
@@ -0,0 +1,55 @@
+import sys
+sys.path.insert(0, ".")
+
+import json
+
+from src.services.corpus_ingest import ingest_directory, main
+
+
+def _write_corpus(root):
+    (root / "a").mkdir()
+    (root / "a" / "jane.txt").write_text(
+        "Jane Doe\njane@example.com\n\nEXPERIENCE\nData Engineer\n\nSKILLS\nPython",
+        encoding="utf-8",
+    )
+    (root / "b.txt").write_text("John Roe\njohn@example.com", encoding="utf-8")
+    (root / "copy.txt").write_text("John Roe\njohn@example.com", encoding="utf-8")
+    (root / "notes.md").write_text("not a cv", encoding="utf-8")
+    (root / "broken.pdf").write_bytes(b"not really a pdf")
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_ingest_writes_jsonl_and_dedupes(tmp_path):
+    corpus = tmp_path / "cvs"
+    corpus.mkdir()
+    _write_corpus(corpus)
+    output = tmp_path / "out.jsonl"
+
+    summary = ingest_directory(str(corpus), str(output), workers=2)
+
+    assert (summary.processed, summary.failed, summary.duplicates) == (2, 1, 1)
+    by_name = {r["path"].rsplit("/", 1)[-1]: r for r in _records(output)}
+    assert set(by_name) == {"jane.txt", "b.txt", "broken.pdf"}
+    assert by_name["jane.txt"]["contact"]["email"] == "jane@example.com"
+    assert by_name["jane.txt"]["sections"]["experience"] == "Data Engineer\n"
+    assert by_name["jane.txt"]["sections"]["skills"] == "Python\n"
+    assert by_name["broken.pdf"]["status"] == "error"
+
+
+def test_ingest_resumes_from_existing_output(tmp_path):
+    corpus = tmp_path / "cvs"
+    corpus.mkdir()
+    _write_corpus(corpus)
+    output = tmp_path / "out.jsonl"
+    ingest_directory(str(corpus), str(output), workers=1)
+
+    (corpus / "new.txt").write_text("New Person\nnew@example.com", encoding="utf-8")
+    exit_code = main([str(corpus), "-o", str(output), "-w", "1"])
+
+    records = _records(output)
+    assert exit_code == 1  # broken.pdf tekrar denenir ve yine hata verir
+    assert sum(r["path"].endswith("new.txt") for r in records) == 1
+    assert sum(r["path"].endswith("jane.txt") for r in records) == 1
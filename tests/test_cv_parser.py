@@ -0,0 +1,363 @@
+import sys
+
+sys.path.insert(0, ".")
+
+import io
+import os
+
+import pytest
+
+from src.api.cv_parser import parse_cv, parse_cv_bytes, _take_until_budget
+
+
+def _make_pdf(pages: list, font: bytes = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>") -> bytes:
+    """
+    Minimal PDF üret (test fixture). Sayfa = tek satır text; liste verilirse
+    her satır ayrı content stream olur (/Contents array).
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages — kids belli olunca doldurulur
+        font,
+    ]
+    kids = []
+    for page in pages:
+        content_ids = []
+        for i, text in enumerate([page] if isinstance(page, str) else page):
+            stream = f"BT /F1 12 Tf 72 {720 - 14 * i} Td ({text}) Tj ET".encode("latin-1")
+            objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+            content_ids.append(b"%d 0 R" % len(objects))
+        contents = content_ids[0] if isinstance(page, str) else b"[%s]" % b" ".join(content_ids)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %s >>" % contents
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i, body)
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_at)
+    return bytes(out)
+
+
+def test_take_until_budget_stops_pulling_pages():
+    pulled = []
+
+    def pages():
+        for i in range(10):
+            pulled.append(i)
+            yield "x" * 10
+
+    taken = list(_take_until_budget(pages(), max_chars=25))
+
+    # 3. parça budget'ı aşar; 4. parça hiç üretilmemeli
+    assert len(taken) == 3
+    assert pulled == [0, 1, 2]
+
+
+def test_parse_pdf_small_document(tmp_path):
+    pdf = tmp_path / "cv.pdf"
+    pdf.write_bytes(_make_pdf(["John Doe", "Python Developer"]))
+
+    result = parse_cv(str(pdf), "pdf")
+
+    assert "John Doe" in result["raw_text"]
+    assert "Python Developer" in result["raw_text"]
+    assert result["pages_skipped"] == 0
+
+
+def test_parse_pdf_skips_pages_past_budget(tmp_path, monkeypatch):
+    import src.api.cv_parser as cv_parser
+
+    monkeypatch.setattr(cv_parser, "MAX_CV_CHARS", 50)
+    pdf = tmp_path / "portfolio.pdf"
+    pdf.write_bytes(_make_pdf([f"Page {i} " + "a" * 30 for i in range(20)]))
+
+    result = cv_parser.parse_cv(str(pdf), "pdf", use_cache=False)
+
+    assert result["pages_skipped"] == 18
+    assert result["raw_text"].endswith("[... TRUNCATED]")
+
+
+def test_parse_pdf_parallel_matches_serial(tmp_path, monkeypatch):
+    import src.api.cv_parser as cv_parser
+
+    monkeypatch.setattr(cv_parser, "PDF_PARALLEL_MIN_PAGES", 2)
+    pdf = tmp_path / "long.pdf"
+    pdf.write_bytes(_make_pdf([f"Section {i}" for i in range(15)]))
+
+    serial = cv_parser.parse_cv(str(pdf), "pdf", use_cache=False)
+    parallel = cv_parser.parse_cv(str(pdf), "pdf", parallel=True, use_cache=False)
+
+    # Sayfa sırası korunmalı
+    assert parallel == serial
+    assert parallel["raw_text"].index("Section 2") < parallel["raw_text"].index("Section 14")
+    # memoryview upload'ı worker'lara gönderilebilmeli (pickle için tek yerde bytes'a çevrilir)
+    assert cv_parser.parse_cv_bytes(memoryview(pdf.read_bytes()), "pdf", parallel=True, use_cache=False) == serial
+
+
+def test_parse_cv_bytes_matches_file_parsing(tmp_path):
+    pdf_bytes = _make_pdf(["John Doe", "Python Developer"])
+    pdf = tmp_path / "cv.pdf"
+    pdf.write_bytes(pdf_bytes)
+
+    from_file = parse_cv(str(pdf), "pdf", use_cache=False)
+
+    assert parse_cv_bytes(pdf_bytes, "pdf", use_cache=False) == from_file
+    assert parse_cv_bytes(memoryview(pdf_bytes), "pdf", use_cache=False) == from_file
+    assert parse_cv_bytes(io.BytesIO(pdf_bytes), "pdf", use_cache=False) == from_file
+
+
+def test_parse_cv_bytes_docx_and_txt():
+    import docx
+
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    document.add_paragraph("Data Engineer")
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    docx_result = parse_cv_bytes(buffer.getvalue(), "docx", use_cache=False)
+    txt_result = parse_cv_bytes("Jane Doe\r\nData Engineer".encode("utf-8"), "txt", use_cache=False)
+
+    assert docx_result["raw_text"] == "Jane Doe\nData Engineer"
+    assert txt_result["raw_text"] == "Jane Doe\nData Engineer"
+
+    # Buffer'lar bytes'a kopyalanmadan parse edilir (hash + BytesIO + decode buffer kabul eder)
+    for buffer_type in (memoryview, bytearray):
+        assert parse_cv_bytes(buffer_type(buffer.getvalue()), "docx", use_cache=False) == docx_result
+        assert parse_cv_bytes(buffer_type("Jane Doe\r\nData Engineer".encode("utf-8")), "txt") == txt_result
+
+
+def test_extract_sections_english_headers():
+    from src.api.cv_parser import extract_sections
+
+    with open("samples/test_cv.txt", encoding="utf-8") as f:
+        sections = extract_sections(f.read())
+
+    assert "BS Computer Science - MIT (2018)" in sections["education"]
+    assert "Python, JavaScript, React" in sections["skills"]
+    # Header satırları içeriğe girmez
+    assert "EDUCATION" not in sections["education"]
+
+
+def test_extract_sections_turkish_headers():
+    from src.api.cv_parser import extract_sections
+
+    text = "Ayşe Yılmaz\nDENEYİM\nBackend Geliştirici - Trendyol\nEĞİTİM\nODTÜ Bilgisayar Müh.\nYetenekler\nPython, Go\n"
+    sections = extract_sections(text)
+
+    assert sections["experience"] == "Backend Geliştirici - Trendyol\n"
+    assert sections["education"] == "ODTÜ Bilgisayar Müh.\n"
+    assert sections["skills"] == "Python, Go\n"
+    assert sections["summary"] == ""
+
+
+# ─── Contact extraction ─────────────────────────────────
+def _legacy_extract_contact_info(raw_text):
+    """Eski (pattern'leri her çağrıda arayan) implementasyon — referans."""
+    import re
+
+    contact = {"email": "", "phone": "", "linkedin": "", "github": ""}
+    email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', raw_text, re.IGNORECASE)
+    if email_match:
+        contact["email"] = email_match.group(0)
+    for pattern in [
+        r'\+?1?\s*\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',
+        r'\+?\d{1,3}[\s.-]?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',
+    ]:
+        phone_match = re.search(pattern, raw_text)
+        if phone_match:
+            contact["phone"] = phone_match.group(0)
+            break
+    linkedin_match = re.search(r'linkedin\.com/in/([\w-]+)', raw_text, re.IGNORECASE)
+    if linkedin_match:
+        contact["linkedin"] = f"https://linkedin.com/in/{linkedin_match.group(1)}"
+    github_match = re.search(r'github\.com/([\w-]+)', raw_text, re.IGNORECASE)
+    if github_match:
+        contact["github"] = f"https://github.com/{github_match.group(1)}"
+    return contact
+
+
+_CONTACT_CASES = [
+    "",
+    "John Doe\nEmail: john.doe@example.com\nPhone: (555) 123-4567\nLinkedIn: linkedin.com/in/johndoe",
+    "Ayşe Yılmaz — ayse@firma.com.tr — +90 532 123 45 67 — GitHub.com/ayse-y",
+    "@@ a@b x@y.z 2019-2021 (555)1234567 LINKEDIN.COM/IN/ github.com/-",
+    "Tel: +1 555.123.4567, alt: 5551234567",
+    "mail: 5551234567@x.com, a@github.com/foo, see linkedin.com/in/x@y.co",      # iç içe / aynı yerde başlayan
+    "+1(555) 123 4567 ve 1 555 123 4567 ve +15551234567",
+    "Phone: \U0001d7d3\U0001d7d3\U0001d7d3-\U0001d7cf\U0001d7d0\U0001d7d1-\U0001d7d2\U0001d7d3\U0001d7d4\U0001d7d5",  # non-BMP rakamlar
+]
+
+
+def test_contact_info_matches_legacy():
+    import random
+    from src.api.cv_parser import extract_contact_info, extract_contact_info_batch
+
+    # Rastgele kontak parçacıkları: ayraçlar, rakam koşuları, '@', domain'ler yan yana
+    rng = random.Random(0)
+    pieces = ["@", "a", "1", "5", "+", "(", ")", " ", "-", ".", "_", "\n", "x@y.z", "555", "1234",
+              "LinkedIn.com/in/", "github.com/", "GITHUB.COM/u", "\U0001d7d3", "\u0660", "\u3000", "İ"]
+    fuzz = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 40))) for _ in range(3_000)]
+    cases = _CONTACT_CASES + fuzz
+
+    expected = [_legacy_extract_contact_info(text) for text in cases]
+
+    assert [extract_contact_info(text) for text in cases] == expected
+    assert extract_contact_info_batch(cases) == expected
+
+
+def test_contact_batch_benchmark():
+    import time
+    from src.api.cv_parser import extract_contact_info_batch
+
+    # Contact bilgisi 20k char'lık CV'nin sonunda (en kötü durum)
+    with open("samples/test_cv.txt", encoding="utf-8") as f:
+        sample = f.read()
+    filler = "Lorem ipsum dolor sit amet consectetur adipiscing elit 2019-2021.\n" * 300
+    corpus = [filler[:19_000] + sample] * 200
+
+    start = time.perf_counter()
+    legacy = [_legacy_extract_contact_info(text) for text in corpus]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = extract_contact_info_batch(corpus)
+    batch_seconds = time.perf_counter() - start
+
+    assert batch == legacy
+    if not os.getenv("RUN_BENCHMARKS"):
+        return          # Wall-clock karşılaştırması sadece RUN_BENCHMARKS=1 ile (CI'da flaky olmasın)
+    assert batch_seconds * 3 < legacy_seconds, (
+        f"legacy {len(corpus) / legacy_seconds:,.0f} CV/s, batch {len(corpus) / batch_seconds:,.0f} CV/s"
+    )
+
+
+# ─── PDF backends ───────────────────────────────────────
+@pytest.fixture
+def raw_first(monkeypatch):
+    import dataclasses
+
+    import src.api.cv_parser as cv_parser
+
+    monkeypatch.setattr(cv_parser, "settings", dataclasses.replace(
+        cv_parser.settings, PDF_BACKEND_ORDER="raw,pypdf2,pdfplumber",
+    ))
+    return cv_parser
+
+
+def test_pdf_pypdf2_is_default_backend():
+    result = parse_cv_bytes(_make_pdf(["John Doe"]), "pdf", use_cache=False)
+
+    assert result["backend"] == "pypdf2"
+
+
+def test_pdf_raw_backend_is_opt_in(raw_first):
+    result = parse_cv_bytes(_make_pdf(["John Doe", ["Python Developer", "Istanbul"]]), "pdf", use_cache=False)
+
+    # 2. sayfanın /Contents'i stream array'i
+    assert result["backend"] == "raw"
+    assert result["raw_text"] == "John Doe\nPython Developer\nIstanbul"
+
+
+@pytest.mark.parametrize("pdf", [
+    # İç içe parantez: raw regex operatörü kaçırır → cümle sessizce düşerdi
+    _make_pdf(["Jane Doe", "Senior (Lead) Engineer"]),
+    # Ligatür / özel glyph'ler: Differences'lı encoding latin-1 ile çözülemez
+    _make_pdf(["John Doe"], font=b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+                                 b"/Encoding << /Differences [2 /fi] >> >>"),
+])
+def test_pdf_raw_backend_rejects_lossy_pages(raw_first, pdf):
+    before = raw_first.pdf_backend_stats().get("raw", {}).get("errors", 0)
+
+    result = parse_cv_bytes(pdf, "pdf", use_cache=False)
+
+    assert result["backend"] == "pypdf2"
+    assert raw_first.pdf_backend_stats()["raw"]["errors"] == before + 1
+
+
+def test_pdf_garbled_output_falls_back_to_next_backend(raw_first, monkeypatch):
+    cv_parser = raw_first
+
+    # CID font'lu PDF simülasyonu: fast path glyph id çöpü döndürür
+    monkeypatch.setitem(cv_parser._PDF_BACKENDS, "raw", lambda data, max_chars, parallel: ("\x01\x02 \x03#%", 0))
+    before = cv_parser.pdf_backend_stats().get("raw", {}).get("rejected", 0)
+
+    result = parse_cv_bytes(_make_pdf(["John Doe"]), "pdf", use_cache=False)
+
+    assert result["backend"] == "pypdf2"
+    assert "John Doe" in result["raw_text"]
+    assert cv_parser.pdf_backend_stats()["raw"]["rejected"] == before + 1
+
+
+def test_raw_page_text_operators():
+    from src.api.cv_parser import _raw_page_text
+
+    content = rb"BT 72 720 Td (Hello \(CV\)) Tj 0 -14 Td [(Py) -30 (thon) -300 (Dev)] TJ T* <4A6F62> Tj ET"
+
+    assert _raw_page_text(content) == "Hello (CV)\nPython Dev\nJob"
+
+
+# ─── DOCX ───────────────────────────────────────────────
+def _make_docx(build) -> bytes:
+    import docx
+
+    document = docx.Document()
+    build(document)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_docx_stream_matches_python_docx_paragraphs():
+    import docx
+
+    def build(document):
+        document.add_paragraph("Jane Doe")
+        paragraph = document.add_paragraph("Senior ")
+        paragraph.add_run("Data Engineer").bold = True
+        paragraph.add_run("\tIstanbul")
+        document.add_paragraph("")
+        document.add_paragraph("Python, SQL, Spark")
+
+    data = _make_docx(build)
+    expected = "\n".join(p.text for p in docx.Document(io.BytesIO(data)).paragraphs)
+
+    assert parse_cv_bytes(data, "docx", use_cache=False)["raw_text"] == expected.strip()
+
+
+def test_docx_stream_keeps_table_content_in_order():
+    def build(document):
+        document.add_paragraph("SKILLS")
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Languages"
+        table.cell(0, 1).text = "Python, Go"
+        table.cell(1, 0).text = "Cloud"
+        table.cell(1, 1).text = "AWS, Docker"
+        document.add_paragraph("EDUCATION")
+
+    text = parse_cv_bytes(_make_docx(build), "docx", use_cache=False)["raw_text"]
+
+    assert text == "SKILLS\nLanguages | Python, Go\nCloud | AWS, Docker\nEDUCATION"
+
+
+def test_docx_stream_stops_at_budget():
+    import zipfile
+
+    from src.api.cv_parser import _iter_docx_lines
+
+    data = _make_docx(lambda d: [d.add_paragraph(f"Line {i} " + "x" * 40) for i in range(500)])
+
+    with zipfile.ZipFile(io.BytesIO(data)) as archive, archive.open("word/document.xml") as xml:
+        lines = list(_take_until_budget(_iter_docx_lines(xml), 100))
+
+    assert len(lines) == 3
@@ -0,0 +1,116 @@
+import sys
+sys.path.insert(0, ".")
+
+import asyncio
+import dataclasses
+import json
+import random
+import time
+from typing import Any, List, Optional
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from conftest import initial_state
+from src.graph.graph import build_graph
+from src.graph.messages import build_messages
+from src.models import llm as llm_module
+from src.models.fake_llm import FakeChatModel, RecordingChatModel, canned_response, parse_latency
+
+
+@pytest.fixture
+def fake_backend(monkeypatch, fake_job_search):
+    test_settings = dataclasses.replace(
+        llm_module.settings, OPENAI_API_KEY="", LLM_BACKEND="fake", LLM_FAKE_LATENCY="fixed:50",
+    )
+    monkeypatch.setattr(llm_module, "settings", test_settings)
+    llm_module._build_llm.cache_clear()
+
+    yield llm_module
+    llm_module._build_llm.cache_clear()
+
+
+def test_latency_specs_are_seeded_and_validated():
+    assert parse_latency("fixed:250")(random.Random()) == 0.25
+    assert parse_latency("recorded") is None
+
+    uniform = parse_latency("uniform:100:200")
+    samples = [uniform(random.Random(7)) for _ in range(3)]
+    assert len(set(samples)) == 1 and 0.1 <= samples[0] <= 0.2
+
+    lognormal = parse_latency("lognormal:800:0.5")
+    rng = random.Random(1)
+    assert sorted(lognormal(rng) for _ in range(101))[50] == pytest.approx(0.8, rel=0.3)
+
+    for spec in ("gamma:1", "fixed", "uniform:1:x", "normal:-5:1"):
+        with pytest.raises(ValueError):
+            parse_latency(spec)
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_graph_runs_offline_with_fake_backend(fake_backend, mode):
+    assert fake_backend.warm_up_llm() is True
+    assert isinstance(fake_backend.get_llm(), FakeChatModel)
+
+    pipeline = build_graph()
+    started = time.perf_counter()
+    if mode == "sync":
+        state = pipeline.invoke(initial_state())
+    else:
+        state = asyncio.run(pipeline.ainvoke(initial_state()))
+    elapsed = time.perf_counter() - started
+
+    # analyzer → critic → optimizer: 3 × 50ms
+    assert elapsed >= 0.15
+    assert state["approved"] is True
+    assert state["analyzer_output"] == canned_response("cv_analyzer")
+    assert state["optimizer_output"]["new_ats_score"] == 86
+    assert state["job_hunter_output"]["total_jobs_found"] == 1
+
+
+def test_unknown_backend_is_rejected(fake_backend, monkeypatch):
+    monkeypatch.setattr(llm_module, "settings", dataclasses.replace(llm_module.settings, LLM_BACKEND="anthropic"))
+    with pytest.raises(ValueError, match="LLM_BACKEND"):
+        llm_module.get_llm()
+
+
+class _RealModel(BaseChatModel):
+    """Gerçek provider yerine: her çağrıda farklı cevap."""
+
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "real-stand-in"
+
+    def _generate(self, messages, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        time.sleep(0.05)
+        message = AIMessage(
+            content=json.dumps({"cv_analysis": {"ats_score": 60 + self.calls}}),
+            usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def test_record_then_replay_returns_recorded_responses(tmp_path):
+    messages = build_messages(initial_state(), "cv_analyzer", "Analiz et, JSON döndür.")
+    recorder = RecordingChatModel(inner=_RealModel(), model_name="gpt-4o-mini", fixtures_dir=str(tmp_path))
+    recorded = recorder.bind(response_format={"type": "json_object"}).invoke(messages)
+
+    files = list((tmp_path / "cv_analyzer").glob("*.json"))
+    assert len(files) == 1
+    assert json.loads(files[0].read_text())["latency_ms"] >= 50
+
+    replay = FakeChatModel(model_name="gpt-4o-mini", latency="recorded", fixtures_dir=str(tmp_path))
+    started = time.perf_counter()
+    replayed = replay.invoke(messages)
+    assert time.perf_counter() - started >= 0.05
+    assert replayed.content == recorded.content
+    assert replayed.usage_metadata["input_tokens"] == 120
+
+    # Farklı CV → kayıt yok → canned cevap
+    other = build_messages(initial_state(cv_text="John Roe"), "cv_analyzer", "Analiz et, JSON döndür.")
+    assert json.loads(replay.invoke(other).content) == canned_response("cv_analyzer")
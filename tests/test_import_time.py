@@ -0,0 +1,49 @@
+import sys
+sys.path.insert(0, ".")
+
+import subprocess
+
+import pytest
+
+# İlk kullanımda yüklenmesi gereken ağır bağımlılıklar
+HEAVY_MODULES = {"PyPDF2", "pdfplumber", "docx", "bs4", "requests", "langgraph", "langchain_openai", "openai"}
+# Rapora yazılan en pahalı (cumulative) import sayısı
+SUMMARY_TOP_N = 5
+
+
+def _importtime(module: str) -> dict:
+    """`python -X importtime -c 'import <module>'` → import ağacındaki modüller ({name: cumulative_us})."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+        if name.strip() == "site":
+            timings.clear()  # Interpreter startup'ı (site + .pth hook'ları) sayma
+    return timings
+
+
+def _summary(module: str, timings: dict) -> str:
+    top = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:SUMMARY_TOP_N]
+    return f"{module}: " + ", ".join(f"{name} {cumulative / 1000:.1f}ms" for name, cumulative in top)
+
+
+@pytest.mark.parametrize("module", [
+    "src.api.cv_parser",
+    "src.graph.graph",
+    "src.models.llm",
+    "src.services.corpus_ingest",
+])
+def test_entrypoint_import_is_lazy(module, record_property):
+    timings = _importtime(module)
+    # Cold-start regresyonları görünsün diye rapora yazılır (süreye assert yok — makineye bağlı)
+    record_property("import_time", _summary(module, timings))
+
+    assert module in timings
+    loaded_heavy = {name.split(".")[0] for name in timings} & HEAVY_MODULES
+    assert not loaded_heavy, f"{module} eagerly imports {sorted(loaded_heavy)}"
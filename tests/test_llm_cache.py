@@ -0,0 +1,68 @@
+import sys
+sys.path.insert(0, ".")
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.models import llm_cache as llm_cache_module
+from src.models.llm_cache import SQLiteLLMCache, llm_cache_bypass
+
+
+def _messages(system: str, user: str) -> list:
+    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+
+def _model(cache: SQLiteLLMCache) -> FakeListChatModel:
+    return FakeListChatModel(responses=["first", "second", "third"], cache=cache)
+
+
+def test_identical_call_served_from_cache(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite"))
+    llm = _model(cache)
+
+    assert llm.invoke(_messages("analyzer", "cv")).content == "first"
+    assert llm.invoke(_messages("analyzer", "cv")).content == "first"
+    assert llm.invoke(_messages("critic", "cv")).content == "second"
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "llm.sqlite")
+    _model(SQLiteLLMCache(path)).invoke(_messages("analyzer", "cv"))
+
+    reopened = SQLiteLLMCache(path)
+    assert _model(reopened).invoke(_messages("analyzer", "cv")).content == "first"
+    assert reopened.stats()["hits"] == 1
+
+
+def test_ttl_expiry_and_size_eviction(tmp_path, monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(llm_cache_module.time, "time", lambda: now[0])
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite"), ttl_seconds=60, max_entries=2)
+    llm = _model(cache)
+
+    llm.invoke(_messages("s", "a"))
+    now[0] += 1
+    llm.invoke(_messages("s", "b"))
+    now[0] += 1
+    llm.invoke(_messages("s", "c"))        # "a" en eski → silinir
+    assert cache.stats()["entries"] == 2
+
+    now[0] += 120                          # "b" ve "c" TTL dışı
+    assert cache.lookup("x", "y") is None
+    llm.invoke(_messages("s", "b"))
+    assert cache.stats()["hits"] == 0
+
+
+def test_bypass_skips_read_and_write(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite"))
+    llm = _model(cache)
+    llm.invoke(_messages("analyzer", "cv"))
+
+    with llm_cache_bypass():
+        assert llm.invoke(_messages("analyzer", "cv")).content == "second"
+        llm.invoke(_messages("analyzer", "other"))
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["bypassed"], stats["entries"]) == (0, 2, 1)
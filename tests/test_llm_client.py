@@ -0,0 +1,107 @@
+import sys
+sys.path.insert(0, ".")
+
+import asyncio
+import dataclasses
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.models import llm as llm_module
+
+
+@pytest.fixture
+def fresh_llm(monkeypatch):
+    test_settings = dataclasses.replace(llm_module.settings, OPENAI_API_KEY="sk-test", LLM_CACHE_PATH="")
+    monkeypatch.setattr(llm_module, "settings", test_settings)
+    for cached in (llm_module._build_llm, llm_module._get_http_clients, llm_module.get_llm_cache):
+        cached.cache_clear()
+    yield llm_module
+    for cached in (llm_module._build_llm, llm_module._get_http_clients, llm_module.get_llm_cache):
+        cached.cache_clear()
+
+
+def test_get_llm_reuses_client_per_model_and_temperature(fresh_llm):
+    default = fresh_llm.get_llm()
+    creative = fresh_llm.get_llm(temperature=0.9)
+
+    assert fresh_llm.get_llm() is default
+    assert fresh_llm.get_llm(model="gpt-4o-mini", temperature=0.2) is default
+    assert creative is not default
+    assert creative.http_client is default.http_client
+    assert fresh_llm.llm_pool_stats()["clients"] == 2
+
+
+@pytest.fixture
+def local_server():
+    """Gelen isteklerin client portlarını kaydeden HTTP/1.1 keep-alive server (boş /models listesi döner)."""
+    client_ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            client_ports.append(self.client_address[1])
+            body = b'{"object": "list", "data": []}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/", client_ports
+    server.shutdown()
+
+
+def test_shared_pool_keeps_connection_alive(fresh_llm, local_server):
+    url, client_ports = local_server
+    http_client = fresh_llm.get_llm().http_client
+    before = fresh_llm.llm_pool_stats()["requests"]
+    for _ in range(3):
+        http_client.get(url)
+
+    stats = fresh_llm.llm_pool_stats()
+    assert stats["requests"] - before == 3
+    assert stats["in_flight"] == 0
+    # Tek TCP bağlantısı üzerinden 3 istek
+    assert len(set(client_ports)) == 1
+
+
+def test_async_client_uses_a_pool_per_event_loop(fresh_llm, local_server):
+    url, client_ports = local_server
+    async_client = fresh_llm.get_llm().http_async_client
+
+    async def fetch_twice():
+        await async_client.get(url)
+        await async_client.get(url)
+
+    # Streamlit gibi: her run yeni loop (önceki loop'un bağlantıları kullanılamaz)
+    asyncio.run(fetch_twice())
+    asyncio.run(fetch_twice())
+
+    assert len(client_ports) == 4
+    assert len(set(client_ports)) == 2   # Loop içinde keep-alive, loop'lar arası ayrı bağlantı
+    assert fresh_llm.llm_pool_stats()["async_pools"] == 1
+
+
+def test_async_warm_up_opens_connection_on_running_loop(fresh_llm, local_server, monkeypatch):
+    url, client_ports = local_server
+    monkeypatch.setenv("OPENAI_BASE_URL", url.rstrip("/"))
+    fresh_llm._build_llm.cache_clear()
+
+    async def startup_then_request():
+        # FastAPI lifespan: warm-up request'lere hizmet edecek loop'ta await edilir
+        assert await fresh_llm.awarm_up_llm() is True
+        await fresh_llm.get_llm().http_async_client.get(url)
+
+    asyncio.run(startup_then_request())
+
+    # İlk request warm-up'ın açtığı bağlantıyı kullandı (yeni TCP / TLS yok)
+    assert len(client_ports) == 2 and len(set(client_ports)) == 1
+    assert fresh_llm.llm_pool_stats()["async_pools"] == 1
@@ -0,0 +1,77 @@
+import sys
+sys.path.insert(0, ".")
+
+import pytest
+
+from src.core.metrics import MetricsRegistry, timed
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("demo_seconds", "Demo latency", ["node"], buckets=(0.1, 1))
+
+    for value in (0.05, 0.5, 2):
+        latency.observe(value, node="cv_analyzer")
+
+    text = registry.render()
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{node="cv_analyzer",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{node="cv_analyzer",le="1"} 2' in text
+    assert 'demo_seconds_bucket{node="cv_analyzer",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{node="cv_analyzer"} 3' in text
+    assert latency.quantile(0.5, node="cv_analyzer") == 1
+
+
+def test_timed_counts_errors_and_still_observes():
+    registry = MetricsRegistry()
+    latency = registry.histogram("op_seconds", "Op latency", ["source"])
+    failures = registry.counter("op_failures_total", "Op failures", ["source"])
+
+    with pytest.raises(RuntimeError):
+        with timed(latency, failures, source="jsearch"):
+            raise RuntimeError("boom")
+    with timed(latency, failures, source="jsearch"):
+        pass
+
+    assert latency.count(source="jsearch") == 2
+    assert failures.value(source="jsearch") == 1
+
+
+def test_registry_rejects_wrong_labels_and_reuses_metrics():
+    registry = MetricsRegistry()
+    counter = registry.counter("calls_total", "Calls", ["node"])
+
+    assert registry.counter("calls_total", "Calls", ["node"]) is counter
+    with pytest.raises(ValueError):
+        counter.inc(agent="x")
+    with pytest.raises(ValueError):
+        registry.histogram("calls_total", "Calls")
+
+
+def test_collectors_are_read_at_scrape_time_and_failures_skipped():
+    registry = MetricsRegistry()
+    stats = {"hits": 1}
+
+    def broken():
+        raise RuntimeError("cache closed")
+
+    registry.register_collector(lambda: [("cache_hits_total", "counter", "Hits", {"tier": "memory"}, stats["hits"])])
+    registry.register_collector(broken)
+    stats["hits"] = 5
+
+    assert 'cache_hits_total{tier="memory"} 5' in registry.render()
+
+
+def test_turkey_scraper_empty_or_blocked_results_count_as_failures(monkeypatch):
+    from src.api import job_scraper_turkey
+    from src.core.metrics import JOB_SOURCE_FAILURES
+
+    before = {source: JOB_SOURCE_FAILURES.value(source=source) for source in ("Kariyer.net", "Indeed Turkey")}
+    # Scraper'lar 403 / hata durumunda exception yerine [] döner
+    monkeypatch.setattr(job_scraper_turkey, "_scrape_kariyer_advanced", lambda query, city, n: [])
+    monkeypatch.setattr(job_scraper_turkey, "_scrape_indeed_advanced", lambda query, city, n: [{"title": "Dev"}])
+
+    job_scraper_turkey.search_jobs_turkey("Software Engineer", "Istanbul", 10)
+
+    assert JOB_SOURCE_FAILURES.value(source="Kariyer.net") == before["Kariyer.net"] + 1
+    assert JOB_SOURCE_FAILURES.value(source="Indeed Turkey") == before["Indeed Turkey"]
@@ -0,0 +1,56 @@
+import sys
+
+sys.path.insert(0, ".")
+
+from src.services.parse_cache import ParseCache
+
+
+def test_parse_cv_cache_hit_on_same_content(tmp_path, monkeypatch):
+    import src.api.cv_parser as cv_parser
+
+    cache = ParseCache(max_items=4)
+    monkeypatch.setattr(cv_parser, "parse_cache", cache)
+
+    # Farklı dosya adı, aynı içerik → aynı key
+    first = tmp_path / "cv.txt"
+    second = tmp_path / "cv_copy.txt"
+    first.write_text("John Doe\nPython Developer", encoding="utf-8")
+    second.write_text("John Doe\nPython Developer", encoding="utf-8")
+
+    a = cv_parser.parse_cv(str(first), "txt")
+    b = cv_parser.parse_cv(str(second), "txt")
+
+    assert a == b
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_key_depends_on_namespace():
+    data = b"same bytes"
+    assert ParseCache.make_key(data, "1:pdf") != ParseCache.make_key(data, "2:pdf")
+    assert ParseCache.make_key(data, "1:pdf") == ParseCache.make_key(data, "1:pdf")
+
+
+def test_memory_tier_is_lru():
+    cache = ParseCache(max_items=2)
+    cache.put("a", {"raw_text": "a"})
+    cache.put("b", {"raw_text": "b"})
+    cache.get("a")                      # "a" artık en yeni
+    cache.put("c", {"raw_text": "c"})   # "b" düşmeli
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+
+
+def test_disk_tier_survives_memory_and_evicts(tmp_path):
+    cache = ParseCache(max_items=1, disk_dir=str(tmp_path), disk_max_bytes=200)
+    for i in range(5):
+        cache.put(f"key{i}", {"raw_text": "x" * 60, "char_count": 60})
+
+    # Boyut limiti aşılmamalı, en yeni kayıt diskte kalmalı
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 200
+
+    fresh = ParseCache(max_items=1, disk_dir=str(tmp_path))
+    assert fresh.get("key4") == {"raw_text": "x" * 60, "char_count": 60}
+    assert fresh.get("key0") is None
+    assert fresh.stats()["disk_hits"] == 1
@@ -0,0 +1,113 @@
+import sys
+sys.path.insert(0, ".")
+
+import asyncio
+import dataclasses
+import threading
+import time
+
+import pytest
+
+from conftest import initial_state
+from src.core.metrics import LLM_RATE_LIMIT_WAIT_SECONDS, REGISTRY
+from src.graph.graph import build_graph
+from src.models import llm as llm_module
+from src.models import rate_limiter
+from src.models.fake_llm import FakeChatModel
+from src.models.rate_limiter import TokenBucketLimiter
+
+
+def test_reservations_queue_in_arrival_order():
+    limiter = TokenBucketLimiter(tpm=6_000)   # 100 token/s
+
+    assert limiter.reserve(6_000) == 0
+    # Bucket boş → her çağrı öncekinin borcunun arkasında bekler
+    assert limiter.reserve(50) == pytest.approx(0.5, abs=0.05)
+    assert limiter.reserve(50) == pytest.approx(1.0, abs=0.05)
+
+
+def test_requests_per_minute_and_token_refund():
+    limiter = TokenBucketLimiter(rpm=120, tpm=6_000)
+    for _ in range(120):
+        limiter.reserve(10)
+    assert limiter.reserve(10) == pytest.approx(0.5, abs=0.05)   # 2 request/s
+
+    tokens_only = TokenBucketLimiter(tpm=6_000)
+    tokens_only.reserve(6_000)
+    tokens_only.settle(estimated=6_000, actual=3_000)   # Tahmin fazlaydı → iade
+    assert tokens_only.reserve(50) == 0
+
+
+def test_sqlite_bucket_is_shared_between_limiters(tmp_path):
+    path = str(tmp_path / "rate_limit.sqlite")
+    worker_a = TokenBucketLimiter(tpm=6_000, path=path)
+    worker_b = TokenBucketLimiter(tpm=6_000, path=path)
+
+    assert worker_a.reserve(6_000) == 0
+    assert worker_b.reserve(50) == pytest.approx(0.5, abs=0.05)
+
+
+def test_cancelled_wait_refunds_reservation():
+    limiter = TokenBucketLimiter(rpm=60, tpm=6_000)
+    limiter.reserve(6_000)
+
+    async def cancel_waiting_call():
+        task = asyncio.create_task(limiter.aacquire(600))   # ~6s bekler
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_waiting_call())
+
+    # İptal edilen çağrının request + token'ı iade edildi → sıradaki onun arkasında beklemez
+    assert limiter.reserve(50) == pytest.approx(0.5, abs=0.1)
+    assert limiter.stats()["waiting"] == 0
+
+
+def test_threads_wait_and_report_queue_depth():
+    observed = LLM_RATE_LIMIT_WAIT_SECONDS.count()
+    limiter = TokenBucketLimiter(tpm=60_000)   # 1000 token/s
+    limiter.reserve(60_000)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=limiter.acquire, args=(100,)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 5 × 100 token, seri kuyruk → sonuncusu ~0.5s bekler
+    assert time.perf_counter() - started >= 0.45
+    stats = limiter.stats()
+    assert stats["waiting"] == 0 and stats["throttled"] == 5 and stats["max_waiting"] >= 2
+    assert LLM_RATE_LIMIT_WAIT_SECONDS.count() == observed + 5
+    assert LLM_RATE_LIMIT_WAIT_SECONDS.quantile(1.0) >= 0.4
+
+
+@pytest.fixture
+def limited_fake_backend(monkeypatch, fake_job_search):
+    test_settings = dataclasses.replace(
+        llm_module.settings, LLM_BACKEND="fake", LLM_FAKE_LATENCY="fixed:0",
+        LLM_RATE_LIMIT_RPM=600, LLM_RATE_LIMIT_TPM=0, LLM_RATE_LIMIT_PATH="",
+    )
+    monkeypatch.setattr(llm_module, "settings", test_settings)
+    monkeypatch.setattr(rate_limiter, "settings", test_settings)
+    llm_module._build_llm.cache_clear()
+    rate_limiter.get_rate_limiter.cache_clear()
+
+    yield
+    llm_module._build_llm.cache_clear()
+    rate_limiter.get_rate_limiter.cache_clear()
+
+
+def test_llm_calls_go_through_limiter(limited_fake_backend):
+    assert isinstance(llm_module.get_llm(), FakeChatModel)
+    observed = LLM_RATE_LIMIT_WAIT_SECONDS.count()
+    # Bucket dolu başlar → bekleme yok, ama 3 LLM çağrısının hepsi limiter'dan geçer
+    final = asyncio.run(build_graph().ainvoke(initial_state()))
+
+    assert final["approved"] is True
+    assert LLM_RATE_LIMIT_WAIT_SECONDS.count() == observed + 3
+    assert rate_limiter.get_rate_limiter().stats()["waiting"] == 0
+    assert "career_llm_rate_limit_queue_depth 0" in REGISTRY.render()